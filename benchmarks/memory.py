@@ -0,0 +1,67 @@
+"""Peak memory of a standard ``buchberger_fast`` run.
+
+Run from the repository root with ``python benchmarks/memory.py``. The peak is
+measured with ``tracemalloc``, so it only counts memory allocated by Python
+objects. That is where the per-instance overhead of the core value types
+(monomials, rationals and polynomials) shows up, so this number is the one to
+watch when changing their layout.
+"""
+import sys
+import time
+import tracemalloc
+
+from groebner.algorithms import buchberger_fast
+from groebner.polynomials import PolynomialRing
+
+
+def standard_system(order='grevlex'):
+    # katsura-3: small enough to run in a few seconds, big enough that the
+    #   intermediate polynomials dominate memory use
+    R = PolynomialRing(labels=['a', 'b', 'c', 'd'], order=order)
+    a, b, c, d = R.get_vars()
+    return [
+        a + 2*b + 2*c + 2*d - 1,
+        a**2 + 2*b**2 + 2*c**2 + 2*d**2 - a,
+        2*a*b + 2*b*c + 2*c*d - b,
+        b**2 + 2*a*c + 2*b*d - c,
+    ]
+
+
+def instance_sizes():
+    # bytes used by a single instance of each core type, including its
+    #   __dict__ (if it has one) but not the objects it points to
+    R = PolynomialRing(labels=['x', 'y'])
+    x, _ = R.get_vars()
+    sizes = {}
+    for name, obj in [('Monomial', x.LM()), ('Rational', x.LC()),
+                      ('Polynomial', x)]:
+        size = sys.getsizeof(obj)
+        if hasattr(obj, '__dict__'):
+            size += sys.getsizeof(obj.__dict__)
+        sizes[name] = size
+    return sizes
+
+
+def measure(order='grevlex'):
+    gens = standard_system(order)
+    tracemalloc.start()
+    start = time.perf_counter()
+    basis = buchberger_fast(gens)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'order': order,
+        'basis_size': len(basis),
+        'peak_kib': peak / 1024,
+        'seconds': elapsed,
+    }
+
+
+if __name__ == '__main__':
+    for name, size in instance_sizes().items():
+        print(f'{name:>10}: {size} bytes per instance')
+    for order in ['lex', 'grlex', 'grevlex']:
+        res = measure(order)
+        print(f"{res['order']:>10}: {res['basis_size']:3d} elements, "
+              f"peak {res['peak_kib']:10.1f} KiB, {res['seconds']:.2f}s")
@@ -0,0 +1,193 @@
+"""Micro-benchmarks of the arithmetic every algorithm is built from.
+
+Run from the repository root, e.g.::
+
+    python benchmarks/micro.py
+    python benchmarks/micro.py --vars 4 8 --terms 10 100 --output micro.json
+    python benchmarks/micro.py --profile katsura-4 --report hot.txt
+
+Each operation (monomial products and comparisons, polynomial sums,
+products and leading monomials, rational sums and products, and
+``_divide_terms``) is timed in isolation with ``timeit`` for every
+combination of variable and term counts asked for, and reported in
+nanoseconds per call (best of --repeat). Operations on single monomials or
+coefficients don't depend on the term count and are only run once per
+variable count.
+
+--profile runs ``buchberger_fast`` on a system from the benchmark suite under
+``cProfile`` instead, and writes the hottest functions to --report (or the
+terminal). ``profile`` does the same for any call from Python.
+"""
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import random
+import timeit
+
+from groebner.algorithms import buchberger_fast, _divide_terms
+from groebner.monomials import Monomial
+from groebner.polynomials import Polynomial, PolynomialRing
+from groebner.rationals import Rational
+
+
+def _ring(num_vars, order='grevlex'):
+    return PolynomialRing(labels=[f'x{i}' for i in range(num_vars)], order=order)
+
+def _poly(R, num_terms, rng):
+    return R.random(num_terms=num_terms, max_deg=8, denominator_bound=100, rng=rng)
+
+def _term(R, rng):
+    return _poly(R, 1, rng)
+
+
+# Each benchmark takes (num_vars, num_terms, rng), with rng a seeded
+#   random.Random for its random inputs, and returns the zero argument
+#   function to time. Setup happens outside of it.
+
+def monomial_mul(num_vars, num_terms, rng):
+    R = _ring(num_vars)
+    a, b = R.ordering.random(8, rng), R.ordering.random(8, rng)
+    return lambda: a * b
+
+def ordering_lt(num_vars, num_terms, rng):
+    R = _ring(num_vars)
+    lt = R.ordering.lt
+    # b permutes the exponents of a, so the graded orderings can't stop at
+    #   the total degree
+    a = R.ordering.random(8, rng)
+    b = Monomial._from_tuple(a.degrees[1:] + a.degrees[:1], R.ordering)
+    return lambda: lt(a, b)
+
+def polynomial_add(num_vars, num_terms, rng):
+    R = _ring(num_vars)
+    f, g = _poly(R, num_terms, rng), _poly(R, num_terms, rng)
+    return lambda: f + g
+
+def polynomial_mul(num_vars, num_terms, rng):
+    R = _ring(num_vars)
+    f, g = _poly(R, num_terms, rng), _poly(R, num_terms, rng)
+    return lambda: f * g
+
+def polynomial_lm(num_vars, num_terms, rng):
+    # LM is cached per polynomial, so time it on a fresh (shallow) copy; the
+    #   copy itself is a single object allocation
+    R = _ring(num_vars)
+    coefs = _poly(R, num_terms, rng).coefs
+    return lambda: Polynomial._new(coefs, R).LM()
+
+def rational_add(num_vars, num_terms, rng):
+    a, b = Rational(355, 113), Rational(-22, 7)
+    return lambda: a + b
+
+def rational_mul(num_vars, num_terms, rng):
+    a, b = Rational(355, 113), Rational(-22, 7)
+    return lambda: a * b
+
+def divide_terms(num_vars, num_terms, rng):
+    R = _ring(num_vars)
+    q = _term(R, rng)
+    p = q * _term(R, rng)
+    return lambda: _divide_terms(p, q)
+
+
+BENCHMARKS = {
+    'Monomial.__mul__': monomial_mul,
+    'MonomialOrdering.lt': ordering_lt,
+    'Polynomial.__add__': polynomial_add,
+    'Polynomial.__mul__': polynomial_mul,
+    'Polynomial.LM': polynomial_lm,
+    'Rational.__add__': rational_add,
+    'Rational.__mul__': rational_mul,
+    '_divide_terms': divide_terms,
+}
+
+# benchmarks whose cost depends on the number of terms
+TERM_DEPENDENT = {'Polynomial.__add__', 'Polynomial.__mul__', 'Polynomial.LM'}
+
+
+def time_call(func, repeat=5):
+    """Best time per call of func in nanoseconds"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(names=None, var_counts=(2, 4, 8), term_counts=(1, 10, 100), repeat=5,
+        seed=0, progress=None):
+    results = []
+    for name in names or list(BENCHMARKS):
+        terms = term_counts if name in TERM_DEPENDENT else [None]
+        for num_vars in var_counts:
+            for num_terms in terms:
+                func = BENCHMARKS[name](num_vars, num_terms, random.Random(seed))
+                record = {'name': name, 'vars': num_vars, 'terms': num_terms,
+                          'ns_per_call': time_call(func, repeat)}
+                results.append(record)
+                if progress is not None:
+                    progress(record)
+    return results
+
+
+def profile(func, *args, report=None, sort='cumulative', limit=30,
+            stats_file=None, **kwargs):
+    """Calls func(*args, **kwargs) under cProfile and writes the limit
+        hottest functions (sorted by sort) to the file report, or prints
+        them. stats_file additionally saves the raw profile for pstats or
+        other viewers. Returns whatever func returned."""
+    profiler = cProfile.Profile()
+    res = profiler.runcall(func, *args, **kwargs)
+    if stats_file is not None:
+        profiler.dump_stats(stats_file)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+    if report is None:
+        print(out.getvalue())
+    else:
+        with open(report, 'w') as f:
+            f.write(out.getvalue())
+    return res
+
+
+def _print_record(record):
+    terms = '' if record['terms'] is None else f"{record['terms']:5d} terms"
+    print(f"{record['name']:<22} {record['vars']:3d} vars {terms:>11} "
+          f"{record['ns_per_call']:14.1f} ns", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bench', action='append', choices=list(BENCHMARKS))
+    parser.add_argument('--vars', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument('--terms', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='JSON file to write the timings to')
+    parser.add_argument('--profile', metavar='FAMILY-N',
+                        help='profile buchberger_fast on a suite system, '
+                             'e.g. katsura-4, instead of timing')
+    parser.add_argument('--order', default='grevlex')
+    parser.add_argument('--sort', default='cumulative',
+                        help='pstats sort key, e.g. cumulative or tottime')
+    parser.add_argument('--limit', type=int, default=30)
+    parser.add_argument('--report', help='file for the profile report')
+    parser.add_argument('--stats-file', help='file for the raw profile data')
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        from suite import system
+        family, n = args.profile.rsplit('-', 1)
+        gens = system(family, int(n), order=args.order)
+        profile(buchberger_fast, gens, report=args.report, sort=args.sort,
+                limit=args.limit, stats_file=args.stats_file)
+        return
+
+    results = run(args.bench, args.vars, args.terms, args.repeat,
+                  progress=_print_record)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+"""Standard benchmark suite for the Groebner basis engines.
+
+Run from the repository root, e.g.::
+
+    python benchmarks/suite.py --suite quick --output results.json
+    python benchmarks/suite.py --compare old.json results.json
+
+Every case is one system from a classic family (cyclic-n, katsura-n, eco-n,
+noon-n or a seeded random dense or sparse system) computed by one engine under
+one monomial ordering over one field. Each case is timed (best of --repeat
+runs) and then run once more under ``tracemalloc`` for its peak memory and,
+for engines that accept a ``BuchbergerStats``, its operation counts. Results
+go to a JSON file together with enough about the machine and the checkout to
+tell runs apart, and --compare prints the time ratios of two such files.
+
+New engines are benchmarked by adding them to ENGINES.
+"""
+import argparse
+import json
+import platform
+import random
+import signal
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from groebner.algorithms import (buchberger, reduced_buchberger,
+                                 buchberger_fast, BuchbergerStats)
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import RationalField
+
+
+# Families. Each takes the size n and a ring with enough variables (see
+#   NUM_VARS) and returns the generators.
+
+def cyclic(n, R):
+    x = R.get_vars()
+    gens = []
+    for k in range(1, n):
+        f = R.zero()
+        for i in range(n):
+            term = R.one()
+            for j in range(k):
+                term = term * x[(i + j) % n]
+            f = f + term
+        gens.append(f)
+    prod = R.one()
+    for v in x:
+        prod = prod * v
+    gens.append(prod - 1)
+    return gens
+
+
+def katsura(n, R):
+    # variables u_0..u_n, with u_{-i} = u_i and u_i = 0 for |i| > n
+    x = R.get_vars()
+    def u(i):
+        return x[abs(i)] if abs(i) <= n else R.zero()
+    gens = []
+    for m in range(n):
+        f = R.zero()
+        for l in range(-n, n + 1):
+            f = f + u(l) * u(m - l)
+        gens.append(f - u(m))
+    f = R.zero()
+    for l in range(-n, n + 1):
+        f = f + u(l)
+    gens.append(f - 1)
+    return gens
+
+
+def eco(n, R):
+    x = R.get_vars()
+    gens = []
+    for k in range(1, n):
+        f = x[k - 1]
+        for i in range(1, n - k):
+            f = f + x[i - 1] * x[i + k - 1]
+        gens.append(f * x[n - 1] - k)
+    f = R.one()
+    for v in x[:n - 1]:
+        f = f + v
+    gens.append(f)
+    return gens
+
+
+def noon(n, R):
+    x = R.get_vars()
+    gens = []
+    for i in range(n):
+        squares = R.zero()
+        for j in range(n):
+            if j != i:
+                squares = squares + x[j]**2
+        gens.append(10 * x[i] * squares - 11 * x[i] + 10)
+    return gens
+
+
+def random_dense(n, R, seed=0):
+    # n polynomials with (n + 1)(n + 2)/2 random terms each, every variable
+    #   of degree at most 2
+    rng = random.Random(seed)
+    return [R.random(num_terms=(n + 1) * (n + 2) // 2, max_deg=2,
+                     denominator_bound=10, rng=rng) for _ in range(n)]
+
+
+def random_sparse(n, R, seed=0):
+    # n polynomials with three terms each, every variable of degree at most 4
+    rng = random.Random(seed)
+    return [R.random(num_terms=3, max_deg=4, denominator_bound=10, rng=rng)
+            for _ in range(n)]
+
+
+FAMILIES = {
+    'cyclic': cyclic,
+    'katsura': katsura,
+    'eco': eco,
+    'noon': noon,
+    'random_dense': random_dense,
+    'random_sparse': random_sparse,
+}
+
+NUM_VARS = {'katsura': lambda n: n + 1}
+
+# Engines are called as engine(gens, stats) where stats is a BuchbergerStats
+#   or None, and ignore stats if they can't fill it in.
+ENGINES = {
+    'buchberger': lambda gens, stats: buchberger(gens),
+    'reduced_buchberger': lambda gens, stats: reduced_buchberger(gens),
+    'buchberger_fast': lambda gens, stats: buchberger_fast(gens, stats=stats),
+}
+
+ORDERS = ['lex', 'grlex', 'grevlex']
+
+FIELDS = {
+    'QQ': RationalField,
+    'GF32003': lambda: PrimeField(32003),
+}
+
+# (family, n) pairs run by each suite
+SUITES = {
+    'quick': [('cyclic', 3), ('katsura', 2), ('eco', 3), ('noon', 2),
+              ('random_dense', 2), ('random_sparse', 2)],
+    'standard': [('cyclic', 4), ('katsura', 3), ('katsura', 4), ('eco', 4),
+                 ('eco', 5), ('noon', 3), ('random_dense', 3),
+                 ('random_sparse', 4)],
+}
+
+
+def system(family, n, order='grevlex', field='QQ'):
+    """Generators of a benchmark system in a fresh ring"""
+    num_vars = NUM_VARS.get(family, lambda n: n)(n)
+    R = PolynomialRing(labels=[f'x{i}' for i in range(num_vars)],
+                       base_field=FIELDS[field](), order=order)
+    return FAMILIES[family](n, R)
+
+
+def run_case(family, n, engine, order, field, repeat=1, timeout=None):
+    """Benchmarks one case and returns its result record"""
+    record = {'family': family, 'n': n, 'engine': engine, 'order': order,
+              'field': field}
+    run = ENGINES[engine]
+    try:
+        with _time_limit(timeout):
+            times = []
+            for _ in range(repeat):
+                gens = system(family, n, order, field)
+                start = time.perf_counter()
+                basis = run(gens, None)
+                times.append(time.perf_counter() - start)
+
+            gens = system(family, n, order, field)
+            stats = BuchbergerStats()
+            tracemalloc.start()
+            try:
+                run(gens, stats)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except TimeoutError:
+        record['status'] = 'timeout'
+        return record
+
+    record.update({
+        'status': 'ok',
+        'seconds': min(times),
+        'all_seconds': times,
+        'peak_bytes': peak,
+        'basis_size': len(basis),
+        # engines that ignore stats leave it untouched
+        'ops': stats.as_dict() if stats.final_size is not None else None,
+    })
+    return record
+
+
+def run_suite(cases, engines=None, orders=None, fields=None, repeat=1,
+              timeout=None, progress=None):
+    results = []
+    for family, n in cases:
+        for field in fields or list(FIELDS):
+            for order in orders or ORDERS:
+                for engine in engines or list(ENGINES):
+                    record = run_case(family, n, engine, order, field,
+                                      repeat=repeat, timeout=timeout)
+                    results.append(record)
+                    if progress is not None:
+                        progress(record)
+    return {'meta': _metadata(), 'results': results}
+
+
+def compare(old, new):
+    """Rows (case, old seconds, new seconds, new/old) for the cases that
+        finished in both result sets"""
+    def index(res):
+        return {_case_id(r): r for r in res['results'] if r['status'] == 'ok'}
+    before, after = index(old), index(new)
+    rows = []
+    for case in sorted(set(before) & set(after)):
+        a, b = before[case]['seconds'], after[case]['seconds']
+        rows.append((case, a, b, b / a if a > 0 else float('inf')))
+    return rows
+
+
+def _case_id(record):
+    return (f"{record['family']}-{record['n']} {record['engine']} "
+            f"{record['order']} {record['field']}")
+
+
+def _metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'],
+                                capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'date': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+@contextmanager
+def _time_limit(seconds):
+    # SIGALRM is only available on POSIX; elsewhere cases run to completion
+    if seconds is None or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+    def expire(signum, frame):
+        raise TimeoutError
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _print_record(record):
+    line = f'{_case_id(record):<55}'
+    if record['status'] == 'ok':
+        line += (f" {record['seconds']:9.4f}s {record['peak_bytes'] / 1024:10.1f} KiB"
+                 f" {record['basis_size']:4d} elements")
+    else:
+        line += f" {record['status']}"
+    print(line, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--suite', choices=sorted(SUITES), default='quick')
+    parser.add_argument('--engine', action='append', choices=sorted(ENGINES))
+    parser.add_argument('--order', action='append', choices=ORDERS)
+    parser.add_argument('--field', action='append', choices=sorted(FIELDS))
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--timeout', type=float, default=60.0,
+                        help='seconds allowed per case (0 for no limit)')
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two result files instead of running')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        for case, a, b, ratio in compare(old, new):
+            print(f'{case:<55} {a:9.4f}s {b:9.4f}s {ratio:6.2f}x')
+        return
+
+    results = run_suite(SUITES[args.suite], engines=args.engine,
+                        orders=args.order, fields=args.field,
+                        repeat=args.repeat, timeout=args.timeout or None,
+                        progress=_print_record)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from groebner.algorithms import (buchberger_fast, BuchbergerState,
+                                 CancellationToken, ComputationCancelled)
+from groebner import serialization
+
+
+# Groebner bases for asyncio programs. The computation runs in a worker
+#   process, so the event loop stays responsive and several bases can be
+#   computed at once. Polynomials travel in the binary format of
+#   groebner.serialization and come back in the caller's own ring.
+
+_default_executor = None
+
+def get_executor():
+    """The process pool used when groebner_basis isn't given one, created on
+        first use with one worker per CPU"""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ProcessPoolExecutor()
+    return _default_executor
+
+def shutdown(wait=True):
+    global _default_executor
+    if _default_executor is not None:
+        _default_executor.shutdown(wait=wait)
+        _default_executor = None
+
+
+async def groebner_basis(gens, timeout=None, executor=None):
+    """Reduced Groebner basis of gens (a list of polynomials or a
+        BuchbergerState to carry on from), computed by buchberger_fast in a
+        worker process.
+
+        With a timeout in seconds (counted from when a worker picks the job
+        up) the worker stops itself once it runs out of time, and
+        ComputationCancelled is raised here with the partial state, which
+        can be passed back in to continue. Cancelling the awaiting task
+        doesn't interrupt a worker that is already running; give a timeout
+        to bound how long it may keep going."""
+    basis = gens.basis if isinstance(gens, BuchbergerState) else gens
+    if len(basis) == 0:
+        raise ValueError('Need at least one generator.')
+    ring = basis[0].ring
+    if isinstance(gens, BuchbergerState):
+        job = (serialization.dumps(gens.basis), gens.pairs)
+    else:
+        job = (serialization.dumps(gens), None)
+
+    loop = asyncio.get_running_loop()
+    status, data, pairs, reason = await loop.run_in_executor(
+        executor or get_executor(), _compute, job, timeout
+    )
+    basis = serialization.loads(data, ring)
+    if status == 'cancelled':
+        raise ComputationCancelled(BuchbergerState(basis, pairs), reason)
+    return basis
+
+
+async def groebner_bases(systems, timeout=None, executor=None):
+    """Bases of many systems computed concurrently, each with its own
+        timeout. A system that fails (or runs out of time) gives its
+        exception, e.g. ComputationCancelled, in place of a basis."""
+    return await asyncio.gather(
+        *[groebner_basis(gens, timeout, executor) for gens in systems],
+        return_exceptions=True
+    )
+
+
+# Runs in the worker. It has to live at module level so it can be pickled.
+
+def _compute(job, timeout):
+    data, pairs = job
+    gens = serialization.loads(data)
+    if pairs is not None:
+        gens = BuchbergerState(gens, pairs)
+    token = None if timeout is None else CancellationToken(timeout)
+    try:
+        basis = buchberger_fast(gens, token=token)
+    except ComputationCancelled as e:
+        return ('cancelled', serialization.dumps(e.state.basis), e.state.pairs,
+                e.reason)
+    return ('done', serialization.dumps(basis), None, None)
@@ -1,6 +1,9 @@
 from groebner.monomials import Monomial
 from groebner.polynomials import Polynomial
+from collections import OrderedDict
+from heapq import heappush, heappop
 from itertools import permutations
+from time import monotonic, perf_counter
 
 def buchberger(gens):
     # gens is a list of polynomials
@@ -49,25 +52,83 @@ def reduced_buchberger(gens):
         if G == G_new:
             return reduce(G)
 
-def buchberger_fast(gens):
-    tuples = [(i, j) for i in range(len(gens)) for j in range(len(gens)) if j > i]
-    G = gens.copy()
+def buchberger_fast(gens, stats=None, token=None, checkpoint=None):
+    """Reduced Groebner basis of gens.
+
+        Pass a BuchbergerStats as stats to have it filled in (and its
+        callbacks called) while the basis is computed. Without one no
+        instrumentation code runs.
+
+        A CancellationToken passed as token is checked before every pair;
+        once it is cancelled (or its deadline passes) ComputationCancelled
+        is raised with the state reached so far, and passing that state
+        back in as gens carries on from there.
+
+        A Checkpointer (see groebner.checkpoint) passed as checkpoint saves
+        that state to disk every so often, so the run survives a crash."""
+    if isinstance(gens, BuchbergerState):
+        G = list(gens.basis)
+        tuples = list(gens.pairs)
+    else:
+        tuples = [(i, j) for i in range(len(gens)) for j in range(len(gens)) if j > i]
+        G = gens.copy()
+    # grows along with G, keeping the shifted tails it has already built
+    reducer = Reducer(G)
+    # for membership tests by (cached) hash instead of scanning G
+    seen = set(G)
+    if stats is not None:
+        stats._start(G, len(tuples))
+        reducer.stats = stats
     while len(tuples) != 0:
+        if token is not None:
+            reason = token.reason()
+            if reason is not None:
+                state = BuchbergerState(G, tuples)
+                if checkpoint is not None:
+                    checkpoint._cancelled(state)
+                raise ComputationCancelled(state, reason)
         i, j = tuples[0]
-        l = lcm(G[i].LM(), G[j].LM())
-        p = G[i].LM()*G[j].LM()
-        p = Polynomial({p: G[i].field.one()}, G[i].ring)
-        if (l != p and not criterion(i, j, tuples, G)):
-            _, r = division_algorithm(s_poly(G[i], G[j]), G)
+        if stats is not None:
+            start = perf_counter()
+        reduced = False
+        lm_i, lm_j = G[i].LM(), G[j].LM()
+        if lcm(lm_i, lm_j) == lm_i*lm_j:
+            # coprime leading monomials: the S-polynomial reduces to zero
+            if stats is not None:
+                stats._discard(i, j, 'product', start)
+        elif criterion(i, j, tuples, G):
+            if stats is not None:
+                stats._discard(i, j, 'chain', start)
+        else:
+            if stats is not None:
+                start = stats._lap('pairs', start)
+            r = reducer.normal_form(s_poly(G[i], G[j]))
+            reduced = True
             if r != r.ring.zero():
                 # make leading coefficient one
                 r = r * r.LC()**(-1)
-                if r not in G:
+                if r not in seen:
                     G.append(r)
+                    seen.add(r)
+                    reducer.append(r)
                     new_idx = [(i, len(G) - 1) for i in range(len(G) - 1)]
                     tuples = tuples + new_idx
+                    if stats is not None:
+                        stats._new_element(i, j, r, len(G), len(new_idx))
+            if stats is not None:
+                stats._reduced(i, j, r, start)
         tuples.remove((i,j))
-    return reduce(G)
+        if checkpoint is not None:
+            checkpoint._after_pair(G, tuples, reduced)
+    if stats is None:
+        G = reduce(G)
+    else:
+        start = perf_counter()
+        G = reduce(G)
+        stats._finish(G, start)
+    if checkpoint is not None:
+        checkpoint._finished()
+    return G
 
 def criterion(i, j, B, G):
     for k in range(len(G)):
@@ -89,16 +150,309 @@ def criterion(i, j, B, G):
     return False
 
 
+class BuchbergerState():
+    """A buchberger_fast run in progress. basis generates the ideal (but is
+        neither a Groebner basis nor reduced yet) and pairs lists the pairs
+        (i, j) of basis indices whose S-polynomials are still to be handled."""
+    def __init__(self, basis, pairs):
+        self.basis = list(basis)
+        self.pairs = list(pairs)
+
+    def __repr__(self):
+        return (f'BuchbergerState({len(self.basis)} polynomials, '
+                f'{len(self.pairs)} pairs left)')
+
+class CancellationToken():
+    """Lets a long computation be stopped from outside: call cancel (from
+        another thread, a callback, ...) or give a timeout in seconds.
+        Algorithms that take a token check it regularly and raise
+        ComputationCancelled once it fires."""
+    def __init__(self, timeout=None):
+        if timeout is not None and timeout < 0:
+            raise ValueError('Timeout must be nonnegative.')
+        # monotonic clocks are shared by all processes on a machine, so
+        #   tokens keep their deadline when pickled
+        self.deadline = None if timeout is None else monotonic() + timeout
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def reason(self):
+        """'cancelled', 'deadline' or None while the computation may go on"""
+        if self._cancelled:
+            return 'cancelled'
+        if self.deadline is not None and monotonic() >= self.deadline:
+            return 'deadline'
+        return None
+
+    @property
+    def cancelled(self):
+        return self.reason() is not None
+
+class ComputationCancelled(Exception):
+    """Raised when a computation is stopped through its CancellationToken.
+        state holds the partial result and reason says why it stopped."""
+    def __init__(self, state, reason='cancelled'):
+        super().__init__(state, reason)
+        self.state = state
+        self.reason = reason
+
+    def __str__(self):
+        return f'Computation stopped ({self.reason}) at {self.state}.'
+
+
+class BuchbergerStats():
+    """Counters and timings filled in by buchberger_fast.
+
+        pairs_created counts the critical pairs ever queued. Each one is
+        either discarded by Buchberger's product criterion (pairs_product)
+        or his chain criterion (pairs_chain), or its S-polynomial is reduced,
+        which ends in zero_reductions or nonzero_reductions. times holds the
+        seconds spent checking criteria ('pairs'), reducing S-polynomials
+        ('reduction') and interreducing the final basis ('reduce').
+        basis_sizes lists (pairs handled, basis size) every time the basis
+        grows, max_terms is the most terms an intermediate polynomial had
+        during a reduction and max_coef_bits the largest coefficient (in
+        numerator plus denominator bits) of any basis element.
+
+        Callbacks, if given, are called as on_pair(stats, i, j, outcome),
+        outcome being 'product', 'chain', 'zero' or 'nonzero', and as
+        on_new_element(stats, poly). Counts add up over several runs until
+        reset is called."""
+    def __init__(self, on_pair=None, on_new_element=None):
+        self.on_pair = on_pair
+        self.on_new_element = on_new_element
+        self.reset()
+
+    def reset(self):
+        self.pairs_created = 0
+        self.pairs_product = 0
+        self.pairs_chain = 0
+        self.zero_reductions = 0
+        self.nonzero_reductions = 0
+        self.times = {'pairs': 0.0, 'reduction': 0.0, 'reduce': 0.0}
+        self.basis_sizes = []
+        self.max_terms = 0
+        self.max_coef_bits = 0
+        self.final_size = None
+
+    @property
+    def pairs_handled(self):
+        return (self.pairs_product + self.pairs_chain +
+                self.zero_reductions + self.nonzero_reductions)
+
+    def as_dict(self):
+        return {
+            'pairs_created': self.pairs_created,
+            'pairs_product': self.pairs_product,
+            'pairs_chain': self.pairs_chain,
+            'zero_reductions': self.zero_reductions,
+            'nonzero_reductions': self.nonzero_reductions,
+            'times': dict(self.times),
+            'basis_sizes': list(self.basis_sizes),
+            'max_terms': self.max_terms,
+            'max_coef_bits': self.max_coef_bits,
+            'final_size': self.final_size,
+        }
+
+    # Hooks called by buchberger_fast and Reducer. Timings are taken in
+    #   laps: each hook gets the time its phase started and returns the time
+    #   it ended.
+
+    def _start(self, G, num_pairs):
+        self.pairs_created += num_pairs
+        self.basis_sizes.append((self.pairs_handled, len(G)))
+        for f in G:
+            self._observe_coefs(f)
+
+    def _lap(self, phase, start):
+        now = perf_counter()
+        self.times[phase] += now - start
+        return now
+
+    def _discard(self, i, j, criterion, start):
+        if criterion == 'product':
+            self.pairs_product += 1
+        else:
+            self.pairs_chain += 1
+        self._lap('pairs', start)
+        if self.on_pair is not None:
+            self.on_pair(self, i, j, criterion)
+
+    def _reduced(self, i, j, r, start):
+        outcome = 'zero' if r == r.ring.zero() else 'nonzero'
+        if outcome == 'zero':
+            self.zero_reductions += 1
+        else:
+            self.nonzero_reductions += 1
+        self._lap('reduction', start)
+        if self.on_pair is not None:
+            self.on_pair(self, i, j, outcome)
+
+    def _new_element(self, i, j, r, size, num_pairs):
+        self.pairs_created += num_pairs
+        # the pair (i, j) counts as handled once it's reduced
+        self.basis_sizes.append((self.pairs_handled + 1, size))
+        self._observe_coefs(r)
+        if self.on_new_element is not None:
+            self.on_new_element(self, r)
+
+    def _observe_terms(self, num_terms):
+        if num_terms > self.max_terms:
+            self.max_terms = num_terms
+
+    def _observe_coefs(self, f):
+        bits = max([_coef_bits(c) for c in f.coefs.values()], default=0)
+        if bits > self.max_coef_bits:
+            self.max_coef_bits = bits
+
+    def _finish(self, G, start):
+        self._lap('reduce', start)
+        self.final_size = len(G)
+        for f in G:
+            self._observe_coefs(f)
+
+    def __repr__(self):
+        return (f'BuchbergerStats(pairs_created={self.pairs_created}, '
+                f'pairs_product={self.pairs_product}, '
+                f'pairs_chain={self.pairs_chain}, '
+                f'zero_reductions={self.zero_reductions}, '
+                f'nonzero_reductions={self.nonzero_reductions})')
+
+def _coef_bits(c):
+    # size of a rational or prime field coefficient
+    try:
+        return c.num.bit_length() + c.den.bit_length()
+    except AttributeError:
+        return c.value.bit_length()
+
+
+class TruncatedBasis():
+    """Groebner basis of a homogeneous ideal computed only up to some degree.
+
+        Critical pairs are handled in order of the degree of their lcm, and
+        generators are brought in once that degree reaches theirs. After
+        extend(d) every element of the ideal of degree at most d has a
+        leading monomial divisible by one of the basis, which is enough to
+        decide membership of polynomials of degree up to d. Pairs and
+        generators of higher degree are kept, so a later extend to a higher
+        degree carries on without redoing any work. Once nothing is left
+        (complete is True) the basis is a full Groebner basis."""
+    def __init__(self, gens):
+        if type(gens) is not list:
+            gens = [gens]
+        gens = [f for f in gens if f != f.ring.zero()]
+        if len(gens) == 0:
+            raise ValueError('Need at least one nonzero generator.')
+        ring = gens[0].ring
+        if any(f not in ring for f in gens):
+            raise TypeError('Generators must all come from the same ring.')
+        if not all(f.is_homogeneous() for f in gens):
+            raise ValueError('Truncated bases need homogeneous generators.')
+
+        self.ring = ring
+        self.basis = []
+        # everything up to this degree has been handled
+        self.degree = -1
+        self.reductions = 0
+        self._reducer = None
+        # (degree, tiebreak, polynomial) for generators and
+        #   (degree of lcm, i, j) for pairs, smallest degree first
+        self._gens = []
+        for k, f in enumerate(gens):
+            heappush(self._gens, (_degree(f), k, f))
+        self._pairs = []
+
+    @property
+    def complete(self):
+        return not self._gens and not self._pairs
+
+    def extend(self, degree):
+        """Handles every pair and generator of degree at most degree"""
+        while True:
+            next_degree = min([q[0][0] for q in (self._gens, self._pairs) if q],
+                              default=None)
+            if next_degree is None or next_degree > degree:
+                break
+            # pairs first: new elements they bring can make generators of
+            #   the same degree reduce to zero
+            while self._pairs and self._pairs[0][0] == next_degree:
+                _, i, j = heappop(self._pairs)
+                self._add(s_poly(self.basis[i], self.basis[j]))
+            while self._gens and self._gens[0][0] == next_degree and \
+                    not (self._pairs and self._pairs[0][0] == next_degree):
+                self._add(heappop(self._gens)[2])
+        self.degree = max(self.degree, degree)
+        return self
+
+    def groebner_basis(self):
+        """The reduced basis found so far"""
+        return reduce(self.basis)
+
+    def contains(self, poly):
+        """Ideal membership for polynomials all of whose terms have degree
+            at most the degree reached"""
+        poly = self.ring.coerce(poly)
+        if any(m.total_degree > self.degree for m in poly.coefs) and not self.complete:
+            raise ValueError(f'Basis is only known up to degree {self.degree}.')
+        if not self.basis:
+            return poly == self.ring.zero()
+        return self._reducer.normal_form(poly) == self.ring.zero()
+
+    def _add(self, p):
+        if self._reducer is not None:
+            p = self._reducer.normal_form(p)
+            self.reductions += 1
+        if p == self.ring.zero():
+            return
+        p = p * p.LC().mul_inv()
+        new = len(self.basis)
+        lm = p.LM()
+        for i, g in enumerate(self.basis):
+            l = lcm(g.LM(), lm)
+            # coprime leading monomials: the S-polynomial reduces to zero
+            if l != g.LM() * lm:
+                heappush(self._pairs, (l.total_degree, i, new))
+        self.basis.append(p)
+        if self._reducer is None:
+            self._reducer = Reducer(self.basis)
+        else:
+            self._reducer.append(p)
+
+    def __repr__(self):
+        return (f'TruncatedBasis({len(self.basis)} elements up to degree '
+                f'{self.degree}, {len(self._pairs)} pairs left)')
+
+def truncated_groebner(gens, degree):
+    """Groebner basis of the ideal generated by homogeneous gens up to degree
+        (see TruncatedBasis)"""
+    return TruncatedBasis(gens).extend(degree)
+
+def _degree(f):
+    # total degree of a homogeneous polynomial
+    return next(iter(f.coefs)).total_degree
+
+
 def reduce(polys):
     # Stolen graciously from Sage
     G = set(polys)
+    # Remainders by (element, other elements). The last pass repeats every
+    #   division whose divisors haven't changed since, so it mostly hits.
+    memo = LRUMemo()
     while True:
         G_bar = set(G)
         for p in sorted(G_bar):
             G.remove(p)
-            _, r = division_algorithm(p, sorted(G))
+            divs = sorted(G)
+            key = (_poly_key(p.coefs), frozenset([_poly_key(g.coefs) for g in divs]))
+            r = memo.get(key)
+            if r is None:
+                r = Reducer(divs, memo_size=0).normal_form(p) if divs else p
+                if r != r.ring.zero():
+                    r = r*r.LC()**(-1)
+                memo.put(key, r)
             if r != r.ring.zero():
-                r = r*r.LC()**(-1)
                 G.add(r)
         if G_bar == G:
             break
@@ -108,8 +462,8 @@ def lcm(m, n):
     try:
         o = m.order
         assert n in o
-        degrees = [max(m.degrees[i], n.degrees[i]) for i in range(len(m.degrees))]
-        return Monomial(degrees, o)
+        degrees = tuple([max(a, b) for a, b in zip(m.degrees, n.degrees)])
+        return Monomial._from_tuple(degrees, o)
     except AssertionError:
         raise ValueError("Parameters must be monomials must be associated with the same order.")
 
@@ -173,6 +527,187 @@ def division_algorithm(dividend, divisors):
             p = p - p.LT()
     return qs, r
 
+class LRUMemo():
+    """Bounded memo that forgets its least recently used entries once it holds
+        more than max_size of them, and keeps track of its hit rate"""
+    def __init__(self, max_size=4096):
+        if type(max_size) is not int or max_size < 1:
+            raise ValueError('Memo size must be a positive integer.')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._table = OrderedDict()
+
+    def get(self, key, default=None):
+        value = self._table.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._table.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._table[key] = value
+        self._table.move_to_end(key)
+        if len(self._table) > self.max_size:
+            self._table.popitem(last=False)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def stats(self):
+        return {
+            'size': len(self._table),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def clear(self):
+        # forget the entries, not the statistics
+        self._table.clear()
+
+    def __len__(self):
+        return len(self._table)
+
+_MISSING = object()
+
+
+class Reducer():
+    """Divisors preprocessed for computing many normal forms against the same
+        list. Leading exponents, inverted leading coefficients and the
+        remaining terms of each divisor are computed once, and reductions work
+        directly on the term dicts rather than building a Polynomial for every
+        step.
+
+        Two LRU memos of at most memo_size entries each (memo_size=0 turns
+        them off) remember normal forms of polynomials seen before and the
+        monomials of each shifted divisor tail used during reduction.
+        Appending a divisor invalidates the normal forms but not the shifts.
+        An empty list of divisors needs the ring passed in."""
+    def __init__(self, divisors, memo_size=4096, ring=None):
+        if type(divisors) is not list:
+            divisors = [divisors]
+        if len(divisors) == 0 and ring is None:
+            raise ValueError('Need at least one divisor.')
+        if len(divisors) > 0:
+            ring = divisors[0].ring
+        if sum([x not in ring for x in divisors]) != 0:
+            raise TypeError('Divisors must all come from the same ring.')
+        if any(d == ring.zero() for d in divisors):
+            raise ZeroDivisionError
+
+        self.ring = ring
+        self.divisors = []
+        self._index = []
+        self.memo = LRUMemo(memo_size) if memo_size else None
+        self._multiples = LRUMemo(memo_size) if memo_size else None
+        # a BuchbergerStats recording the size of intermediate polynomials
+        self.stats = None
+        for d in divisors:
+            self._add(d)
+
+    def append(self, divisor):
+        """Adds a divisor at the end of the list"""
+        if divisor not in self.ring:
+            raise TypeError('Divisors must all come from the same ring.')
+        if divisor == self.ring.zero():
+            raise ZeroDivisionError
+        self._add(divisor)
+        if self.memo is not None:
+            # remainders may now reduce further
+            self.memo.clear()
+
+    def _add(self, d):
+        lm = d.LM()
+        inv = d.LC().mul_inv()
+        tail = [(mon.degrees, c * inv) for mon, c in d.coefs.items()
+                if mon != lm]
+        self.divisors.append(d)
+        self._index.append((lm.degrees, lm.total_degree, tail))
+
+    def normal_form(self, poly):
+        """Remainder of poly on division by the divisors. This is the same
+            remainder division_algorithm returns, without the quotients."""
+        if poly not in self.ring:
+            raise TypeError('Polynomial must come from the same ring as the divisors.')
+        ring = self.ring
+        order = ring.ordering
+        zero = ring.field.zero()
+        p = {m: c for m, c in poly.coefs.items() if c != zero}
+
+        memo = self.memo
+        if memo is not None:
+            key = _poly_key(p)
+            res = memo.get(key)
+            if res is not None:
+                return res
+
+        # Composite orderings compare through keys anyway, so compute one key
+        #   per monomial instead of two per comparison.
+        sort_key = None if order.order_type in order.SIMPLE_ORDERS else order.sort_key
+        multiples = self._multiples
+        stats = self.stats
+        peak = len(p)
+        r = {}
+        while p:
+            lm = max(p) if sort_key is None else max(p, key=sort_key)
+            c = p.pop(lm)
+            degs = lm.degrees
+            for k, (lead, total, tail) in enumerate(self._index):
+                if total > lm.total_degree:
+                    continue
+                if all([a >= b for a, b in zip(degs, lead)]):
+                    shift = tuple([a - b for a, b in zip(degs, lead)])
+                    mons = None if multiples is None else multiples.get((k, shift))
+                    if mons is None:
+                        mons = [Monomial._from_tuple(
+                                    tuple([a + b for a, b in zip(shift, tdegs)]), order
+                                ) for tdegs, _ in tail]
+                        if multiples is not None:
+                            multiples.put((k, shift), mons)
+                    for mon, (_, tc) in zip(mons, tail):
+                        new = p.get(mon, zero) - c * tc
+                        if new == zero:
+                            p.pop(mon, None)
+                        else:
+                            p[mon] = new
+                    if stats is not None and len(p) + len(r) > peak:
+                        peak = len(p) + len(r)
+                    break
+            else:
+                r[lm] = c
+
+        if stats is not None:
+            stats._observe_terms(peak)
+        res = Polynomial(r, ring)
+        if memo is not None:
+            memo.put(key, res)
+        return res
+
+    def normal_forms(self, polys):
+        return [self.normal_form(f) for f in polys]
+
+    def memo_stats(self):
+        # None when memoisation is off
+        if self.memo is None:
+            return None
+        return {'normal_forms': self.memo.stats(),
+                'multiples': self._multiples.stats()}
+
+
+def _poly_key(terms):
+    # hashable stand-in for a polynomial given by its (nonzero) terms
+    return frozenset([(m.degrees, c) for m, c in terms.items()])
+
+
+def normal_form(dividend, divisors):
+    """Remainder of dividend on division by divisors (see Reducer)"""
+    return Reducer(divisors).normal_form(dividend)
+
 def _divide_terms(p, q):
     try:
         assert p.LT() == p and q.LT() == q
@@ -182,19 +717,13 @@ def _divide_terms(p, q):
     if q == q.ring.zero():
         raise ZeroDivisionError
 
-    m, n = p.LM().degrees, q.LM().degrees
+    m, n = p.LM(), q.LM()
     a, b = p.LC(), q.LC()
 
-    # pad out lists to be the same size
-    while len(m) < len(n):
-        m.append(p.ring.zero())
-    while len(n) < len(m):
-        n.append(p.ring.zero())
-    
-    degs = [m[i] - n[i] for i in range(len(m))]
+    degs = tuple([x - y for x, y in zip(m.degrees, n.degrees)])
 
     if all([x >= 0 for x in degs]):
-        mon = Monomial(degs, p.LM().order)
+        mon = Monomial._from_tuple(degs, m.order, m.total_degree - n.total_degree)
         return Polynomial({mon: a/b}, p.ring)
     else:
         return None
\ No newline at end of file
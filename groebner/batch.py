@@ -0,0 +1,110 @@
+import heapq
+import json
+import os
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from time import perf_counter
+
+from groebner.algorithms import (buchberger_fast, CancellationToken,
+                                 ComputationCancelled)
+from groebner import serialization
+
+
+# Outcome of one system of a batch. index is its position in the input,
+#   status one of 'done', 'timeout' or 'error', basis the reduced Groebner
+#   basis (None unless done), seconds the time spent on it in the worker and
+#   error the worker's traceback for failed jobs.
+BatchResult = namedtuple('BatchResult', ['index', 'status', 'basis', 'seconds', 'error'])
+
+
+def run_batch(systems, processes=None, timeout=None, output=None, window=256,
+              executor=None):
+    """Computes the Groebner bases of many independent systems (lists of
+        generators) over a pool of processes, yielding a BatchResult for each
+        one as soon as it is done, so in no particular order.
+
+        systems can be any iterable, including an endless generator: only up
+        to window systems are read ahead, and among those the biggest (by
+        number of terms times degree) are started first so that no large job
+        is left running alone at the end. At most twice as many jobs as
+        workers are in flight at once.
+
+        timeout limits each job to that many seconds in its worker. With an
+        output path every result is also written to that file as a line of
+        JSON as soon as it comes in, with the basis written as text that
+        PolynomialRing.parse reads back."""
+    if window < 1:
+        raise ValueError('Window must be a positive number of systems.')
+    own_pool = executor is None
+    if own_pool:
+        executor = ProcessPoolExecutor(max_workers=processes)
+    workers = processes or os.cpu_count() or 1
+    out = None if output is None else open(output, 'w')
+
+    systems = enumerate(systems)
+    waiting = []
+    running = {}
+    try:
+        while True:
+            # top up the look ahead buffer, then start its biggest jobs
+            for index, gens in islice(systems, window - len(waiting)):
+                heapq.heappush(waiting, (-_size(gens), index, gens))
+            while waiting and len(running) < 2 * workers:
+                _, index, gens = heapq.heappop(waiting)
+                future = executor.submit(_run_job, serialization.dumps(gens), timeout)
+                running[future] = (index, gens[0].ring)
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, ring = running.pop(future)
+                status, data, seconds, error = future.result()
+                basis = None if data is None else serialization.loads(data, ring)
+                res = BatchResult(index, status, basis, seconds, error)
+                if out is not None:
+                    _write_result(out, res)
+                yield res
+    finally:
+        if out is not None:
+            out.close()
+        if own_pool:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+def _size(gens):
+    # rough cost estimate used to start big jobs first
+    if len(gens) == 0:
+        raise ValueError('Every system needs at least one generator.')
+    terms = sum([len(f.coefs) for f in gens])
+    degree = max([max([m.total_degree for m in f.coefs], default=0) for f in gens])
+    return terms * max(degree, 1)
+
+
+def _write_result(out, res):
+    out.write(json.dumps({
+        'index': res.index,
+        'status': res.status,
+        'seconds': res.seconds,
+        'basis': None if res.basis is None else [str(f) for f in res.basis],
+        'error': res.error,
+    }) + '\n')
+    out.flush()
+
+
+# Runs in the workers. It has to live at module level so it can be pickled.
+
+def _run_job(data, timeout):
+    start = perf_counter()
+    token = None if timeout is None else CancellationToken(timeout)
+    try:
+        basis = buchberger_fast(serialization.loads(data), token=token)
+    except ComputationCancelled:
+        return ('timeout', None, perf_counter() - start, None)
+    except Exception:
+        return ('error', None, perf_counter() - start, traceback.format_exc())
+    return ('done', serialization.dumps(basis), perf_counter() - start, None)
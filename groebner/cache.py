@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # no advisory locks (e.g. on Windows); writes are still atomic renames
+    fcntl = None
+
+from groebner import serialization
+
+
+# Cache used by GroebnerIdeal when none is passed explicitly
+_default_cache = None
+
+def set_default_cache(cache):
+    """Make every GroebnerIdeal consult cache (a GroebnerCache, a directory
+        name or None to turn caching off)"""
+    global _default_cache
+    if cache is not None and not isinstance(cache, GroebnerCache):
+        cache = GroebnerCache(cache)
+    _default_cache = cache
+    return cache
+
+def get_default_cache():
+    return _default_cache
+
+
+class GroebnerCache():
+    """Content addressed on-disk cache of reduced Groebner bases.
+
+        Generators are canonicalised (zero generators dropped, each one made
+        monic, duplicates removed and the rest sorted) and hashed together
+        with the ring's variables, ordering and field, so any two generating
+        sets that differ only in those ways share an entry. Entries are files
+        in the binary format of groebner.serialization named by their key.
+        Once the directory grows past max_bytes the least recently used
+        entries (by modification time, which is bumped on every hit) are
+        deleted. Writers hold an exclusive lock on a lockfile in the
+        directory, so several processes can share one cache."""
+    SUFFIX = '.gb'
+    FORMAT_VERSION = 2
+
+    def __init__(self, directory, max_bytes=2**26):
+        if type(max_bytes) is not int or max_bytes < 1:
+            raise ValueError('Cache size must be a positive number of bytes.')
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock_path = os.path.join(self.directory, '.lock')
+
+    def key(self, gens):
+        """Hex digest identifying the ideal generated by gens (in its ring)"""
+        ring = gens[0].ring
+        header = {
+            'version': self.FORMAT_VERSION,
+            'vars': ring.ordering.var_labels,
+            'order': ring.ordering.order_type,
+            'field': repr(ring.field),
+        }
+        canonical = json.dumps([header, _canonical_gens(gens)],
+                               separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key, ring):
+        """The cached basis for key as polynomials of ring, or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            basis = _decode(data, ring)
+        except ValueError:
+            # corrupt or from an incompatible version: forget it
+            self.misses += 1
+            self._remove(path)
+            return None
+        try:
+            # mark as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return basis
+
+    def put(self, key, basis):
+        data = _encode(basis)
+        with self._locked():
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                self._remove(tmp)
+                raise
+            self._evict(keep=key + self.SUFFIX)
+
+    def groebner_basis(self, gens, compute):
+        """Cached basis of gens, calling compute(gens) on a miss"""
+        ring = gens[0].ring
+        key = self.key(gens)
+        basis = self.get(key, ring)
+        if basis is None:
+            basis = compute(gens)
+            self.put(key, basis)
+        return basis
+
+    def clear(self):
+        with self._locked():
+            for name, _, _ in self._entries():
+                self._remove(os.path.join(self.directory, name))
+        self.hits = 0
+        self.misses = 0
+
+    def size(self):
+        # total bytes used by entries
+        return sum(size for _, size, _ in self._entries())
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries()),
+            'bytes': self.size(),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0,
+        }
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((name, st.st_size, st.st_mtime_ns))
+        return entries
+
+    def _evict(self, keep=None):
+        # oldest first until we fit, but never the entry just written (mtimes
+        #   can tie on coarse filesystem clocks)
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for name, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    @contextmanager
+    def _locked(self):
+        with open(self._lock_path, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self):
+        return f'GroebnerCache({self.directory!r}, max_bytes={self.max_bytes})'
+
+
+# Canonical form for keys. Coefficients are written as (numerator,
+#   denominator) pairs, which covers the rationals and (with denominator 1)
+#   prime fields.
+
+def _coef_pair(c):
+    try:
+        return [c.num, c.den]
+    except AttributeError:
+        return [int(c), 1]
+
+def _terms(poly):
+    zero = poly.field.zero()
+    return sorted([list(m.degrees), _coef_pair(c)]
+                  for m, c in poly.coefs.items() if c != zero)
+
+def _canonical_gens(gens):
+    canonical = set()
+    for f in gens:
+        if f == f.ring.zero():
+            continue
+        terms = _terms(f * f.LC().mul_inv())
+        canonical.add(json.dumps(terms, separators=(',', ':')))
+    return sorted(canonical)
+
+def _encode(basis):
+    return serialization.dumps(basis)
+
+def _decode(data, ring):
+    basis = serialization.loads(data, ring)
+    if type(basis) is not list or len(basis) == 0:
+        raise ValueError('Cache entry is not a basis.')
+    return basis
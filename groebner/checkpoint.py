@@ -0,0 +1,146 @@
+import os
+import tempfile
+from time import monotonic
+
+from groebner.algorithms import buchberger_fast, BuchbergerState
+from groebner import serialization
+from groebner.serialization import _read_varint, _write_varint
+
+
+# Layout of a checkpoint file:
+#
+#   magic       b'GBCK' followed by a version byte
+#   basis       varint length, then the basis so far in the format of
+#               groebner.serialization (which carries the ring)
+#   pairs       varint number of pending pairs, then two varints per pair
+MAGIC = b'GBCK'
+VERSION = 1
+
+
+class Checkpointer():
+    """Periodically saves the state of a buchberger_fast run to path, so a
+        crashed or preempted run can be resumed (see resume).
+
+        A checkpoint is written once every_seconds have passed or
+        every_reductions S-polynomials have been reduced since the last one,
+        whichever comes first (every 60 seconds if neither is given), and
+        also when the run is cancelled. Writes go to a temporary file that is
+        renamed over the old checkpoint, so there is always a complete one on
+        disk. Once the run finishes the checkpoint is deleted unless keep is
+        set."""
+    def __init__(self, path, every_seconds=None, every_reductions=None, keep=False):
+        if every_seconds is None and every_reductions is None:
+            every_seconds = 60
+        if every_seconds is not None and every_seconds <= 0:
+            raise ValueError('Checkpoint interval must be positive.')
+        if every_reductions is not None and \
+                (type(every_reductions) is not int or every_reductions < 1):
+            raise ValueError('Checkpoint interval must be a positive integer.')
+        self.path = os.path.abspath(path)
+        self.every_seconds = every_seconds
+        self.every_reductions = every_reductions
+        self.keep = keep
+        self.saves = 0
+        self._last = monotonic()
+        self._reductions = 0
+
+    def save(self, state):
+        data = dumps_state(state)
+        directory = os.path.dirname(self.path)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        self.saves += 1
+        self._last = monotonic()
+        self._reductions = 0
+
+    def load(self, ring=None):
+        with open(self.path, 'rb') as f:
+            return loads_state(f.read(), ring)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    # Hooks called by buchberger_fast
+
+    def _after_pair(self, G, pairs, reduced):
+        if reduced:
+            self._reductions += 1
+        if (self.every_reductions is not None and
+                self._reductions >= self.every_reductions) or \
+                (self.every_seconds is not None and
+                 monotonic() - self._last >= self.every_seconds):
+            self.save(BuchbergerState(G, pairs))
+
+    def _cancelled(self, state):
+        self.save(state)
+
+    def _finished(self):
+        if not self.keep:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def __repr__(self):
+        return (f'Checkpointer({self.path!r}, every_seconds={self.every_seconds}, '
+                f'every_reductions={self.every_reductions})')
+
+
+def resume(path, ring=None, stats=None, token=None, checkpoint=True):
+    """Carries on the run saved in the checkpoint at path and returns its
+        reduced Groebner basis. By default the resumed run keeps
+        checkpointing to the same file with the default interval; pass a
+        Checkpointer to choose another, or None to stop checkpointing."""
+    if checkpoint is True:
+        checkpoint = Checkpointer(path)
+    with open(path, 'rb') as f:
+        state = loads_state(f.read(), ring)
+    return buchberger_fast(state, stats=stats, token=token, checkpoint=checkpoint)
+
+
+def dumps_state(state):
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    basis = serialization.dumps(state.basis)
+    _write_varint(out, len(basis))
+    out += basis
+    _write_varint(out, len(state.pairs))
+    for i, j in state.pairs:
+        _write_varint(out, i)
+        _write_varint(out, j)
+    return bytes(out)
+
+
+def loads_state(data, ring=None):
+    view = memoryview(data)
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError('Not a checkpoint.')
+    if len(view) < 5:
+        raise ValueError('Truncated data.')
+    if view[4] != VERSION:
+        raise ValueError(f'Unsupported checkpoint version {view[4]}.')
+    length, pos = _read_varint(view, 5)
+    if pos + length > len(view):
+        raise ValueError('Truncated data.')
+    basis = serialization.loads(view[pos:pos + length], ring)
+    pos += length
+    num, pos = _read_varint(view, pos)
+    pairs = []
+    for _ in range(num):
+        i, pos = _read_varint(view, pos)
+        j, pos = _read_varint(view, pos)
+        if not i < j < len(basis):
+            raise ValueError('Checkpoint refers to a missing basis element.')
+        pairs.append((i, j))
+    return BuchbergerState(basis, pairs)
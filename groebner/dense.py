@@ -0,0 +1,284 @@
+from math import gcd
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from groebner.monomials import Monomial
+from groebner.rationals import Rational, RationalField
+
+
+# Below this length we multiply with plain (schoolbook) convolution
+KARATSUBA_CUTOFF = 32
+# Above this length we try a floating point FFT when it is provably exact
+FFT_CUTOFF = 64
+# FFT products are only attempted when every coefficient of the result is
+#   bounded by this, which leaves plenty of room in a double's mantissa
+FFT_EXACT_BOUND = 2**40
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('The dense polynomial backend requires numpy. '
+                          'Install it with `pip install numpy`.')
+
+
+def max_degrees(poly):
+    # largest exponent of each variable appearing in a (sparse) polynomial
+    degs = [0]*poly.ring.num_vars
+    for mon in poly.coefs:
+        degs = [max(a, b) for a, b in zip(degs, mon.degrees)]
+    return degs
+
+
+def density(poly):
+    """Fraction of the monomials in the exponent box of poly that actually
+        appear in poly"""
+    size = 1
+    for d in max_degrees(poly):
+        size *= d + 1
+    return len(poly.coefs) / size
+
+
+class DensePolynomial():
+    """Polynomial over QQ stored as a dense NumPy array of integer numerators
+        indexed by exponents (coefs[i, j, k] is the coefficient of
+        x^i y^j z^k) over a single positive common denominator.
+
+        Instances are kept normalized: the numerators and denominator have no
+        common factor and there are no trailing zero slices, so two dense
+        polynomials are equal exactly when their arrays are."""
+    __slots__ = ('ring', 'coefs', 'den')
+
+    def __init__(self, coefs, parent_ring, den=1):
+        _require_numpy()
+        if not isinstance(parent_ring.field, RationalField):
+            raise NotImplementedError('Dense backend is only implemented over'
+                                      ' the rationals.')
+        coefs = np.array(coefs, dtype=object)
+        if coefs.ndim != parent_ring.num_vars:
+            raise ValueError(f'Expected a {parent_ring.num_vars}-dimensional'
+                             f' array of coefficients, got {coefs.ndim}.')
+        if type(den) is not int or den == 0:
+            raise ValueError('Denominator must be a nonzero integer.')
+
+        self.ring = parent_ring
+        self.coefs, self.den = _normalize(coefs, den)
+
+    @classmethod
+    def _new(cls, coefs, parent_ring, den):
+        # for arrays of python ints we built ourselves
+        poly = object.__new__(cls)
+        poly.ring = parent_ring
+        poly.coefs, poly.den = _normalize(coefs, den)
+        return poly
+
+    @classmethod
+    def from_polynomial(cls, poly):
+        _require_numpy()
+        if not isinstance(poly.ring.field, RationalField):
+            raise NotImplementedError('Dense backend is only implemented over'
+                                      ' the rationals.')
+        den = 1
+        for c in poly.coefs.values():
+            den = den * c.den // gcd(den, c.den)
+
+        coefs = np.zeros([d + 1 for d in max_degrees(poly)], dtype=object)
+        for mon, c in poly.coefs.items():
+            coefs[mon.degrees] = c.num * (den // c.den)
+        return cls._new(coefs, poly.ring, den)
+
+    def to_polynomial(self):
+        from groebner.polynomials import Polynomial
+        order = self.ring.ordering
+        coefs = {}
+        for idx in zip(*np.nonzero(self.coefs != 0)):
+            degs = tuple(int(i) for i in idx)
+            coefs[Monomial._from_tuple(degs, order)] = Rational(
+                int(self.coefs[degs]), self.den
+            )
+        return Polynomial(coefs, self.ring)
+
+    def degrees(self):
+        # largest exponent of each variable
+        return [s - 1 for s in self.coefs.shape]
+
+    def _coerce(self, other):
+        if type(other) is DensePolynomial:
+            if other.ring != self.ring:
+                raise ValueError('Dense polynomials must come from the same ring.')
+            return other
+        return DensePolynomial.from_polynomial(self.ring.coerce(other))
+
+    def __add__(self, other):
+        o = self._coerce(other)
+        den = self.den * o.den // gcd(self.den, o.den)
+        shape = [max(a, b) for a, b in zip(self.coefs.shape, o.coefs.shape)]
+        coefs = np.zeros(shape, dtype=object)
+        coefs[_box(self.coefs.shape)] += self.coefs * (den // self.den)
+        coefs[_box(o.coefs.shape)] += o.coefs * (den // o.den)
+        return DensePolynomial._new(coefs, self.ring, den)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __neg__(self):
+        return DensePolynomial._new(-self.coefs, self.ring, self.den)
+
+    def __sub__(self, other):
+        return self.__add__(self._coerce(other).__neg__())
+
+    def __rsub__(self, other):
+        return self.__neg__().__add__(other)
+
+    def __mul__(self, other):
+        o = self._coerce(other)
+        # Kronecker substitution: lay both arrays out in the box of the
+        #   product so the multivariate product is one 1D convolution
+        shape = [a + b - 1 for a, b in zip(self.coefs.shape, o.coefs.shape)]
+        a = _embed(self.coefs, shape)
+        b = _embed(o.coefs, shape)
+        size = 1
+        for s in shape:
+            size *= s
+        prod = multiply_1d(_trim_1d(a), _trim_1d(b))
+        flat = np.zeros(size, dtype=object)
+        flat[:len(prod)] = prod[:size]
+        return DensePolynomial._new(
+            flat.reshape(shape), self.ring, self.den * o.den
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __pow__(self, power):
+        try:
+            power = int(power)
+        except (TypeError, ValueError):
+            raise TypeError(f'Power of polynomial must be integer. Got type {type(power)}')
+        if power < 0:
+            raise ValueError('Power of polynomial must be nonnegative.')
+
+        # repeated squaring
+        ret = DensePolynomial.from_polynomial(self.ring.one())
+        base = self
+        while power > 0:
+            if power & 1:
+                ret = ret * base
+            power >>= 1
+            if power > 0:
+                base = base * base
+        return ret
+
+    def __eq__(self, other):
+        try:
+            o = self._coerce(other)
+        except ValueError:
+            return False
+        return (self.den == o.den and self.coefs.shape == o.coefs.shape
+                and bool(np.all(self.coefs == o.coefs)))
+
+    def __repr__(self):
+        return self.to_polynomial().__repr__()
+
+
+def multiply_1d(a, b):
+    """Product of two 1D object arrays of python ints (as coefficient lists)"""
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return np.zeros(0, dtype=object)
+    if min(n, m) >= FFT_CUTOFF:
+        res = _fft_multiply(a, b)
+        if res is not None:
+            return res
+    return _karatsuba(a, b)
+
+
+def _karatsuba(a, b):
+    n, m = len(a), len(b)
+    if n < m:
+        a, b, n, m = b, a, m, n
+    if m <= KARATSUBA_CUTOFF:
+        return np.convolve(a, b)
+
+    h = n // 2
+    res = np.zeros(n + m - 1, dtype=object)
+    a0, a1 = a[:h], a[h:]
+    if m <= h:
+        # very unbalanced: only split the longer factor
+        lo = _karatsuba(a0, b)
+        hi = _karatsuba(a1, b)
+        res[:len(lo)] += lo
+        res[h:h + len(hi)] += hi
+        return res
+
+    b0, b1 = b[:h], b[h:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_add_1d(a0, a1), _add_1d(b0, b1))
+    z1[:len(z0)] -= z0
+    z1[:len(z2)] -= z2
+    res[:len(z0)] += z0
+    res[h:h + len(z1)] += z1[:n + m - 1 - h]
+    res[2*h:2*h + len(z2)] += z2
+    return res
+
+
+def _fft_multiply(a, b):
+    # Only exact if no coefficient of the product can exceed FFT_EXACT_BOUND;
+    #   returns None when that can't be guaranteed.
+    amax = max(abs(x) for x in a)
+    bmax = max(abs(x) for x in b)
+    if amax * bmax * min(len(a), len(b)) >= FFT_EXACT_BOUND:
+        return None
+
+    size = len(a) + len(b) - 1
+    fa = np.fft.rfft(a.astype(np.float64), size)
+    fb = np.fft.rfft(b.astype(np.float64), size)
+    prod = np.fft.irfft(fa * fb, size)
+    rounded = np.rint(prod)
+    if np.max(np.abs(prod - rounded), initial=0.0) > 0.25:
+        return None
+    return np.array([int(x) for x in rounded], dtype=object)
+
+
+def _add_1d(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    res = a.copy()
+    res[:len(b)] += b
+    return res
+
+
+def _trim_1d(a):
+    nz = np.nonzero(a != 0)[0]
+    if len(nz) == 0:
+        return a[:1]
+    return a[:nz[-1] + 1]
+
+
+def _box(shape):
+    return tuple(slice(0, s) for s in shape)
+
+
+def _embed(coefs, shape):
+    flat = np.zeros(shape, dtype=object)
+    flat[_box(coefs.shape)] = coefs
+    return flat.ravel()
+
+
+def _normalize(coefs, den):
+    # strip trailing zero slices along every axis
+    nz = np.nonzero(coefs != 0)
+    if len(nz[0]) == 0:
+        return np.zeros([1]*coefs.ndim, dtype=object), 1
+    coefs = coefs[tuple(slice(0, int(idx.max()) + 1) for idx in nz)]
+
+    if den < 0:
+        coefs, den = -coefs, -den
+    g = gcd(int(np.gcd.reduce(coefs.ravel())), den)
+    if g != 1:
+        coefs = coefs // g
+        den //= g
+    return coefs, den
@@ -0,0 +1,254 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational, RationalField
+from groebner.rings import _power_from_table
+
+
+# Polynomials are compiled into a multivariate Horner scheme: a polynomial is
+#   written as a polynomial in its first variable whose coefficients are
+#   polynomials in the remaining ones, and so on recursively,
+#
+#       f = (...(f_k x^(e_k - e_(k-1)) + f_(k-1)) x^(...) + ...) x^(e_1)
+#
+#   A node is (variable index, [(exponent, child), ...]) with exponents in
+#   decreasing order, and a leaf is the index of a coefficient. Only the gaps
+#   between consecutive exponents are ever raised to, and the powers needed
+#   by all polynomials of an Evaluator are computed once per call from a
+#   shared table. Nodes for variables a polynomial doesn't involve are
+#   skipped altogether.
+#
+# Three kinds of arithmetic are supported, picked from the arguments:
+#   'exact'  field elements (ints and Rationals are coerced), so results
+#            are exact elements of the base field
+#   'float'  Python or NumPy floats and complex numbers, over QQ
+#   'modp'   NumPy integer arrays over GF(p), reduced modulo p after every
+#            operation
+
+class Evaluator():
+    """Evaluates one polynomial, or several from the same ring, at points.
+
+        Call it with one value per variable: scalars, or NumPy arrays (which
+        are broadcast against each other) to evaluate at many points at
+        once. Field elements, ints and Rationals are evaluated exactly;
+        floats and complex numbers (over QQ) and integer arrays (over GF(p),
+        reduced modulo p) are vectorised. A single polynomial gives a single
+        value, several give a list."""
+    def __init__(self, polys):
+        self.single = type(polys) is not list
+        if self.single:
+            polys = [polys]
+        if len(polys) == 0:
+            raise ValueError('Need at least one polynomial to evaluate.')
+        ring = polys[0].ring
+        if any(f not in ring for f in polys):
+            raise TypeError('Polynomials must all come from the same ring.')
+        self.ring = ring
+        self.polys = polys
+        self.num_vars = ring.num_vars
+
+        self._coefs = []
+        self._trees = [self._compile(f) for f in polys]
+        # the exponent gaps the trees raise each variable to
+        self._gaps = [set() for _ in range(self.num_vars)]
+        for tree in self._trees:
+            self._collect_gaps(tree)
+        self._converted = {}
+
+    def __call__(self, *values):
+        if len(values) != self.num_vars:
+            raise ValueError(f'Expected {self.num_vars} values, got {len(values)}.')
+        mode = self._mode(values)
+        values = self._prepare(values, mode)
+        coefs = self._coefficients(mode)
+        powers = self._powers(values, mode)
+        if mode == 'modp':
+            p = self.ring.field.p
+            add = lambda a, b: (a + b) % p
+            mul = lambda a, b: (a * b) % p
+        else:
+            add = lambda a, b: a + b
+            mul = lambda a, b: a * b
+        res = [_horner(tree, coefs, powers, add, mul) for tree in self._trees]
+        if mode != 'exact' and np is not None and \
+                any(isinstance(v, np.ndarray) for v in values):
+            # constant polynomials should still give one value per point
+            shape = np.broadcast(*[v for v in values if isinstance(v, np.ndarray)]).shape
+            res = [np.broadcast_to(r, shape) if np.ndim(r) == 0 else r for r in res]
+        return res[0] if self.single else res
+
+    def at(self, points):
+        """Values at each row of points, an (N x num_vars) array (or list of
+            tuples). Gives an array of N values, or N x len(polys) for
+            several polynomials (lists of values in exact arithmetic)."""
+        if np is not None and isinstance(points, np.ndarray):
+            if points.ndim != 2 or points.shape[1] != self.num_vars:
+                raise ValueError(f'Points must be an array of shape (N, {self.num_vars}).')
+            res = self(*[points[:, i] for i in range(self.num_vars)])
+            return res if self.single else np.stack(res, axis=-1)
+        return [self(*point) for point in points]
+
+    # Compilation
+
+    def _compile(self, f):
+        zero = self.ring.field.zero()
+        terms = [(m.degrees, c) for m, c in f.coefs.items() if c != zero]
+        if len(terms) == 0:
+            return self._leaf(zero)
+        return self._node(terms, 0)
+
+    def _node(self, terms, var):
+        # skip variables that don't appear in any of the terms
+        while var < self.num_vars and all(degs[var] == 0 for degs, _ in terms):
+            var += 1
+        if var == self.num_vars:
+            return self._leaf(terms[0][1])
+        groups = {}
+        for degs, c in terms:
+            groups.setdefault(degs[var], []).append((degs, c))
+        return (var, [(e, self._node(groups[e], var + 1))
+                      for e in sorted(groups, reverse=True)])
+
+    def _leaf(self, c):
+        self._coefs.append(c)
+        return len(self._coefs) - 1
+
+    def _collect_gaps(self, tree):
+        if type(tree) is int:
+            return
+        var, children = tree
+        exps = [e for e, _ in children] + [0]
+        for a, b in zip(exps, exps[1:]):
+            if a > b:
+                self._gaps[var].add(a - b)
+        for _, child in children:
+            self._collect_gaps(child)
+
+    # Evaluation
+
+    def _mode(self, values):
+        field = self.ring.field
+        exact = all(type(v) in (int, Rational) or v in field for v in values
+                    if not _is_array(v))
+        arrays = any(_is_array(v) for v in values)
+        if isinstance(field, PrimeField):
+            # NumPy integer scalars are as good as ints here
+            scalars = all(_is_integer(v) or v in field for v in values
+                          if not _is_array(v))
+            if arrays:
+                if not scalars or not all(np.issubdtype(v.dtype, np.integer)
+                                          for v in values if _is_array(v)):
+                    raise TypeError('Over GF(p) arrays must have an integer dtype.')
+                if field.p >= 2**31:
+                    raise ValueError('Vectorised evaluation over GF(p) needs p < 2^31.')
+                return 'modp'
+            if not scalars:
+                raise TypeError(f'Values must be integers or elements of {field}.')
+            return 'exact'
+        if not isinstance(field, RationalField):
+            raise NotImplementedError(f'Evaluation is not implemented over {field}.')
+        return 'exact' if exact and not arrays else 'float'
+
+    def _prepare(self, values, mode):
+        field = self.ring.field
+        if mode == 'exact':
+            return [field.coerce(int(v) if _is_integer(v) else v) for v in values]
+        if mode == 'modp':
+            return [np.asarray(v.value if v in field else v, dtype=np.int64) % field.p
+                    for v in values]
+        # integer arrays would overflow int64 in the powers, so work in floats
+        return [float(v) if type(v) is Rational else
+                np.asarray(v, dtype=float) if _is_array(v) and
+                not np.issubdtype(v.dtype, np.inexact) else v for v in values]
+
+    def _coefficients(self, mode):
+        if mode not in self._converted:
+            if mode == 'exact':
+                coefs = self._coefs
+            elif mode == 'modp':
+                coefs = [c.value for c in self._coefs]
+            else:
+                coefs = [float(c) for c in self._coefs]
+            self._converted[mode] = coefs
+        return self._converted[mode]
+
+    def _powers(self, values, mode):
+        # powers[var][gap] for every gap some tree needs, building each one
+        #   from the largest smaller power already known
+        if mode == 'modp':
+            p = self.ring.field.p
+            mul = lambda a, b: (a * b) % p
+        else:
+            mul = lambda a, b: a * b
+        powers = []
+        for x, gaps in zip(values, self._gaps):
+            table = {1: x}
+            for gap in sorted(gaps):
+                _power_from_table(table, gap, mul)
+            powers.append(table)
+        return powers
+
+
+class JacobianEvaluator():
+    """Evaluates the Jacobian matrix of a list of polynomials (by the given
+        variables, all by default) at points, through one Evaluator shared by
+        all of its entries. Exact arithmetic gives a list of rows; arrays
+        give an array with the matrix in its last two axes."""
+    def __init__(self, polys, variables=None):
+        if type(polys) is not list or len(polys) == 0:
+            raise ValueError('Need a list of polynomials.')
+        ring = polys[0].ring
+        rows = ring.jacobian(polys, variables)
+        self.shape = (len(rows), len(rows[0]))
+        self.evaluator = Evaluator([d for row in rows for d in row])
+
+    def __call__(self, *values):
+        flat = self.evaluator(*values)
+        m, n = self.shape
+        if np is not None and any(isinstance(v, np.ndarray) for v in flat):
+            return np.stack(flat, axis=-1).reshape(flat[0].shape + (m, n))
+        return [flat[i*n:(i + 1)*n] for i in range(m)]
+
+    def at(self, points):
+        """Jacobians at each row of points, an (N x num_vars) array (giving
+            an N x len(polys) x num_variables array) or list of tuples"""
+        if np is not None and isinstance(points, np.ndarray):
+            num_vars = self.evaluator.num_vars
+            if points.ndim != 2 or points.shape[1] != num_vars:
+                raise ValueError(f'Points must be an array of shape (N, {num_vars}).')
+            return self(*[points[:, i] for i in range(num_vars)])
+        return [self(*point) for point in points]
+
+
+def compile_polynomials(polys):
+    """An Evaluator for a polynomial or a list of polynomials of one ring"""
+    return Evaluator(polys)
+
+
+def _horner(tree, coefs, powers, add, mul):
+    if type(tree) is int:
+        return coefs[tree]
+    var, children = tree
+    table = powers[var]
+    acc = None
+    prev = None
+    for e, child in children:
+        val = _horner(child, coefs, powers, add, mul)
+        if acc is None:
+            acc = val
+        else:
+            acc = add(mul(acc, table[prev - e]), val)
+        prev = e
+    if prev > 0:
+        acc = mul(acc, table[prev])
+    return acc
+
+
+def _is_array(v):
+    return np is not None and isinstance(v, np.ndarray)
+
+def _is_integer(v):
+    return type(v) is int or (np is not None and isinstance(v, np.integer))
@@ -8,6 +8,8 @@ class Field(Ring):
 
 class FieldElement(RingElement):
     """Parent class for all elements of fields"""
+    __slots__ = ()
+
     def __init__(self, field):
         super().__init__(field)
         self.field = field
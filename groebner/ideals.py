@@ -1,5 +1,11 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
 from groebner.rings import RingElement
-from groebner.algorithms import buchberger_fast, division_algorithm
+from groebner.monomials import Monomial
+from groebner.polynomials import Polynomial, PolynomialRing
+from groebner.algorithms import buchberger_fast, division_algorithm, reduce, Reducer
+from groebner.cache import get_default_cache
+from groebner import serialization
 
 
 class Ideal:
@@ -21,13 +27,17 @@ class Ideal:
         return self.ideal_add(other)
     
 class IdealFromGenerators(Ideal):
-    """An ideal given by generators (elements in parent ring)"""
-    def __init__(self, gens):
+    """An ideal given by generators (elements in parent ring). The zero
+        ideal has no generators, so its ring has to be passed in."""
+    def __init__(self, gens, ring=None):
         # wrap in a list (if not already a list)
         if type(gens) is not list:
             gens = [gens]
+        if len(gens) == 0 and ring is None:
+            raise ValueError('The zero ideal needs its ring.')
         # We want elements to be instances of ring elements of the same ring
-        ring = gens[0].ring
+        if len(gens) > 0:
+            ring = gens[0].ring
         errors = [not isinstance(x, RingElement) or x.ring != ring for x in gens]
         if sum(errors) > 0:
             raise TypeError('Input must be RingElement or list of RingElements.')
@@ -42,25 +52,205 @@ class IdealFromGenerators(Ideal):
             raise TypeError('Other ideal must be of type IdealFromGenerators.')
         return IdealFromGenerators(self.gens + other.gens)
     
+    # Ideal operations. Each one adds tag variables (or reuses existing ones)
+    #   and computes a single Groebner basis under an elimination ordering
+    #   that breaks ties with the ring's own ordering. Only the tag-free part
+    #   of that basis is wanted, and it is already the reduced Groebner basis
+    #   of the answer in the original ring, so results come back as
+    #   GroebnerIdeals without any further Buchberger runs.
+
     def intersect(self, other):
-        # TODO: this
-        raise NotImplementedError
+        """The intersection of this ideal with another one of the same ring"""
+        self._check_other(other)
+        R = self.ring
+        S = _tagged_ring(R)
+        t = S.get_vars()[0]
+        gens = ([t * _move(f, S, pad=1) for f in _basis_of(self)] +
+                [(S.one() - t) * _move(g, S, pad=1) for g in _basis_of(other)])
+        return GroebnerIdeal.from_basis(_eliminate_tags(gens, R, 1), ring=R)
+
+    def quotient(self, other):
+        """The ideal quotient (I : J) = {f : f*J in I} where J is another ideal
+            or a single polynomial"""
+        if isinstance(other, Ideal):
+            self._check_other(other)
+            fs = _nonzero(other.gens)
+        else:
+            fs = _nonzero([self.ring.coerce(other)])
+        if len(fs) == 0:
+            # everything multiplies the zero ideal into I
+            return GroebnerIdeal.from_basis([self.ring.one()])
+
+        res = None
+        for f in fs:
+            # (I : f) = (I ∩ <f>) / f, and dividing a Groebner basis of the
+            #   intersection by f gives a Groebner basis of the quotient
+            inter = self.intersect(IdealFromGenerators([f]))
+            q = [division_algorithm(g, f)[0][0] for g in inter.basis]
+            q = GroebnerIdeal.from_basis(reduce(q), ring=self.ring)
+            res = q if res is None else res.intersect(q)
+        return res
+
+    def saturate(self, other):
+        """The saturation (I : J^oo) of this ideal by an ideal or polynomial J"""
+        if isinstance(other, Ideal):
+            self._check_other(other)
+            fs = _nonzero(other.gens)
+        else:
+            fs = _nonzero([self.ring.coerce(other)])
+        if len(fs) == 0:
+            return GroebnerIdeal.from_basis([self.ring.one()])
+
+        R = self.ring
+        S = _tagged_ring(R)
+        t = S.get_vars()[0]
+        res = None
+        for f in fs:
+            # Rabinowitsch: (I : f^oo) = (I + <1 - t*f>) ∩ k[x]
+            gens = [_move(g, S, pad=1) for g in _basis_of(self)]
+            gens.append(S.one() - t * _move(f, S, pad=1))
+            sat = GroebnerIdeal.from_basis(_eliminate_tags(gens, R, 1), ring=R)
+            res = sat if res is None else res.intersect(sat)
+        return res
+
+    def eliminate(self, variables):
+        """The elimination ideal: all elements of this ideal that don't involve
+            the given variables (indices, labels or variables of the ring).
+            The result is an ideal of the same ring, possibly the zero ideal
+            (a GroebnerIdeal with an empty basis)."""
+        R = self.ring
+        indices = _var_indices(R, variables)
+        S = PolynomialRing(labels=R.ordering.var_labels, base_field=R.field,
+                           order=('elim', indices, R.ordering.order_type))
+        gens = [_move(g, S) for g in _basis_of(self)]
+        G = buchberger_fast(gens) if gens else []
+        basis = [_move(g, R) for g in G
+                 if all(g.LM().degrees[i] == 0 for i in indices)]
+        return GroebnerIdeal.from_basis(basis, ring=R)
+
+    def _check_other(self, other):
+        if not isinstance(other, IdealFromGenerators):
+            raise TypeError('Other ideal must inherit from IdealFromGenerators.')
+        if other.ring != self.ring:
+            raise TypeError('Base rings for ideals must be the same.')
 
 class GroebnerIdeal(IdealFromGenerators):
     """An ideal given by generators that form a Groebner basis"""
-    def __init__(self, gens):
+    def __init__(self, gens, cache=None, memo_size=4096):
         # use some algorithm to compute a Groebner basis from the given gens
-        self.basis = buchberger_fast(gens)
-        self.ring = gens[0].ring
+        # The basis is looked up in (and saved to) a GroebnerCache: the one
+        #   passed in, otherwise the default set with set_default_cache.
+        #   cache=False skips caching altogether. memo_size bounds the memos
+        #   of normal forms kept by the reducer (0 turns them off).
+        if cache is None:
+            cache = get_default_cache()
+        if cache is None or cache is False:
+            self._setup(buchberger_fast(gens), memo_size)
+        else:
+            self._setup(cache.groebner_basis(gens, buchberger_fast), memo_size)
+
+    @classmethod
+    def from_basis(cls, basis, memo_size=4096, ring=None):
+        """Wraps polynomials that already form a (reduced) Groebner basis
+            without running Buchberger's algorithm again. An empty basis
+            gives the zero ideal of ring."""
+        if len(basis) == 0 and ring is None:
+            raise ValueError('The zero ideal has no nonzero generators, '
+                             'so its ring has to be given.')
+        ideal = cls.__new__(cls)
+        ideal._setup(list(basis), memo_size, ring)
+        return ideal
+
+    def _setup(self, basis, memo_size, ring=None):
+        self.memo_size = memo_size
+        self._reducer = None
+        self.basis = basis
+        # timing of the most recent normal_forms/contains_many call
+        self.batch_stats = None
+
+        super().__init__(self.basis, ring)
+
+    @property
+    def basis(self):
+        return self._basis
 
-        super().__init__(self.basis)
+    @basis.setter
+    def basis(self, basis):
+        # the reducer (and the normal forms it remembers) belong to the old
+        #   basis
+        self._basis = basis
+        self.gens = basis
+        self._reducer = None
+
+    @property
+    def reducer(self):
+        # built on first use and shared by every membership test
+        if self._reducer is None:
+            self._reducer = Reducer(self.basis, memo_size=self.memo_size,
+                                    ring=self.ring)
+        return self._reducer
+
+    def memo_stats(self):
+        """Hit rates of the normal form memos (None if memoisation is off)"""
+        return self.reducer.memo_stats()
     
     def __contains__(self, other):
         if other not in self.ring:
             return False
         
-        _, r = division_algorithm(other, self.basis)
-        return r == self.ring.zero()
+        return self.reducer.normal_form(other) == self.ring.zero()
+
+    def normal_form(self, poly):
+        return self.reducer.normal_form(self.ring.coerce(poly))
+
+    def normal_forms(self, polys, processes=None, chunksize=None):
+        """Normal forms (remainders modulo the basis) of many polynomials.
+
+            With processes=None everything is reduced here against the shared
+            reducer; otherwise the polynomials are split into chunks and sent
+            to a pool of that many worker processes, each of which builds the
+            reducer once. Throughput is recorded in self.batch_stats."""
+        polys = [self.ring.coerce(f) for f in polys]
+        start = time.perf_counter()
+        if processes is None or len(polys) == 0:
+            res = self.reducer.normal_forms(polys)
+        else:
+            res = self._normal_forms_parallel(polys, processes, chunksize)
+        elapsed = time.perf_counter() - start
+        self.batch_stats = {
+            'count': len(polys),
+            'seconds': elapsed,
+            'polys_per_second': len(polys) / elapsed if elapsed > 0 else float('inf'),
+            'processes': processes or 1,
+        }
+        return res
+
+    def contains_many(self, polys, processes=None, chunksize=None):
+        """Membership test for many polynomials at once (see normal_forms)"""
+        zero = self.ring.zero()
+        return [r == zero for r in self.normal_forms(polys, processes, chunksize)]
+
+    def solve(self, cluster_tol=1e-5, seed=None):
+        """Complex solutions (with multiplicities) of a zero-dimensional ideal
+            over QQ, computed numerically. See groebner.solving.solve."""
+        from groebner.solving import solve
+        return solve(self, cluster_tol=cluster_tol, seed=seed)
+
+    def _normal_forms_parallel(self, polys, processes, chunksize):
+        if chunksize is None:
+            chunksize = max(1, len(polys) // (4 * processes))
+        # ship chunks in the compact binary format; the ring goes over once
+        chunks = [serialization.dumps(polys[i:i + chunksize])
+                  for i in range(0, len(polys), chunksize)]
+        res = []
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(self.ring, self.basis)
+        ) as pool:
+            for chunk in pool.map(_reduce_chunk, chunks):
+                res += serialization.loads(chunk, self.ring)
+        return res
     
     def __add__(self, other):
         # if we have a list of generators, we just add concatenate them!
@@ -69,4 +259,70 @@ class GroebnerIdeal(IdealFromGenerators):
         return GroebnerIdeal(self.gens + other.gens)
     
     def __radd__(self, other):
-        return self.__add__(other)
\ No newline at end of file
+        return self.__add__(other)
+
+
+# Helpers for the ideal operations
+
+def _basis_of(ideal):
+    # a Groebner basis we already have is a much better starting point for
+    #   Buchberger than the raw generators
+    if isinstance(ideal, GroebnerIdeal):
+        return ideal.basis
+    return _nonzero(ideal.gens)
+
+def _nonzero(polys):
+    return [f for f in polys if f != f.ring.zero()]
+
+def _tagged_ring(ring, num_tags=1):
+    # ring with extra variables in front and a block ordering that eliminates
+    #   them, so ties are broken by the ordering of ring itself
+    taken = set(ring.ordering.var_labels)
+    tags = []
+    i = 0
+    while len(tags) < num_tags:
+        if f'_t{i}' not in taken:
+            tags.append(f'_t{i}')
+        i += 1
+    labels = tags + ring.ordering.var_labels
+    order = ('block', (('grevlex', num_tags),
+                       (ring.ordering.order_type, ring.num_vars)))
+    return PolynomialRing(labels=labels, base_field=ring.field, order=order)
+
+def _move(poly, ring, pad=0, drop=0):
+    # the same polynomial in another ring, with pad new leading variables or
+    #   without the first drop variables (which must not appear)
+    order = ring.ordering
+    zeros = (0,)*pad
+    return Polynomial(
+        {Monomial._from_tuple(zeros + m.degrees[drop:], order): c
+         for m, c in poly.coefs.items()},
+        ring
+    )
+
+def _eliminate_tags(gens, ring, num_tags):
+    # Since the ordering eliminates the tags, a basis element whose leading
+    #   monomial is free of them doesn't involve them at all. No element
+    #   qualifying means the result is the zero ideal.
+    G = buchberger_fast(gens) if gens else []
+    return [_move(g, ring, drop=num_tags) for g in G
+            if all(d == 0 for d in g.LM().degrees[:num_tags])]
+
+def _var_indices(ring, variables):
+    if type(variables) is not list:
+        variables = [variables]
+    return tuple(sorted(set([ring.var_index(v) for v in variables])))
+
+
+# Helpers for reducing in worker processes. They have to live at module level
+#   so they can be pickled.
+
+_worker_reducer = None
+
+def _init_worker(ring, basis):
+    global _worker_reducer
+    _worker_reducer = Reducer(basis)
+
+def _reduce_chunk(chunk):
+    polys = serialization.loads(chunk, _worker_reducer.ring)
+    return serialization.dumps(_worker_reducer.normal_forms(polys))
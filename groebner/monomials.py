@@ -1,13 +1,45 @@
-from math import factorial
+from collections import OrderedDict
 from warnings import warn
 from random import randint
+from weakref import WeakValueDictionary
+
+
+# Rows of Pascal's triangle, grown on demand. Exact integers throughout so that
+#   ranks stay correct for any number of variables and degree.
+_PASCAL = [[1]]
+
+def _binomial(n, k):
+    if k < 0 or n < 0 or k > n:
+        return 0
+    while len(_PASCAL) <= n:
+        prev = _PASCAL[-1]
+        _PASCAL.append([1] + [prev[i] + prev[i + 1] for i in range(len(prev) - 1)] + [1])
+    return _PASCAL[n][k]
 
 
 class MonomialOrdering():
     """Has information pertaining to the ordering of monomials as well as 
         conversions between lists of coefficients and polynomials"""
-    def __init__(self, num_vars, labels=None, order_type='grlex'):
+    # orderings are shared by every monomial (and polynomial) of a ring, so
+    #   they hold all of the per-ring context and monomials only point here
+    __slots__ = ('num_vars', 'var_labels', 'order_type', 'lt', '_intern',
+                 '_key')
+
+    # Besides the names below, order_type can be a tuple describing a
+    #   composite ordering (see _normalize_order):
+    #       ('block', ((order, size), ...))   product of orderings on
+    #                                         consecutive blocks of variables
+    #       ('weight', weights, tiebreak)     weighted degree, ties broken by
+    #                                         another ordering
+    #       ('matrix', rows)                  compare the products rows * a
+    #       ('elim', indices, tiebreak)       eliminates the given variables
+    SIMPLE_ORDERS = ['lex', 'grlex', 'grevlex']
+
+    def __init__(self, num_vars, labels=None, order_type='grlex', intern=None):
         self.num_vars = num_vars
+        self._intern = None
+        if intern is not None and intern is not False:
+            self.enable_interning(intern)
         
         if labels is None:
             # if no variable labels are provided, we make our own
@@ -22,6 +54,11 @@ class MonomialOrdering():
             else:
                 self.var_labels = list(map(str, labels))
         
+        self.order_type = _normalize_order(order_type, num_vars)
+        # Every ordering is compiled into a sort key on exponent tuples. The
+        #   simple orderings keep their hand written comparisons, which bail
+        #   out at the first difference; the others compare keys.
+        self._key = _compile_key(self.order_type)
         if order_type == 'grlex':
             self.lt = self._lt_grlex
         elif order_type == 'lex':
@@ -29,14 +66,47 @@ class MonomialOrdering():
         elif order_type == 'grevlex':
             self.lt = self._lt_grevlex
         else:
-            raise NotImplementedError('Only implemented for "lex", "grlex", and "grevlex" orderings.')
-        
-        # TODO Implement grevlex, which should be faster.
+            self.lt = self._lt_key
 
         # always assume variables have decreasing order
         # x_1 > x_2 > x_3 > ... > x_n
         # In total degree k, there are (n+k-1) C (n-1) monomials
 
+    def sort_key(self, mon):
+        """Key with sort_key(a) < sort_key(b) exactly when a < b, for sorting
+            many monomials (or taking a max) without pairwise comparisons"""
+        return self._key(mon.degrees)
+
+    # Interning (hash-consing) of monomials
+
+    def enable_interning(self, table=True):
+        """Make equal monomials of this ordering the same object. Pass True
+            for the default (weak) table, a policy name ('weak' or 'bounded')
+            or a MonomialInternTable instance. A table belongs to the first
+            ordering that uses it and can't be shared with another one."""
+        if table is True:
+            table = MonomialInternTable()
+        elif type(table) is str:
+            table = MonomialInternTable(policy=table)
+        elif not isinstance(table, MonomialInternTable):
+            raise TypeError('Expected True, a policy name or a '
+                            'MonomialInternTable.')
+        if table.order is None:
+            table.order = self
+        elif table.order is not self:
+            raise ValueError('This intern table already belongs to another ordering.')
+        self._intern = table
+        return table
+
+    def disable_interning(self):
+        self._intern = None
+
+    def intern_stats(self):
+        # None when interning is off
+        if self._intern is None:
+            return None
+        return self._intern.stats()
+
     # we want to expose the "variables" (monomials of degree 1)
     def get_vars(self):
         vars = {}
@@ -49,10 +119,12 @@ class MonomialOrdering():
     def constant_monomial(self):
         return Monomial([0]*(self.num_vars), self)
     
-    def random(self, deg_bound=20):
+    def random(self, deg_bound=20, rng=None):
+        # rng is a random.Random to draw from instead of the global one
+        rand = randint if rng is None else rng.randint
         degs = []
         for _ in range(self.num_vars):
-            degs.append(randint(0, deg_bound))
+            degs.append(rand(0, deg_bound))
         return Monomial(degs, self)
     
     def _lt_grlex(self, a, b):
@@ -111,16 +183,116 @@ class MonomialOrdering():
         except AssertionError:
             raise ValueError('Monomials must be from same order.')
         
+    def _lt_key(self, a, b):
+        try:
+            if a.order is not b.order and a.order != b.order:
+                raise ValueError('Monomials must be from same order.')
+            return self._key(a.degrees) < self._key(b.degrees)
+        except AttributeError:
+            raise ValueError("Can only compare items of type Monomial.")
+
+    # Ranking: for graded orderings every monomial has a finite position in
+    #   the (ascending) order, so we can use it as an integer index for dense
+    #   storage or matrix columns. Monomials of total degree < d take up the
+    #   indices 0, ..., C(n+d-1, n) - 1.
+
+    def num_monomials(self, max_degree):
+        """Number of monomials of total degree at most max_degree"""
+        return _binomial(self.num_vars + max_degree, self.num_vars)
+
+    def rank(self, mon, max_degree=None):
+        """Position of mon among all monomials in increasing order"""
+        if mon not in self:
+            raise ValueError('Monomial does not come from this order.')
+        return self.rank_degrees(mon.degrees, max_degree)
+
+    def rank_degrees(self, degrees, max_degree=None):
+        """Same as rank, but takes a tuple of exponents directly"""
+        d = sum(degrees)
+        if max_degree is not None and d > max_degree:
+            raise ValueError(f'Monomial has degree {d} which exceeds the bound'
+                             f' {max_degree}.')
+        n = self.num_vars
+        # everything of smaller degree comes first
+        idx = _binomial(n + d - 1, n) if d > 0 else 0
+
+        rem = d
+        if self.order_type == 'grlex':
+            # ties broken lexicographically from the first variable: count the
+            #   monomials agreeing up to i that have a smaller exponent at i
+            for i in range(n - 1):
+                k = n - 2 - i
+                a = degrees[i]
+                idx += _binomial(rem + k + 1, k + 1) - _binomial(rem - a + k + 1, k + 1)
+                rem -= a
+        elif self.order_type == 'grevlex':
+            # ties broken from the last variable, where a LARGER exponent
+            #   means a smaller monomial
+            for i in range(n - 1, 0, -1):
+                a = degrees[i]
+                idx += _binomial(rem - a - 1 + i, i)
+                rem -= a
+        else:
+            raise NotImplementedError('Ranking is only implemented for the graded '
+                                      'orderings "grlex" and "grevlex".')
+        return idx
+
+    def unrank(self, idx, max_degree=None):
+        """The monomial in position idx (the inverse of rank)"""
+        return Monomial._from_tuple(self.unrank_degrees(idx, max_degree), self)
+
+    def unrank_degrees(self, idx, max_degree=None):
+        if type(idx) is not int or idx < 0:
+            raise ValueError('Index must be a nonnegative integer.')
+        if max_degree is not None and idx >= self.num_monomials(max_degree):
+            raise ValueError(f'Index {idx} out of range for monomials of degree'
+                             f' at most {max_degree}.')
+        if self.order_type not in ['grlex', 'grevlex']:
+            raise NotImplementedError('Ranking is only implemented for the graded '
+                                      'orderings "grlex" and "grevlex".')
+        n = self.num_vars
+        rem, pos = self._get_total_degree(idx)
+        degrees = [0]*n
+
+        if self.order_type == 'grlex':
+            for i in range(n - 1):
+                k = n - 2 - i
+                # monomials with exponent a at i: compositions of the rest
+                a = 0
+                block = _binomial(rem + k, k)
+                while pos >= block:
+                    pos -= block
+                    a += 1
+                    block = _binomial(rem - a + k, k)
+                degrees[i] = a
+                rem -= a
+            degrees[n - 1] = rem
+        else:
+            for i in range(n - 1, 0, -1):
+                # larger exponents at i come first
+                a = rem
+                block = 1
+                while pos >= block:
+                    pos -= block
+                    a -= 1
+                    block = _binomial(rem - a + i - 1, i - 1)
+                degrees[i] = a
+                rem -= a
+            degrees[0] = rem
+        return tuple(degrees)
+
     def _get_total_degree(self, idx):
-        # "spin off" graded pieces (total degree)
-        if idx == 0:
-            return 0, 0
-        i = 1
-        while idx > self._choose(self.num_vars + i - 1, self.num_vars - 1):
-            idx -= self._choose(self.num_vars + i - 1, self.num_vars - 1)
-            i += 1
-        
-        return i, idx
+        # "spin off" graded pieces (total degree): returns the total degree of
+        #   the monomial at position idx and its position within that degree
+        n = self.num_vars
+        d = 0
+        block = 1
+        while idx >= block:
+            idx -= block
+            d += 1
+            block = _binomial(n + d - 1, n - 1)
+
+        return d, idx
 
     def __contains__(self, other):
         if type(other) is not Monomial:
@@ -133,40 +305,175 @@ class MonomialOrdering():
             return False
         
         return (self.num_vars == other.num_vars and
-                self.var_labels == other.var_labels)
+                self.var_labels == other.var_labels and
+                self.order_type == other.order_type)
+
+    def __hash__(self):
+        return hash((self.num_vars, tuple(self.var_labels), self.order_type))
+
+    def __reduce__(self):
+        # the bound comparison method and intern table are rebuilt on load
+        intern = None if self._intern is None else self._intern.empty_copy()
+        return (MonomialOrdering,
+                (self.num_vars, self.var_labels, self.order_type, intern))
     
     def _choose(self, n, k):
-        return factorial(n)/(factorial(k)*factorial(n-k))
+        return _binomial(n, k)
+
+def _normalize_order(spec, num_vars):
+    # validates an ordering description and turns it into a hashable tuple
+    if type(spec) is str:
+        if spec not in MonomialOrdering.SIMPLE_ORDERS:
+            raise NotImplementedError(f'Unknown ordering {spec}. Use one of '
+                                      f'{MonomialOrdering.SIMPLE_ORDERS} or a '
+                                      f'block, weight, matrix or elim ordering.')
+        return spec
+    if type(spec) not in (tuple, list) or len(spec) == 0:
+        raise ValueError(f'Invalid ordering {spec}.')
+
+    kind = spec[0]
+    if kind == 'block' and len(spec) == 2:
+        blocks = tuple(
+            (_normalize_order(order, size), size) for order, size in spec[1]
+        )
+        if any(type(size) is not int or size < 1 for _, size in blocks) or \
+                sum(size for _, size in blocks) != num_vars:
+            raise ValueError(f'Block sizes must be positive and add up to {num_vars}.')
+        return ('block', blocks)
+    if kind == 'weight' and len(spec) == 3:
+        weights = tuple(spec[1])
+        if len(weights) != num_vars or \
+                not all(type(w) is int and w >= 0 for w in weights):
+            raise ValueError(f'Need {num_vars} nonnegative integer weights.')
+        return ('weight', weights, _normalize_order(spec[2], num_vars))
+    if kind == 'elim' and len(spec) == 3:
+        indices = tuple(sorted(set(spec[1])))
+        if not all(type(i) is int and 0 <= i < num_vars for i in indices):
+            raise ValueError('Elimination indices must refer to variables.')
+        return ('elim', indices, _normalize_order(spec[2], num_vars))
+    if kind == 'matrix' and len(spec) == 2:
+        rows = tuple(tuple(row) for row in spec[1])
+        if any(len(row) != num_vars or not all(type(a) is int for a in row)
+               for row in rows):
+            raise ValueError(f'Matrix orderings need rows of {num_vars} integers.')
+        if _rank(rows) != num_vars:
+            raise ValueError('Matrix ordering must have full rank.')
+        for j in range(num_vars):
+            # otherwise 1 > x_j and this isn't a well ordering
+            if next(row[j] for row in rows if row[j] != 0) < 0:
+                raise ValueError('First nonzero entry in every column of a '
+                                 'matrix ordering must be positive.')
+        return ('matrix', rows)
+    raise ValueError(f'Invalid ordering {spec}.')
+
+
+def _compile_key(spec):
+    # sort key on exponent tuples for a normalized ordering
+    if spec == 'lex':
+        return lambda d: d
+    if spec == 'grlex':
+        return lambda d: (sum(d), d)
+    if spec == 'grevlex':
+        # a larger exponent at the end makes a monomial smaller
+        return lambda d: (sum(d), tuple([-a for a in reversed(d)]))
+
+    kind = spec[0]
+    if kind == 'block':
+        parts = []
+        start = 0
+        for order, size in spec[1]:
+            parts.append((start, start + size, _compile_key(order)))
+            start += size
+        return lambda d: tuple([key(d[i:j]) for i, j, key in parts])
+    if kind == 'weight':
+        weights, tiebreak = spec[1], _compile_key(spec[2])
+        return lambda d: (sum([w * a for w, a in zip(weights, d)]), tiebreak(d))
+    if kind == 'elim':
+        indices, tiebreak = spec[1], _compile_key(spec[2])
+        return lambda d: (sum([d[i] for i in indices]), tiebreak(d))
+    rows = spec[1]
+    return lambda d: tuple([sum([r * a for r, a in zip(row, d)]) for row in rows])
+
+
+def _rank(rows):
+    # exact rank by fraction-free Gaussian elimination
+    rows = [list(row) for row in rows]
+    rank = 0
+    for j in range(len(rows[0]) if rows else 0):
+        pivot = next((i for i in range(rank, len(rows)) if rows[i][j] != 0), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        p = rows[rank]
+        for i in range(rank + 1, len(rows)):
+            c = rows[i][j]
+            if c != 0:
+                rows[i] = [p[j] * a - c * b for a, b in zip(rows[i], p)]
+        rank += 1
+    return rank
+
 
 class Monomial():
-    """Wrapper for a list that represents a monomial"""
-    def __init__(self, degrees, order):
-        is_not_int = lambda x: type(x) is not int
-        errors = sum(list(map(is_not_int, degrees)))
-        if type(degrees) is not list or errors > 0:
+    """Immutable wrapper for a tuple of exponents that represents a monomial.
+        If the ordering has interning enabled, equal monomials are the same
+        object."""
+    __slots__ = ('degrees', 'total_degree', 'order', '_hash', '__weakref__')
+
+    def __new__(cls, degrees, order):
+        if type(degrees) not in (list, tuple) or \
+                not all(type(x) is int for x in degrees):
             raise TypeError("Monomial only accepts a list of ints.")
 
-        self.degrees = degrees
-        self.total_degree = sum(degrees)
-        self.order = order
-        self.num_vars = self.order.num_vars
+        return cls._from_tuple(tuple(degrees), order)
+
+    @classmethod
+    def _from_tuple(cls, degrees, order, total_degree=None):
+        # skips input validation for exponents we built ourselves
+        table = order._intern
+        if table is not None:
+            return table.lookup(degrees, order, total_degree)
+        return cls._make(degrees, order, total_degree)
+
+    @classmethod
+    def _make(cls, degrees, order, total_degree=None):
+        # always builds a fresh object
+        mon = object.__new__(cls)
+        mon.degrees = degrees
+        mon.total_degree = sum(degrees) if total_degree is None else total_degree
+        mon.order = order
+        mon._hash = hash(degrees)
+        return mon
+
+    @property
+    def num_vars(self):
+        return self.order.num_vars
 
     def __mul__(self, other):
         # for now we only allow multiplication with other monomials
         if type(other) is not Monomial:
             raise TypeError('Monomials can only be multipled by other monomials.')
-        if self.order != other.order:
+        if self.order is not other.order and self.order != other.order:
             raise ValueError('Can only multiply monomials with compatible'
                              'monomial orderings.')
 
-        degrees = [self.degrees[i] + other.degrees[i] for i in range(self.num_vars)]
+        degrees = tuple([a + b for a, b in zip(self.degrees, other.degrees)])
 
-        return Monomial(degrees, self.order)
+        return Monomial._from_tuple(
+            degrees, self.order, self.total_degree + other.total_degree
+        )
     
+    def __reduce__(self):
+        return (Monomial, (self.degrees, self.order))
+
     def __eq__(self, other):
+        # interned monomials hit the identity check; otherwise the cached
+        #   hashes rule out almost every unequal pair immediately
+        if self is other:
+            return True
         if type(other) is not Monomial:
             return False
-        return self.degrees == other.degrees and self.order == other.order
+        return (self._hash == other._hash and self.degrees == other.degrees
+                and (self.order is other.order or self.order == other.order))
     
     def __lt__(self, other):
         return self.order.lt(self, other)
@@ -184,8 +491,7 @@ class Monomial():
     
     def __repr__(self):
         s = ''
-        var = self.order.get_vars()
-        for i, lbl in enumerate(var.keys()):
+        for i, lbl in enumerate(self.order.var_labels):
             if self.degrees[i] > 0:
                 s += lbl
                 if self.degrees[i] > 1:
@@ -193,8 +499,83 @@ class Monomial():
         return s
     
     def __hash__(self):
-        # let's just punt to tuples
-        return tuple(self.degrees).__hash__()
+        # hash of the exponent tuple, computed once at construction
+        return self._hash
 
     def _choose(self, n, k):
-        return factorial(n)/(factorial(k)*factorial(n-k))
\ No newline at end of file
+        return _binomial(n, k)
+
+
+class MonomialInternTable():
+    """Intern table mapping exponent tuples to the unique Monomial object
+        representing them for one ordering.
+
+        Two eviction policies are supported:
+            'weak':     entries disappear once no one else refers to them
+            'bounded':  least recently used entries are dropped once the table
+                        holds more than max_size monomials
+        Evicting an entry never affects correctness: monomials still compare
+        equal structurally, they just stop being shared."""
+    POLICIES = ['weak', 'bounded']
+
+    def __init__(self, policy='weak', max_size=2**16):
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unknown intern policy {policy}. Choose one of '
+                             f'{self.POLICIES}.')
+        if policy == 'bounded' and (type(max_size) is not int or max_size < 1):
+            raise ValueError('Bounded intern tables need a positive max_size.')
+        self.policy = policy
+        self.max_size = max_size
+        # the ordering this table interns for, bound on first use
+        self.order = None
+        self.hits = 0
+        self.misses = 0
+        if policy == 'weak':
+            self._table = WeakValueDictionary()
+        else:
+            self._table = OrderedDict()
+
+    def lookup(self, degrees, order, total_degree=None):
+        table = self._table
+        mon = table.get(degrees)
+        if mon is not None:
+            self.hits += 1
+            if self.policy == 'bounded':
+                table.move_to_end(degrees)
+            return mon
+
+        self.misses += 1
+        mon = Monomial._make(degrees, order, total_degree)
+        table[degrees] = mon
+        if self.policy == 'bounded' and len(table) > self.max_size:
+            table.popitem(last=False)
+        return mon
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def stats(self):
+        return {
+            'policy': self.policy,
+            'size': len(self._table),
+            'max_size': self.max_size if self.policy == 'bounded' else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def clear(self):
+        self._table.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def empty_copy(self):
+        return MonomialInternTable(self.policy, self.max_size)
+
+    def __len__(self):
+        return len(self._table)
+
+    def __reduce__(self):
+        # interned objects belong to one process; ship an empty table
+        return (MonomialInternTable, (self.policy, self.max_size))
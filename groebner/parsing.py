@@ -0,0 +1,204 @@
+import os
+import re
+from fractions import Fraction
+
+from groebner.monomials import Monomial
+from groebner.polynomials import Polynomial
+from groebner.rationals import Rational
+
+
+# Reads expanded polynomials written the way Singular and Macaulay2 print them:
+#   terms joined by + and -, factors joined by * (or just written next to each
+#   other), powers with ^ or **, and integer or fractional coefficients. Like
+#   Singular, products of one letter variables may be run together with
+#   exponents as digits (x2y3 is x^2*y^3) as long as no ring variable has that
+#   name. Terms are collected straight into exponent tuples, so no polynomial
+#   arithmetic happens while parsing.
+
+_TOKEN = re.compile(r'''\s*(?:
+    (?P<num>\d+(?:/\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<pow>\^|\*\*)
+  | (?P<op>[-+*])
+  | (?P<other>\S)
+)''', re.VERBOSE)
+
+# wrappers around a list of polynomials: "I = ideal(", "ideal i =", "{", ...
+_PREFIX = re.compile(r'^\s*(?:ideal\s+)?(?:\w+\s*=\s*)?(?:ideal\s*)?[(\[{\s]*')
+_SUFFIX = re.compile(r'[)\]}\s]*$')
+# -- only starts a comment at the beginning of a line or after a space, so
+#   x--y is still x + y
+_COMMENT = re.compile(r'//.*|(?:^|(?<=\s))--.*|#.*')
+
+
+def parse_polynomial(text, ring):
+    """The polynomial of ring written in text"""
+    return _Parser(ring).parse(text)
+
+
+def parse_polynomials(text, ring):
+    """All polynomials in text, separated by commas, semicolons or newlines"""
+    return list(iter_polynomials(text.splitlines(), ring))
+
+
+def load_polynomials(path, ring):
+    return list(iter_polynomials(path, ring))
+
+
+def iter_polynomials(source, ring):
+    """Yields the polynomials in source (a path, an open file or any iterable
+        of lines) one at a time, so large files are never held in memory.
+
+        Polynomials are separated by commas, semicolons or line breaks; a
+        line ending in +, - or *, or followed by one starting with +, - or *,
+        continues on the next one, so a polynomial with a leading minus sign
+        needs a comma or semicolon before it when it starts a new line.
+        Comments starting with //, -- or # are skipped."""
+    parser = _Parser(ring)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as f:
+            yield from _iter_from_lines(f, parser)
+    else:
+        yield from _iter_from_lines(source, parser)
+
+
+def _iter_from_lines(lines, parser):
+    # a complete line is only parsed once the next one shows it isn't
+    #   continued there
+    pending = ''
+    for line in lines:
+        line = _COMMENT.sub('', line).strip()
+        if not line:
+            continue
+        if pending and pending[-1] not in '+-*^' and line[0] not in '+-*^':
+            yield from _parse_chunks(pending, parser)
+            pending = ''
+        pending += ' ' + line
+    if pending:
+        if pending[-1] in '+-*^':
+            raise ValueError(f'Unexpected end of input after {pending.strip()!r}.')
+        yield from _parse_chunks(pending, parser)
+
+
+def _parse_chunks(text, parser):
+    for chunk in re.split(r'[,;]', text):
+        chunk = _SUFFIX.sub('', _PREFIX.sub('', chunk))
+        if chunk:
+            yield parser.parse(chunk)
+
+
+class _Parser():
+    # ring specific lookups, shared by every polynomial read with it
+    def __init__(self, ring):
+        self.ring = ring
+        self.num_vars = ring.num_vars
+        self.labels = {lbl: i for i, lbl in enumerate(ring.ordering.var_labels)}
+        # Singular style names split into variables, remembered per name
+        self._names = {}
+
+    def parse(self, text):
+        tokens = [(m.lastgroup, m.group(m.lastgroup))
+                  for m in _TOKEN.finditer(text) if m.lastgroup is not None]
+        if not tokens:
+            raise ValueError('No polynomial to parse.')
+        n = self.num_vars
+        terms = {}
+
+        sign = 1
+        coef = Fraction(1)
+        degs = [0]*n
+        has_factor = False
+        # a * still waiting for the factor after it
+        after_star = False
+        i = 0
+        while i < len(tokens):
+            kind, text_ = tokens[i]
+            i += 1
+            if kind == 'op':
+                if text_ == '*':
+                    if not has_factor or after_star:
+                        raise ValueError('Unexpected "*".')
+                    after_star = True
+                    continue
+                if after_star:
+                    raise ValueError(f'Unexpected {text_!r} after "*".')
+                if has_factor:
+                    key = tuple(degs)
+                    terms[key] = terms.get(key, 0) + sign*coef
+                    sign, coef, degs, has_factor = 1, Fraction(1), [0]*n, False
+                if text_ == '-':
+                    sign = -sign
+                continue
+
+            if kind == 'num':
+                try:
+                    value = Fraction(text_)
+                except ZeroDivisionError:
+                    raise ValueError(f'Division by zero in {text_!r}.') from None
+                power, i = self._exponent(tokens, i)
+                coef *= value**power
+            elif kind == 'name':
+                factors = self._variables(text_)
+                power, i = self._exponent(tokens, i)
+                # a power applies to the last variable of a run like x2y
+                for idx, d in factors[:-1]:
+                    degs[idx] += d
+                idx, d = factors[-1]
+                degs[idx] += d*power
+            elif text_ in '()[]{}':
+                raise ValueError('Only expanded polynomials (without '
+                                 'parentheses) can be parsed.')
+            else:
+                raise ValueError(f'Unexpected character {text_!r}.')
+            has_factor = True
+            after_star = False
+
+        if not has_factor or after_star:
+            raise ValueError('Polynomial ends with an operator.')
+        key = tuple(degs)
+        terms[key] = terms.get(key, 0) + sign*coef
+        return self._build(terms)
+
+    def _exponent(self, tokens, i):
+        if i < len(tokens) and tokens[i][0] == 'pow':
+            if i + 1 >= len(tokens) or tokens[i + 1][0] != 'num' or \
+                    '/' in tokens[i + 1][1]:
+                raise ValueError('Exponents must be nonnegative integers.')
+            return int(tokens[i + 1][1]), i + 2
+        return 1, i
+
+    def _variables(self, name):
+        if name in self.labels:
+            return [(self.labels[name], 1)]
+        if name not in self._names:
+            self._names[name] = self._split(name)
+        return self._names[name]
+
+    def _split(self, name):
+        # greedily match the longest variable name, then optional digits
+        factors = []
+        pos = 0
+        labels = sorted(self.labels, key=len, reverse=True)
+        while pos < len(name):
+            lbl = next((l for l in labels if name.startswith(l, pos)), None)
+            if lbl is None:
+                raise ValueError(f'Unknown variable {name!r}.')
+            pos += len(lbl)
+            digits = re.match(r'\d*', name[pos:]).group()
+            pos += len(digits)
+            factors.append((self.labels[lbl], int(digits) if digits else 1))
+        return factors
+
+    def _build(self, terms):
+        ring = self.ring
+        field = ring.field
+        order = ring.ordering
+        zero = field.zero()
+        coefs = {}
+        for degs, c in terms.items():
+            # over GF(p) a nonzero coefficient may still vanish
+            c = field.coerce(Rational(c.numerator, c.denominator))
+            if c != zero:
+                coefs[Monomial._from_tuple(degs, order)] = c
+        # skips Polynomial's validation: every term was built for this ring
+        return Polynomial._new(coefs, ring)
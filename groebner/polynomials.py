@@ -2,6 +2,7 @@ from groebner.rationals import RationalField as QQ
 from groebner.monomials import MonomialOrdering, Monomial
 from groebner.rings import Ring, RingElement
 from groebner.fields import Field
+from groebner import dense
 from random import randint
 
 
@@ -9,13 +10,30 @@ class PolynomialRing(Ring):
     """Represents a polynomial in some number of variables over a variety of
         fields. For base field pass an instance of the Field class."""
 
-    def __init__(self, num_vars=1, labels=None, base_field=QQ(), order='grlex'):
+    # backend='sparse' always multiplies term by term; 'dense' routes products
+    #   and powers through DensePolynomial; 'auto' does so only for few
+    #   variables when both factors fill at least dense_threshold of their
+    #   exponent box.
+    BACKENDS = ['sparse', 'dense', 'auto']
+    DENSE_MAX_VARS = 3
+    # products with fewer term pairs than this aren't worth converting
+    DENSE_MIN_WORK = 256
+
+    def __init__(self, num_vars=1, labels=None, base_field=QQ(), order='grlex',
+                 intern=None, backend='sparse', dense_threshold=0.5):
         # perform input validation
         if not isinstance(base_field, Field):
             raise TypeError("Parameter base_field must inherit from the Field"
                             " class.")
+        if backend not in self.BACKENDS:
+            raise ValueError(f'Unknown backend {backend}. Choose one of '
+                             f'{self.BACKENDS}.')
+        if backend == 'dense':
+            dense._require_numpy()
         
         self.field = base_field
+        self.backend = backend
+        self.dense_threshold = dense_threshold
         
         # save a list of symbols we'll be using
         if labels is None:
@@ -26,10 +44,15 @@ class PolynomialRing(Ring):
 
         # For now we're going to use the graded lexicographical ordering
         # https://en.wikipedia.org/wiki/Monomial_order#Graded_lexicographic_order
+        # The order can also be a block, weight, matrix or elimination ordering
+        #   (see MonomialOrdering).
+        # Passing intern=True (or a MonomialInternTable) makes equal monomials
+        #   of this ring share a single object.
         self.ordering = MonomialOrdering(
             num_vars=self.num_vars,
             labels=labels,
-            order_type=order
+            order_type=order,
+            intern=intern
         )
 
         self.vars = self.ordering.get_vars()
@@ -46,20 +69,131 @@ class PolynomialRing(Ring):
             self
         )
     
-    def random(self, num_terms=10, max_deg=20, denominator_bound=100):
+    def random(self, num_terms=10, max_deg=20, denominator_bound=100, rng=None):
+        # max_deg bounds the degree in each variable; rng is a random.Random
+        #   to draw from instead of the global one
         coefs = {}
         for _ in range(num_terms):
-            mon = self.ordering.random(max_deg)
-            coef = self.field.random(bound=denominator_bound)
+            mon = self.ordering.random(max_deg, rng=rng)
+            coef = self.field.random(bound=denominator_bound, rng=rng)
             coefs[mon] = coef
         
         return Polynomial(coefs, self)
 
+    def parse(self, text):
+        """The polynomial written in text (Singular or Macaulay2 style, e.g.
+            '3/2*x^2*y - z + 1'). See groebner.parsing for files of many."""
+        from groebner.parsing import parse_polynomial
+        return parse_polynomial(text, self)
+
+    def to_dense(self, poly):
+        return dense.DensePolynomial.from_polynomial(self.coerce(poly))
+
+    def hom(self, images, target=None):
+        """The ring map sending the i-th variable of this ring to images[i],
+            into target (by default the ring of the images, or this one if
+            none of them is a polynomial). See groebner.substitution."""
+        from groebner.substitution import RingMap
+        if target is None:
+            target = next((g.ring for g in images if type(g) is Polynomial), self)
+        return RingMap(self, target, images)
+
+    def _use_dense(self, f, g):
+        # decides whether a product f*g goes through the dense backend
+        if self.backend == 'sparse' or dense.np is None:
+            return False
+        if not isinstance(self.field, QQ):
+            return False
+        if self.backend == 'dense':
+            return True
+        return (self.num_vars <= self.DENSE_MAX_VARS
+                and len(f.coefs) * len(g.coefs) >= self.DENSE_MIN_WORK
+                and dense.density(f) >= self.dense_threshold
+                and dense.density(g) >= self.dense_threshold)
+
     def get_vars(self):
         # wrap monomials in polynomial wrappers
         mon_vars = self.ordering.get_vars().values()
 
         return [Polynomial({mon: self.field.one()}, self) for mon in mon_vars]
+
+    def var_index(self, var):
+        """Position of a variable given by its index, label or as a
+            polynomial"""
+        labels = self.ordering.var_labels
+        if type(var) is int and 0 <= var < self.num_vars:
+            return var
+        if type(var) is str and var in labels:
+            return labels.index(var)
+        if type(var) is Polynomial and var in self and len(var.coefs) == 1 and \
+                var.LM().total_degree == 1 and var.LC() == self.field.one():
+            return var.LM().degrees.index(1)
+        raise ValueError(f'{var} is not a variable of {self}.')
+
+    def homogenized_ring(self, label='h'):
+        """This ring with one more variable, last (so smallest) in the same
+            ordering, for homogenizing in"""
+        if label in self.ordering.var_labels:
+            raise ValueError(f'{label} is already a variable of {self}.')
+        order = self.ordering.order_type
+        if order not in self.ordering.SIMPLE_ORDERS:
+            raise NotImplementedError('Homogenization is only implemented for '
+                                      f'the orderings {self.ordering.SIMPLE_ORDERS}.')
+        return PolynomialRing(labels=self.ordering.var_labels + [label],
+                              base_field=self.field, order=order)
+
+    def homogenize(self, polys, label='h'):
+        """Homogenizes a polynomial (or a list of them) of this ring with a
+            new variable, multiplying each term by the power of it that
+            brings it up to the total degree, in homogenized_ring(label).
+            Under grevlex, dehomogenizing a Groebner basis of the homogenized
+            ideal gives a Groebner basis of the original one."""
+        single = type(polys) is not list
+        if single:
+            polys = [polys]
+        ring = self.homogenized_ring(label)
+        order = ring.ordering
+        res = []
+        for f in polys:
+            f = self.coerce(f)
+            zero = self.field.zero()
+            terms = {m: c for m, c in f.coefs.items() if c != zero}
+            d = max([m.total_degree for m in terms], default=0)
+            res.append(Polynomial._new(
+                {Monomial._from_tuple(m.degrees + (d - m.total_degree,), order, d): c
+                 for m, c in terms.items()},
+                ring
+            ))
+        return res[0] if single else res
+
+    def dehomogenize(self, polys):
+        """Sets the last variable of a homogenized ring (see homogenize) to
+            one, giving polynomials of this ring"""
+        single = type(polys) is not list
+        if single:
+            polys = [polys]
+        order = self.ordering
+        res = []
+        for f in polys:
+            labels = f.ring.ordering.var_labels
+            if f.ring.field != self.field or labels[:-1] != order.var_labels:
+                raise TypeError(f'{f} is not from a homogenization of {self}.')
+            zero = self.field.zero()
+            coefs = {}
+            for m, c in f.coefs.items():
+                mon = Monomial._from_tuple(m.degrees[:-1], order)
+                new = coefs.get(mon, zero) + c
+                if new == zero:
+                    coefs.pop(mon, None)
+                else:
+                    coefs[mon] = new
+            res.append(Polynomial._new(coefs, self))
+        return res[0] if single else res
+
+    def jacobian(self, polys, variables=None):
+        """Matrix (list of rows) of the partial derivatives of each polynomial
+            by each variable (all of them by default)"""
+        return [self.coerce(f).gradient(variables) for f in polys]
     
     def coerce(self, x):
         # "coerces" a variable of one type into a polynomial
@@ -70,13 +204,22 @@ class PolynomialRing(Ring):
             return Polynomial({self.ordering.constant_monomial(): x}, self)
         elif type(x) is Monomial:
             return Polynomial({x: self.field.one()}, self)
-        elif type(x) is int or type(x) is float:
-            return Polynomial(
-                {self.ordering.constant_monomial(): self.field.coerce(x)},
-                self
-            )
         else:
-            raise ValueError(f"Can't coerce value {x} to Polynomial.")
+            # ints, floats and elements of other fields the base field knows
+            #   how to convert (e.g. rationals into GF(p))
+            try:
+                c = self.field.coerce(x)
+            except (ValueError, ZeroDivisionError):
+                raise ValueError(f"Can't coerce value {x} to Polynomial.")
+            return Polynomial({self.ordering.constant_monomial(): c}, self)
+
+    def __reduce__(self):
+        # rebuilt from its parameters instead of its monomials
+        o = self.ordering
+        intern = None if o._intern is None else o._intern.empty_copy()
+        return (PolynomialRing, (self.num_vars, o.var_labels, self.field,
+                                 o.order_type, intern, self.backend,
+                                 self.dense_threshold))
 
     def __repr__(self):
         return f'Polynomial ring over {self.field} with indeterminates {list(self.vars.values())}'
@@ -94,6 +237,10 @@ class PolynomialRing(Ring):
 
 class Polynomial(RingElement):
     """Represents a polynomial in some polynomial ring"""
+    # Polynomials are never changed after construction, so the structural
+    #   hash and leading monomial are computed on first use and kept.
+    __slots__ = ('coefs', 'ring', '_hash', '_lm')
+
     def __init__(self, coefs, parent_ring):
         # input validation
         if type(parent_ring) is not PolynomialRing:
@@ -118,23 +265,122 @@ class Polynomial(RingElement):
         if coefs == {}:
             coefs = {parent_ring.ordering.constant_monomial(): parent_ring.field.zero()}         
 
-        self.field = parent_ring.field
         self.ring = parent_ring
         self.coefs = coefs
-        self.order = parent_ring.ordering
+        self._hash = None
+        self._lm = None
+
+    @classmethod
+    def _new(cls, coefs, ring):
+        # skips validation, for nonzero terms we built for ring ourselves
+        if len(coefs) == 0:
+            return ring.zero()
+        poly = object.__new__(cls)
+        poly.coefs = coefs
+        poly.ring = ring
+        poly._hash = None
+        poly._lm = None
+        return poly
+
+    def __reduce__(self):
+        # A compact binary body instead of one pickled object per term. The
+        #   ring is pickled separately, so a pickle stream carries it once.
+        from groebner import serialization
+        return (serialization.unpack_terms, (self.ring, serialization.pack_terms(self)))
+
+    # the field and ordering are shared by the whole ring, so we look them up
+    #   there instead of storing them on every polynomial
+    @property
+    def field(self):
+        return self.ring.field
+
+    @property
+    def order(self):
+        return self.ring.ordering
     
     def copy(self):
         return Polynomial(self.coefs, self.ring)
+
+    def to_dense(self):
+        return dense.DensePolynomial.from_polynomial(self)
+
+    def compile(self):
+        """An Evaluator for this polynomial, for evaluating it at many points
+            (see groebner.evaluation)"""
+        from groebner.evaluation import Evaluator
+        return Evaluator(self)
+
+    def __call__(self, *values):
+        # one-off evaluation; compile once to evaluate repeatedly
+        return self.compile()(*values)
+
+    def diff(self, var, n=1):
+        """n-th partial derivative by a variable (an index, label or variable)"""
+        i = self.ring.var_index(var)
+        if type(n) is not int or n < 0:
+            raise ValueError('Order of a derivative must be a nonnegative integer.')
+        field = self.field
+        order = self.order
+        zero = field.zero()
+        # the falling factorial e! / (e - n)! for each exponent e, converted
+        #   into the field once
+        factors = {}
+        coefs = {}
+        for mon, c in self.coefs.items():
+            e = mon.degrees[i]
+            if e < n or c == zero:
+                continue
+            if e not in factors:
+                f = 1
+                for k in range(e - n + 1, e + 1):
+                    f *= k
+                factors[e] = field.coerce(f)
+            new = c * factors[e]
+            # (in characteristic p the factor can vanish)
+            if new != zero:
+                degs = mon.degrees
+                coefs[Monomial._from_tuple(degs[:i] + (e - n,) + degs[i + 1:],
+                                           order, mon.total_degree - n)] = new
+        return Polynomial._new(coefs, self.ring)
+
+    def gradient(self, variables=None):
+        """Partial derivatives by the given variables (all of them by default)"""
+        if variables is None:
+            variables = range(self.ring.num_vars)
+        return [self.diff(v) for v in variables]
+
+    def subs(self, mapping):
+        """This polynomial with the variables given as keys of mapping
+            (indices, labels or variables) replaced by their values"""
+        from groebner.substitution import substitute
+        return substitute(self, mapping)
+
+    def compose(self, images):
+        """This polynomial with its i-th variable replaced by images[i],
+            which may come from another ring (see PolynomialRing.hom)"""
+        return self.ring.hom(images)(self)
     
     def _total_deg(self):
         return self.LM().total_degree
+
+    def is_homogeneous(self):
+        """Whether all terms have the same total degree"""
+        return len(set([m.total_degree for m in self.coefs])) <= 1
     
     def multidegree(self):
         return self.LM().degrees
     
     def LM(self):
         # Leading monomial
-        return sorted(self.coefs)[-1]
+        lm = self._lm
+        if lm is None:
+            order = self.ring.ordering
+            if order.order_type in order.SIMPLE_ORDERS:
+                lm = max(self.coefs)
+            else:
+                lm = max(self.coefs, key=order.sort_key)
+            self._lm = lm
+        return lm
     
     def LC(self):
         return self.coefs[self.LM()]
@@ -143,25 +389,24 @@ class Polynomial(RingElement):
         return Polynomial({self.LM(): self.LC()}, self.ring)
 
     def __eq__(self, other):
-        try:
-            o = self.ring.coerce(other)
-        except ValueError as e:
-            raise e
+        if self is other:
+            return True
+        if type(other) is not Polynomial:
+            other = self.ring.coerce(other)
+        elif other.ring is not self.ring and other.ring != self.ring:
+            return False
 
-        # check monomials are the same
-        try:
-            assert set(self.coefs) == set(o.coefs)
-        except AssertionError:
+        a, b = self.coefs, other.coefs
+        if len(a) != len(b):
             return False
-        
-        # check coefficients match
-        try:
-            for mon in self.coefs:
-                assert self.coefs[mon] == o.coefs[mon]
-        except AssertionError:
+        # cheap rejections from whatever the two have already computed
+        if self._hash is not None and other._hash is not None and \
+                self._hash != other._hash:
             return False
-        
-        return True
+        if self._lm is not None and other._lm is not None and \
+                self._lm != other._lm:
+            return False
+        return a == b
     
     def __lt__(self, other):
         try:
@@ -203,8 +448,11 @@ class Polynomial(RingElement):
         return Polynomial(coefs, self.ring)
     
     def __hash__(self):
-        # piggyback off strings
-        return hash(self.__repr__())
+        # structural: built from the terms, independent of their order
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(frozenset(self.coefs.items()))
+        return h
     
     def __sub__(self, other):
         return self.__add__(-1*other)
@@ -217,14 +465,25 @@ class Polynomial(RingElement):
             power = int(power)
         except:
             raise TypeError(f'Power of polynomial must be integer. Got type {type(power)}')
+
+        if power > 1 and self.ring._use_dense(self, self):
+            return (self.to_dense()**power).to_polynomial()
         
+        # square and multiply
         ret = self.ring.one()
-        for _ in range(power):
-            ret = self.__mul__(ret)
+        base = self
+        while power > 0:
+            if power & 1:
+                ret = base.__mul__(ret)
+            power >>= 1
+            if power > 0:
+                base = base.__mul__(base)
         return ret
     
     def __mul__(self, other):
         multiplicand = self.ring.coerce(other)
+        if self.ring._use_dense(self, multiplicand):
+            return (self.to_dense() * multiplicand.to_dense()).to_polynomial()
         # TODO: there is probably a faster way to do this
         coefs = {}
         for mon1 in self.coefs:
@@ -257,12 +516,21 @@ class Polynomial(RingElement):
                         s += str(coef)
                     first = False
                 else:
-                    if coef > 0:
-                        s += ' + '
-                    else:
+                    if _is_negative(coef):
                         s += ' - '
+                        coef = -coef
+                    else:
+                        s += ' + '
                     
-                    if abs(coef) != 1 or is_constant_term:
-                        s += str(abs(coef))
+                    if coef != 1 or is_constant_term:
+                        s += str(coef)
                 s += str(mon)
         return s
+
+
+def _is_negative(coef):
+    # fields like GF(p) aren't ordered, so every coefficient is "positive"
+    try:
+        return coef < 0
+    except NotImplementedError:
+        return False
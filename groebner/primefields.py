@@ -0,0 +1,150 @@
+from random import randint
+from groebner.fields import Field, FieldElement
+
+
+def is_prime(n):
+    # deterministic Miller-Rabin for n < 3.3 * 10^24, probabilistic above
+    if n < 2:
+        return False
+    small = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+    for p in small:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in small:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def primes_below(n):
+    """Yields primes smaller than n in decreasing order"""
+    n -= 1
+    while n >= 2:
+        if is_prime(n):
+            yield n
+        n -= 1
+
+
+class PrimeField(Field):
+    """The field of integers modulo a prime p, GF(p)"""
+    def __init__(self, p):
+        if type(p) is not int or not is_prime(p):
+            raise ValueError(f'{p} is not a prime.')
+        self.p = p
+        super().__init__(f'the integers modulo {p}', PrimeFieldElement)
+        self._one = PrimeFieldElement(1, self)
+        self._zero = PrimeFieldElement(0, self)
+
+    def one(self):
+        return self._one
+
+    def zero(self):
+        return self._zero
+
+    def random(self, bound=None, rng=None):
+        # bound is accepted for compatibility with the other fields
+        rand = randint if rng is None else rng.randint
+        return PrimeFieldElement(rand(0, self.p - 1), self)
+
+    def coerce(self, x):
+        if type(x) is PrimeFieldElement and x.field == self:
+            return x
+        if type(x) is int:
+            return PrimeFieldElement(x, self)
+        # anything with a numerator and denominator (i.e. Rationals)
+        try:
+            num, den = x.num, x.den
+        except AttributeError:
+            raise ValueError(f"Can't coerce value {x} to {self}.")
+        if den % self.p == 0:
+            raise ZeroDivisionError(f'Denominator of {x} vanishes modulo {self.p}.')
+        return PrimeFieldElement(num * pow(den, self.p - 2, self.p), self)
+
+    def __contains__(self, other):
+        return type(other) is PrimeFieldElement and other.field == self
+
+    def __eq__(self, other):
+        return type(other) is PrimeField and other.p == self.p
+
+    def __hash__(self):
+        return hash(('GF', self.p))
+
+
+class PrimeFieldElement(FieldElement):
+    """An element of GF(p), stored as its representative in [0, p)"""
+    __slots__ = ('value', 'field')
+
+    def __init__(self, value, field):
+        self.value = value % field.p
+        self.field = field
+
+    @property
+    def ring(self):
+        return self.field
+
+    def _new(self, value):
+        elt = object.__new__(PrimeFieldElement)
+        elt.value = value % self.field.p
+        elt.field = self.field
+        return elt
+
+    def mul_inv(self):
+        if self.value == 0:
+            raise ZeroDivisionError
+        return self._new(pow(self.value, self.field.p - 2, self.field.p))
+
+    def __add__(self, other):
+        o = self.field.coerce(other)
+        return self._new(self.value + o.value)
+
+    def __neg__(self):
+        return self._new(-self.value)
+
+    def __sub__(self, other):
+        o = self.field.coerce(other)
+        return self._new(self.value - o.value)
+
+    def __rsub__(self, other):
+        o = self.field.coerce(other)
+        return self._new(o.value - self.value)
+
+    def __mul__(self, other):
+        try:
+            o = self.field.coerce(other)
+        except ValueError:
+            return other.__rmul__(self)
+        return self._new(self.value * o.value)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        o = self.field.coerce(other)
+        return self.__mul__(o.mul_inv())
+
+    def __eq__(self, other):
+        try:
+            o = self.field.coerce(other)
+        except (ValueError, ZeroDivisionError):
+            return False
+        return self.value == o.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __int__(self):
+        return self.value
+
+    def __repr__(self):
+        return str(self.value)
@@ -0,0 +1,281 @@
+from groebner.monomials import Monomial
+from groebner.polynomials import Polynomial
+from groebner.rings import Ring, RingElement
+
+
+class QuotientRing(Ring):
+    """The quotient k[x_1, ..., x_n]/I of a polynomial ring by a
+        zero-dimensional ideal I, given as a GroebnerIdeal.
+
+        The quotient is a finite dimensional vector space with a basis of
+        standard monomials (those not divisible by any leading monomial of the
+        Groebner basis). Elements are stored as dense coefficient vectors in
+        that basis. Multiplication by each variable is precomputed once as a
+        matrix, so products and images of polynomials are matrix-vector work
+        instead of polynomial division."""
+    def __init__(self, ideal):
+        self.ideal = ideal
+        self.base_ring = ideal.ring
+        self.field = ideal.ring.field
+        order = self.base_ring.ordering
+        n = self.base_ring.num_vars
+
+        leads = [g.LM().degrees for g in ideal.basis]
+        if any(sum(d) == 0 for d in leads):
+            raise ValueError('Ideal is the whole ring, so the quotient is zero.')
+        for i in range(n):
+            if not any(d[i] > 0 and sum(d) == d[i] for d in leads):
+                raise ValueError('Quotient rings are only implemented for '
+                                 'zero-dimensional ideals.')
+
+        # the standard monomials form a staircase, so we can walk up from 1
+        standard = set()
+        todo = [tuple([0]*n)]
+        while todo:
+            degs = todo.pop()
+            if degs in standard or _divisible(degs, leads):
+                continue
+            standard.add(degs)
+            for i in range(n):
+                todo.append(degs[:i] + (degs[i] + 1,) + degs[i+1:])
+        self.basis = sorted(Monomial._from_tuple(d, order) for d in standard)
+        self._index = {m.degrees: i for i, m in enumerate(self.basis)}
+        self.dimension = len(self.basis)
+
+        # Each standard monomial (other than 1) is x_i times a smaller standard
+        #   monomial; remember one such factorisation for building products.
+        self._parents = [None]
+        for m in self.basis[1:]:
+            i = next(i for i, d in enumerate(m.degrees) if d > 0)
+            k = self._index[m.degrees[:i] + (m.degrees[i] - 1,) + m.degrees[i+1:]]
+            self._parents.append((i, k))
+
+        # Multiplication tables: column j of variable i describes x_i * b_j,
+        #   either as the index of another standard monomial or as the dense
+        #   vector of its normal form.
+        self._tables = []
+        for i in range(n):
+            cols = []
+            for m in self.basis:
+                degs = m.degrees[:i] + (m.degrees[i] + 1,) + m.degrees[i+1:]
+                if degs in self._index:
+                    cols.append(self._index[degs])
+                else:
+                    nf = ideal.reducer.normal_form(
+                        Polynomial({Monomial._from_tuple(degs, order): self.field.one()},
+                                   self.base_ring)
+                    )
+                    cols.append(self._vector_of(nf))
+            self._tables.append(cols)
+
+        # vectors of monomials already evaluated, keyed by exponents
+        self._monomial_vectors = {}
+
+        super().__init__('quotient ring', QuotientRingElement,
+                         is_commutative=True)
+
+    def one(self):
+        v = [self.field.zero()]*self.dimension
+        v[0] = self.field.one()
+        return QuotientRingElement(v, self)
+
+    def zero(self):
+        return QuotientRingElement([self.field.zero()]*self.dimension, self)
+
+    def gens(self):
+        # images of the variables
+        return [self.coerce(x) for x in self.base_ring.get_vars()]
+
+    def multiplication_matrix(self, var):
+        """Dense matrix (list of rows) of multiplication by the variable with
+            index var in the standard monomial basis"""
+        D = self.dimension
+        zero, one = self.field.zero(), self.field.one()
+        rows = [[zero]*D for _ in range(D)]
+        for j, col in enumerate(self._tables[var]):
+            if type(col) is int:
+                rows[col][j] = one
+            else:
+                for r in range(D):
+                    rows[r][j] = col[r]
+        return rows
+
+    def coerce(self, x):
+        if type(x) is QuotientRingElement and x.ring == self:
+            return x
+        if type(x) is Polynomial:
+            if x.ring != self.base_ring:
+                raise ValueError(f"Can't coerce {x} from a different ring.")
+            return self.evaluate(x)
+        return self.evaluate(self.base_ring.coerce(x))
+
+    def evaluate(self, poly, at=None):
+        """Image of poly in the quotient. If at is a list of quotient ring
+            elements, computes poly(at[0], ..., at[n-1]) instead."""
+        poly = self.base_ring.coerce(poly)
+        if at is not None:
+            return self._evaluate_at(poly, [self.coerce(a) for a in at])
+        v = [self.field.zero()]*self.dimension
+        for mon, c in poly.coefs.items():
+            w = self._monomial_vector(mon.degrees)
+            v = [a + c*b for a, b in zip(v, w)]
+        return QuotientRingElement(v, self)
+
+    def _monomial_vector(self, degs):
+        # walk down one degree at a time to a standard or already known
+        #   monomial, then multiply back up by the variables dropped on the way
+        chain = []
+        while degs not in self._index and degs not in self._monomial_vectors:
+            i = next(i for i, d in enumerate(degs) if d > 0)
+            chain.append((degs, i))
+            degs = degs[:i] + (degs[i] - 1,) + degs[i+1:]
+        if degs in self._index:
+            v = [self.field.zero()]*self.dimension
+            v[self._index[degs]] = self.field.one()
+        else:
+            v = self._monomial_vectors[degs]
+        for degs, i in reversed(chain):
+            v = self._apply(i, v)
+            self._monomial_vectors[degs] = v
+        return v
+
+    def _evaluate_at(self, poly, elements):
+        # powers of each substituted element are shared by all terms
+        powers = [[self.one()] for _ in elements]
+        res = self.zero()
+        for mon, c in poly.coefs.items():
+            term = self.one()
+            for i, d in enumerate(mon.degrees):
+                while len(powers[i]) <= d:
+                    powers[i].append(powers[i][-1] * elements[i])
+                if d > 0:
+                    term = term * powers[i][d]
+            res = res + term * c
+        return res
+
+    def _apply(self, var, v):
+        # multiplication by a variable: sparse matrix-vector product
+        res = [self.field.zero()]*self.dimension
+        zero = self.field.zero()
+        for j, col in enumerate(self._tables[var]):
+            a = v[j]
+            if a == zero:
+                continue
+            if type(col) is int:
+                res[col] = res[col] + a
+            else:
+                res = [r + a*c for r, c in zip(res, col)]
+        return res
+
+    def _vector_of(self, nf):
+        # nf must only involve standard monomials
+        v = [self.field.zero()]*self.dimension
+        for mon, c in nf.coefs.items():
+            if c != self.field.zero():
+                v[self._index[mon.degrees]] = c
+        return v
+
+    def __contains__(self, other):
+        return type(other) is QuotientRingElement and other.ring == self
+
+    def __eq__(self, other):
+        if type(other) is not QuotientRing:
+            return False
+        return self is other or (self.base_ring == other.base_ring and
+                                 self.ideal.basis == other.ideal.basis)
+
+    def __hash__(self):
+        return hash(tuple(m.degrees for m in self.basis))
+
+    def __repr__(self):
+        return (f'Quotient of {self.base_ring} by the ideal generated by '
+                f'{self.ideal.basis}')
+
+
+class QuotientRingElement(RingElement):
+    """Element of a QuotientRing stored as its coefficient vector in the basis
+        of standard monomials"""
+    __slots__ = ('vector', 'ring')
+
+    def __init__(self, vector, ring):
+        if len(vector) != ring.dimension:
+            raise ValueError(f'Expected a vector of length {ring.dimension}.')
+        self.vector = vector
+        self.ring = ring
+
+    def to_polynomial(self):
+        """The normal form of this element as a polynomial"""
+        ring = self.ring
+        return Polynomial(
+            {m: c for m, c in zip(ring.basis, self.vector)
+             if c != ring.field.zero()},
+            ring.base_ring
+        )
+
+    def __add__(self, other):
+        o = self.ring.coerce(other)
+        return QuotientRingElement(
+            [a + b for a, b in zip(self.vector, o.vector)], self.ring
+        )
+
+    def __neg__(self):
+        return QuotientRingElement([-a for a in self.vector], self.ring)
+
+    def __sub__(self, other):
+        return self.__add__(self.ring.coerce(other).__neg__())
+
+    def __rsub__(self, other):
+        return self.__neg__().__add__(other)
+
+    def __mul__(self, other):
+        ring = self.ring
+        if other in ring.field or type(other) is int:
+            c = ring.field.coerce(other)
+            return QuotientRingElement([a*c for a in self.vector], ring)
+        o = ring.coerce(other)
+        zero = ring.field.zero()
+        # self * o = sum_j self_j * (b_j * o), where each b_j * o comes from
+        #   a smaller b_k * o by one multiplication by a variable
+        partial = [o.vector]
+        res = [a*self.vector[0] for a in o.vector]
+        for j in range(1, ring.dimension):
+            i, k = ring._parents[j]
+            partial.append(ring._apply(i, partial[k]))
+            c = self.vector[j]
+            if c != zero:
+                res = [r + c*w for r, w in zip(res, partial[j])]
+        return QuotientRingElement(res, ring)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __pow__(self, power):
+        power = int(power)
+        if power < 0:
+            raise ValueError('Power of ring element must be nonnegative.')
+        ret = self.ring.one()
+        base = self
+        while power > 0:
+            if power & 1:
+                ret = ret * base
+            power >>= 1
+            if power > 0:
+                base = base * base
+        return ret
+
+    def __eq__(self, other):
+        try:
+            o = self.ring.coerce(other)
+        except (ValueError, TypeError):
+            return False
+        return self.vector == o.vector
+
+    def __hash__(self):
+        return hash(tuple(self.vector))
+
+    def __repr__(self):
+        return f'[{self.to_polynomial()}]'
+
+
+def _divisible(degs, leads):
+    return any(all(a >= b for a, b in zip(degs, lead)) for lead in leads)
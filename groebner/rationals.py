@@ -1,7 +1,13 @@
+from math import gcd
 from random import randint
+from sys import hash_info
 from groebner.fields import Field, FieldElement
 from warnings import warn
 
+# parameters of Python's hash for numbers (see Rational.__hash__)
+_HASH_MODULUS = hash_info.modulus
+_HASH_INF = hash_info.inf
+
 
 class RationalField(Field):
     """The rational number field, QQ"""
@@ -9,17 +15,19 @@ class RationalField(Field):
         super().__init__("the rational numbers", Rational)
 
     def one(self):
-        return Rational(1, 1)
+        # rationals are immutable, so the constants can be shared
+        return _ONE
 
     def zero(self):
-        return Rational(0, 1)
+        return _ZERO
         
-    def random(self, bound=10**10):
+    def random(self, bound=10**10, rng=None):
         # returns a "random" (for some definition of random) rational
-        # between 0 and 1
-        sgn = (-1)**randint(0, 1)
-        den = randint(1, bound)
-        num = randint(0, den)
+        # between 0 and 1, drawn from rng (a random.Random) if given
+        rand = randint if rng is None else rng.randint
+        sgn = (-1)**rand(0, 1)
+        den = rand(1, bound)
+        num = rand(0, den)
         return Rational(sgn*num, den)
 
     def coerce(self, x):
@@ -52,14 +60,25 @@ class RationalField(Field):
 
 
 class Rational(FieldElement):
-    """Simple implementation of rational numbers"""
-    def __init__(self, num, den):
-        self.field = RationalField()
-        super().__init__(self.field)
+    """Simple implementation of rational numbers. Instances are immutable and
+        only store their (reduced) numerator and denominator; the field is
+        shared by the whole class."""
+    __slots__ = ('num', 'den')
 
+    def __init__(self, num, den):
         # input validation
         if den == 0:
             raise ZeroDivisionError('Denominator cannot be zero.')
+        if type(num) is int and type(den) is int:
+            # fast path for the overwhelmingly common case
+            if den < 0:
+                num, den = -num, -den
+            g = gcd(num, den)
+            if g != 1:
+                num, den = num // g, den // g
+            self.num = num
+            self.den = den
+            return
         try:
             assert int(num) == num and int(den) == den
             num, den = int(num), int(den)
@@ -90,9 +109,10 @@ class Rational(FieldElement):
         return Rational(self.den, self.num)
     
     def _reduce(self):
+        # only ever called during construction; instances are immutable after
         g = self._gcd(self.num, self.den)
 
-        self.num, self.den = int(self.num/g), int(self.den/g)
+        self.num, self.den = self.num // g, self.den // g
 
     def _gcd(self, a, b):
         # TODO: implement gcd algorithm instead of using the math library
@@ -121,6 +141,17 @@ class Rational(FieldElement):
             except:
                 raise TypeError('No acceptable definition of multiplication')
 
+    def __neg__(self):
+        return Rational(-self.num, self.den)
+
+    def __sub__(self, other):
+        other = self.field.coerce(other)
+        return Rational(self.num*other.den - other.num*self.den,
+                        self.den*other.den)
+
+    def __rsub__(self, other):
+        return self.__neg__().__add__(other)
+
     def __truediv__(self, other):
         # division is multiplication
         o = self.field.coerce(other)
@@ -130,6 +161,9 @@ class Rational(FieldElement):
         return self.__mul__(o.mul_inv())
     
     def __eq__(self, other):
+        if type(other) is Rational:
+            # both are reduced with positive denominators
+            return self.num == other.num and self.den == other.den
         try:
             other = self.field.coerce(other)
         except ValueError:
@@ -138,6 +172,21 @@ class Rational(FieldElement):
         
         return self.num*other.den == self.den*other.num
     
+    def __hash__(self):
+        # Python's hash for rationals, so a Rational hashes like an equal int
+        #   (or fractions.Fraction)
+        if self.den == 1:
+            return hash(self.num)
+        try:
+            inv = pow(self.den, -1, _HASH_MODULUS)
+        except ValueError:
+            # denominator divisible by the modulus
+            h = _HASH_INF
+        else:
+            h = hash(hash(abs(self.num)) * inv)
+        h = h if self.num >= 0 else -h
+        return -2 if h == -1 else h
+
     # QQ is totally ordered
     def __lt__(self, other):
         o = self.field.coerce(other)
@@ -161,7 +210,6 @@ class Rational(FieldElement):
     def __int__(self):
         # the more pythonic thing would probably be to just convert blindly
         #   but I am afraid of silent lossy conversion
-        self._reduce()
         if self.den == 1:
             return self.num
         else:
@@ -169,7 +217,8 @@ class Rational(FieldElement):
                              ' coerced to int.')
     
     def __float__(self):
-        return float(self.num)/self.den
+        # int / int is correctly rounded even when both are too big for floats
+        return self.num / self.den
 
     def __repr__(self):
         # returns a string representation of this fraction
@@ -178,3 +227,9 @@ class Rational(FieldElement):
             return str(self.num)
         else:
             return f'{self.num}/{self.den}'
+
+
+# every rational shares the same field (and ring) rather than storing its own
+Rational.field = Rational.ring = RationalField()
+_ONE = Rational(1, 1)
+_ZERO = Rational(0, 1)
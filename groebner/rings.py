@@ -32,6 +32,9 @@ class Ring:
 
 class RingElement:
     """Parent class for elements in some ring"""
+    # no per-instance dict here so that subclasses are free to use __slots__
+    __slots__ = ()
+
     def __init__(self, ring):
         self.ring = ring
 
@@ -99,3 +102,20 @@ class RingElement:
     
     def __repr__(self):
         return f'Element of {self.ring}'
+
+
+def _power_from_table(table, e, mul):
+    # x**e for a table mapping exponents to the powers of x known so far
+    #   (including 1). Each step multiplies by the largest known power that
+    #   doesn't overshoot, and every power passed on the way is added to the
+    #   table for later calls.
+    if e in table:
+        return table[e]
+    known = max(k for k in table if k < e)
+    val = table[known]
+    while known < e:
+        step = max(k for k in table if k <= e - known)
+        val = mul(val, table[step])
+        known += step
+        table[known] = val
+    return val
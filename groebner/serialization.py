@@ -0,0 +1,363 @@
+import json
+import mmap
+import sys
+from array import array
+from math import gcd
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from groebner.monomials import Monomial
+from groebner.polynomials import Polynomial, PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational, RationalField
+
+
+# Layout of a serialized list of polynomials (all integers little endian):
+#
+#   magic       b'GRBN' followed by a version byte and a flag byte (1 when a
+#               single polynomial rather than a list was written)
+#   header      varint length + JSON with the variables, ordering and field
+#   counts      varint number of polynomials, then a varint term count each
+#   exponents   width byte (1, 2, 4 or 8), zero padding up to a multiple of 8
+#               bytes, then one row of num_vars unsigned exponents per term
+#   coefs       per term: zigzag varint numerator and varint denominator over
+#               QQ, or a varint representative over GF(p)
+#
+# Padding the exponent matrix lets load_arrays map it straight into a NumPy
+#   array without copying. Varints grow as needed, so big integers need no
+#   special casing.
+MAGIC = b'GRBN'
+VERSION = 1
+WIDTHS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def dumps(polys):
+    """Serializes a Polynomial or a list of polynomials from one ring"""
+    single = type(polys) is Polynomial
+    if single:
+        polys = [polys]
+    if len(polys) == 0:
+        raise ValueError('Need at least one polynomial to serialize.')
+    ring = polys[0].ring
+    if any(f not in ring for f in polys):
+        raise TypeError('Polynomials must all come from the same ring.')
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out.append(1 if single else 0)
+    header = json.dumps(_ring_header(ring), separators=(',', ':')).encode()
+    _write_varint(out, len(header))
+    out += header
+
+    terms = [_nonzero_terms(f) for f in polys]
+    _write_varint(out, len(terms))
+    for t in terms:
+        _write_varint(out, len(t))
+    _write_exponents(out, [d for t in terms for d, _ in t], ring.num_vars, align=True)
+    write = _coef_writer(ring.field)
+    for t in terms:
+        for _, c in t:
+            write(out, c)
+    return bytes(out)
+
+
+def loads(data, ring=None):
+    """Inverse of dumps. Pass ring to reuse an existing (matching) ring."""
+    view = memoryview(data)
+    single, ring, counts, pos = _read_prefix(view, ring)
+    exponents, pos = _read_exponents(view, pos, sum(counts), ring.num_vars)
+    read = _coef_reader(ring.field)
+    polys = []
+    start = 0
+    for count in counts:
+        coefs = {}
+        for degs in exponents[start:start + count]:
+            c, pos = read(view, pos)
+            coefs[Monomial._from_tuple(degs, ring.ordering)] = c
+        start += count
+        polys.append(Polynomial._new(coefs, ring))
+    return polys[0] if single else polys
+
+
+def dump(polys, path):
+    with open(path, 'wb') as f:
+        f.write(dumps(polys))
+
+
+def load(path, ring=None):
+    with open(path, 'rb') as f:
+        return loads(f.read(), ring)
+
+
+def load_arrays(path, ring=None):
+    """Memory maps a serialized file and exposes its exponent matrix as a
+        NumPy array backed directly by the file (no copy is made).
+        Coefficients are only decoded when asked for."""
+    if np is None:
+        raise ImportError('load_arrays requires numpy. Install it with '
+                          '`pip install numpy`.')
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(buf)
+    single, ring, counts, pos = _read_prefix(view, ring)
+    if pos >= len(view):
+        raise ValueError('Truncated data.')
+    width = view[pos]
+    if width not in WIDTHS:
+        raise ValueError(f'Invalid exponent width {width}.')
+    pos = _aligned(pos + 1)
+    total = sum(counts)
+    n = ring.num_vars
+    if pos + total * n * width > len(view):
+        raise ValueError('Truncated data.')
+    exponents = np.frombuffer(buf, dtype=f'<u{width}', count=total * n,
+                              offset=pos).reshape(total, n)
+    return PackedPolynomials(ring, exponents, counts,
+                             (buf, pos + total * n * width), single)
+
+
+class PackedPolynomials():
+    """Polynomials loaded by load_arrays: a (num_terms x num_vars) exponent
+        matrix shared by all of them, where polynomial i owns the rows
+        offsets[i]:offsets[i+1]"""
+    def __init__(self, ring, exponents, counts, coef_source, single=False):
+        self.ring = ring
+        self.exponents = exponents
+        self.offsets = [0]
+        for count in counts:
+            self.offsets.append(self.offsets[-1] + count)
+        self.single = single
+        # the mapped buffer and where its coefficients start
+        self._coef_source = coef_source
+        self._coefficients = None
+
+    def coefficients(self):
+        """All coefficients in the same order as the exponent rows"""
+        if self._coefficients is None:
+            buf, pos = self._coef_source
+            view = memoryview(buf)
+            read = _coef_reader(self.ring.field)
+            coefs = []
+            for _ in range(self.offsets[-1]):
+                c, pos = read(view, pos)
+                coefs.append(c)
+            self._coefficients = coefs
+        return self._coefficients
+
+    def to_polynomials(self):
+        order = self.ring.ordering
+        coefs = self.coefficients()
+        rows = [tuple(int(a) for a in row) for row in self.exponents.tolist()]
+        polys = []
+        for i in range(len(self)):
+            lo, hi = self.offsets[i], self.offsets[i + 1]
+            polys.append(Polynomial._new(
+                {Monomial._from_tuple(rows[k], order): coefs[k] for k in range(lo, hi)},
+                self.ring
+            ))
+        return polys
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+# Pickling support (see Polynomial.__reduce__ and PolynomialRing.__reduce__).
+#   The ring is pickled once per pickle stream and every polynomial after it
+#   is a single bytes object.
+
+def pack_terms(poly):
+    """Terms of poly without any ring information"""
+    out = bytearray()
+    terms = _nonzero_terms(poly)
+    _write_varint(out, len(terms))
+    _write_exponents(out, [d for d, _ in terms], poly.ring.num_vars)
+    write = _coef_writer(poly.ring.field)
+    for _, c in terms:
+        write(out, c)
+    return bytes(out)
+
+
+def unpack_terms(ring, data):
+    view = memoryview(data)
+    count, pos = _read_varint(view, 0)
+    exponents, pos = _read_exponents(view, pos, count, ring.num_vars, align=False)
+    read = _coef_reader(ring.field)
+    order = ring.ordering
+    coefs = {}
+    for degs in exponents:
+        c, pos = read(view, pos)
+        coefs[Monomial._from_tuple(degs, order)] = c
+    return Polynomial._new(coefs, ring)
+
+
+# Helpers
+
+def _nonzero_terms(poly):
+    zero = poly.ring.field.zero()
+    return [(m.degrees, c) for m, c in poly.coefs.items() if c != zero]
+
+
+def _ring_header(ring):
+    field = ring.field
+    if isinstance(field, RationalField):
+        field_desc = 'QQ'
+    elif isinstance(field, PrimeField):
+        field_desc = ['GF', field.p]
+    else:
+        raise NotImplementedError(f'Serialization is not implemented over {field}.')
+    return {
+        'vars': ring.ordering.var_labels,
+        'order': ring.ordering.order_type,
+        'field': field_desc,
+    }
+
+
+def _ring_from_header(header, ring=None):
+    if type(header) is not dict or \
+            any(k not in header for k in ['vars', 'order', 'field']):
+        raise ValueError('Invalid header.')
+    desc = header['field']
+    if desc == 'QQ':
+        field = RationalField()
+    elif type(desc) is list and len(desc) == 2 and desc[0] == 'GF' and \
+            type(desc[1]) is int:
+        field = PrimeField(desc[1])
+    else:
+        raise ValueError('Invalid header.')
+    try:
+        new = PolynomialRing(labels=header['vars'], base_field=field,
+                             order=header['order'])
+    except (TypeError, KeyError, IndexError):
+        raise ValueError('Invalid header.') from None
+    if ring is None:
+        return new
+    if ring != new:
+        raise ValueError('Serialized polynomials come from a different ring.')
+    return ring
+
+
+def _read_prefix(view, ring):
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError('Not a serialized polynomial.')
+    if len(view) < 6:
+        raise ValueError('Truncated data.')
+    if view[4] != VERSION:
+        raise ValueError(f'Unsupported serialization version {view[4]}.')
+    single = view[5] == 1
+    length, pos = _read_varint(view, 6)
+    if pos + length > len(view):
+        raise ValueError('Truncated data.')
+    header = json.loads(bytes(view[pos:pos + length]).decode())
+    ring = _ring_from_header(header, ring)
+    pos += length
+    num, pos = _read_varint(view, pos)
+    counts = []
+    for _ in range(num):
+        count, pos = _read_varint(view, pos)
+        counts.append(count)
+    return single, ring, counts, pos
+
+
+def _aligned(pos):
+    return -(-pos // 8) * 8
+
+
+def _write_exponents(out, rows, num_vars, align=False):
+    largest = max([max(d) for d in rows if d], default=0)
+    width = next(w for w in WIDTHS if largest < 256**w)
+    out.append(width)
+    if align:
+        out += bytes(_aligned(len(out)) - len(out))
+    flat = array(WIDTHS[width], [a for d in rows for a in d])
+    if sys.byteorder == 'big':
+        flat.byteswap()
+    out += flat.tobytes()
+
+
+def _read_exponents(view, pos, count, num_vars, align=True):
+    if pos >= len(view):
+        raise ValueError('Truncated data.')
+    width = view[pos]
+    if width not in WIDTHS:
+        raise ValueError(f'Invalid exponent width {width}.')
+    pos += 1
+    if align:
+        pos = _aligned(pos)
+    size = count * num_vars * width
+    if pos + size > len(view):
+        raise ValueError('Truncated data.')
+    flat = array(WIDTHS[width])
+    flat.frombytes(view[pos:pos + size])
+    if sys.byteorder == 'big':
+        flat.byteswap()
+    flat = flat.tolist()
+    rows = [tuple(flat[i:i + num_vars]) for i in range(0, len(flat), num_vars)]
+    return rows, pos + size
+
+
+def _coef_writer(field):
+    if isinstance(field, RationalField):
+        def write(out, c):
+            _write_varint(out, _zigzag(c.num))
+            _write_varint(out, c.den)
+    elif isinstance(field, PrimeField):
+        def write(out, c):
+            _write_varint(out, c.value)
+    else:
+        raise NotImplementedError(f'Serialization is not implemented over {field}.')
+    return write
+
+
+def _coef_reader(field):
+    if isinstance(field, RationalField):
+        def read(view, pos):
+            num, pos = _read_varint(view, pos)
+            den, pos = _read_varint(view, pos)
+            # written in lowest terms, so the constructor's normalisation can
+            #   be skipped; only check the data isn't corrupt
+            num = _unzigzag(num)
+            if den == 0 or gcd(num, den) != 1:
+                raise ValueError('Corrupt rational coefficient.')
+            c = object.__new__(Rational)
+            c.num = num
+            c.den = den
+            return c, pos
+    else:
+        def read(view, pos):
+            value, pos = _read_varint(view, pos)
+            return field.coerce(value), pos
+    return read
+
+
+def _zigzag(n):
+    return 2*n if n >= 0 else -2*n - 1
+
+
+def _unzigzag(z):
+    return z >> 1 if z & 1 == 0 else -((z + 1) >> 1)
+
+
+def _write_varint(out, n):
+    # LEB128: seven bits per byte, high bit set on all but the last
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(view, pos):
+    result = 0
+    shift = 0
+    while True:
+        try:
+            b = view[pos]
+        except IndexError:
+            raise ValueError('Truncated data.')
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
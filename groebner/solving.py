@@ -0,0 +1,97 @@
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from groebner.quotients import QuotientRing
+from groebner.rationals import RationalField
+
+
+# A (complex) point of the variety with its multiplicity as a root of the ideal
+Solution = namedtuple('Solution', ['point', 'multiplicity'])
+
+
+def solve(ideal, cluster_tol=1e-5, seed=None):
+    """All complex solutions of a zero-dimensional GroebnerIdeal over QQ.
+
+        Works in the quotient algebra: a random linear combination M of the
+        variables' multiplication matrices has one eigenvalue per solution
+        (repeated according to multiplicity), and the commuting
+        multiplication matrices restricted to the corresponding (generalized)
+        eigenspace read off the coordinates. The Groebner basis can be in any
+        ordering; no lex basis is needed.
+
+        Eigenvalues closer than cluster_tol (relative to the spectrum) are
+        treated as one multiple solution. A root of multiplicity m is only
+        resolved to about 1/m of double precision, so systems with highly
+        multiple roots may need a larger cluster_tol. Returns a list of
+        Solution tuples."""
+    if np is None:
+        raise ImportError('Solving requires numpy. Install it with `pip install numpy`.')
+    if not isinstance(ideal.ring.field, RationalField):
+        raise NotImplementedError('Numerical solving is only implemented over QQ.')
+    if ideal.ring.one() in ideal:
+        # no solutions at all
+        return []
+
+    Q = QuotientRing(ideal)
+    n = ideal.ring.num_vars
+    D = Q.dimension
+    mats = np.array([
+        [[float(c) for c in row] for row in Q.multiplication_matrix(i)]
+        for i in range(n)
+    ]).reshape(n, D, D)
+
+    rng = np.random.default_rng(seed)
+    M = np.tensordot(rng.uniform(0.5, 1.5, n) * rng.choice([-1, 1], n), mats, axes=1)
+    vals, vecs = np.linalg.eig(M)
+
+    clusters = _cluster(vals, cluster_tol * max(1.0, float(np.max(np.abs(vals)))))
+
+    solutions = []
+    simple = [c[0] for c in clusters if len(c) == 1]
+    if simple:
+        # M_i v = x_i v on a common eigenvector v, so x_i = v^H M_i v / v^H v
+        V = vecs[:, simple]
+        norms = np.sum(np.abs(V)**2, axis=0)
+        coords = np.array([np.sum(V.conj() * (Mi @ V), axis=0) for Mi in mats]) / norms
+        for k in range(len(simple)):
+            solutions.append(Solution(tuple(complex(x) for x in coords[:, k]), 1))
+
+    for cluster in clusters:
+        m = len(cluster)
+        if m == 1:
+            continue
+        # Orthonormal basis of the generalized eigenspace, which every M_i
+        #   preserves; on it x_i - p_i is nilpotent, so p_i is the average of
+        #   the eigenvalues of M_i there.
+        lam = np.mean(vals[cluster])
+        N = np.linalg.matrix_power(M - lam * np.eye(D), m)
+        _, _, vh = np.linalg.svd(N)
+        E = vh[-m:].conj().T
+        point = tuple(complex(np.trace(E.conj().T @ Mi @ E) / m) for Mi in mats)
+        solutions.append(Solution(point, m))
+
+    return solutions
+
+
+def _cluster(vals, tol):
+    # Group (indices of) eigenvalues chained together by gaps of at most tol.
+    #   A multiple eigenvalue splits into a small ring of nearby values, so
+    #   single linkage keeps it together better than distance to one center.
+    unassigned = set(range(len(vals)))
+    clusters = []
+    while unassigned:
+        cluster = [unassigned.pop()]
+        frontier = list(cluster)
+        while frontier:
+            i = frontier.pop()
+            close = [j for j in unassigned if abs(vals[j] - vals[i]) <= tol]
+            for j in close:
+                unassigned.remove(j)
+            cluster += close
+            frontier += close
+        clusters.append(sorted(cluster))
+    return clusters
@@ -0,0 +1,100 @@
+from groebner.polynomials import Polynomial
+from groebner.rings import _power_from_table
+
+
+class RingMap():
+    """The ring homomorphism from source to target that sends the i-th
+        variable of source to images[i] (a polynomial of target, or anything
+        target can coerce, like a number). source and target may have
+        different numbers of variables.
+
+        Each power of an image is computed once, from the largest powers
+        already known, and kept: all terms of a polynomial and all
+        polynomials mapped with the same RingMap share them."""
+    def __init__(self, source, target, images):
+        if type(images) is not list or len(images) != source.num_vars:
+            raise ValueError(f'Need a list of {source.num_vars} images, one per '
+                             'variable.')
+        images = [target.coerce(g) for g in images]
+        if any(g not in target for g in images):
+            raise TypeError('Images must all come from the target ring.')
+        self.source = source
+        self.target = target
+        self.images = images
+        self._one = {target.ordering.constant_monomial(): target.field.one()}
+        # _powers[i][e] holds the terms of images[i]**e
+        self._powers = [{1: _nonzero_terms(g)} for g in images]
+
+    def __call__(self, polys):
+        """The image of a polynomial, or the images of a list of them"""
+        if type(polys) is list:
+            return [self._map(f) for f in polys]
+        return self._map(polys)
+
+    def power(self, i, e):
+        """images[i]**e"""
+        return Polynomial._new(dict(self._power(i, e)), self.target)
+
+    def _map(self, f):
+        f = self.source.coerce(f)
+        if f not in self.source:
+            raise TypeError('Polynomial must come from the source ring.')
+        zero = self.target.field.zero()
+        res = {}
+        for mon, c in f.coefs.items():
+            if c == zero:
+                continue
+            term = None
+            for i, e in enumerate(mon.degrees):
+                if e > 0:
+                    term = self._power(i, e) if term is None else \
+                        _mul_terms(term, self._power(i, e), zero)
+            if term is None:
+                term = self._one
+            for m, tc in term.items():
+                new = res.get(m, zero) + c * tc
+                if new == zero:
+                    res.pop(m, None)
+                else:
+                    res[m] = new
+        return Polynomial._new(res, self.target)
+
+    def _power(self, i, e):
+        zero = self.target.field.zero()
+        return _power_from_table(self._powers[i], e,
+                                 lambda a, b: _mul_terms(a, b, zero))
+
+    def __repr__(self):
+        return f'RingMap({self.source} -> {self.target}: {self.images})'
+
+
+def substitute(polys, mapping):
+    """Replaces the variables given as keys of mapping (indices, labels or
+        variables) by their values in one polynomial or a list of them, all
+        from the same ring. Powers of the values are shared by the whole
+        list."""
+    single = type(polys) is not list
+    if single:
+        polys = [polys]
+    if len(polys) == 0:
+        return []
+    ring = polys[0].ring
+    images = ring.get_vars()
+    for var, value in mapping.items():
+        images[ring.var_index(var)] = value
+    res = RingMap(ring, ring, images)(polys)
+    return res[0] if single else res
+
+
+def _nonzero_terms(poly):
+    zero = poly.field.zero()
+    return {m: c for m, c in poly.coefs.items() if c != zero}
+
+def _mul_terms(a, b, zero):
+    # product of two polynomials given by their (nonzero) terms
+    res = {}
+    for m1, c1 in a.items():
+        for m2, c2 in b.items():
+            m = m1 * m2
+            res[m] = res.get(m, zero) + c1 * c2
+    return {m: c for m, c in res.items() if c != zero}
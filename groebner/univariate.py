@@ -0,0 +1,601 @@
+from math import gcd
+from groebner.monomials import Monomial
+from groebner.primefields import PrimeField, primes_below
+from groebner.rationals import Rational, RationalField
+
+
+# Below these sizes the classical (quadratic) algorithms win
+KARATSUBA_CUTOFF = 32
+NEWTON_DIVISION_CUTOFF = 64
+HALF_GCD_CUTOFF = 256
+# in pure python half-gcd only overtakes Euclid for quite large degrees
+HALF_GCD_MIN_DEGREE = 2048
+# over QQ, gcds of polynomials this small are done with plain Euclid
+MODULAR_GCD_CUTOFF = 8
+
+
+class UnivariatePolynomial():
+    """Dense polynomial in one variable over QQ or a prime field GF(p).
+
+        coefs[i] is the coefficient of var^i, stored as field elements, with
+        no trailing zeros (the zero polynomial has no coefficients at all).
+        Multiplication uses Karatsuba, long divisions use Newton iteration and
+        gcds use half-gcd (over GF(p)) or a modular algorithm (over QQ)."""
+    __slots__ = ('coefs', 'field', 'var')
+
+    def __init__(self, coefs, field=None, var='x'):
+        if field is None:
+            field = RationalField()
+        if not isinstance(field, (RationalField, PrimeField)):
+            raise NotImplementedError('Univariate polynomials are only '
+                                      'implemented over QQ and GF(p).')
+        self.field = field
+        self.var = str(var)
+        self.coefs = _strip([field.coerce(c) for c in coefs])
+
+    def _new(self, coefs):
+        # coefs come from the kernels: field elements or plain ints
+        poly = object.__new__(UnivariatePolynomial)
+        poly.field = self.field
+        poly.var = self.var
+        elt = self.field.element_type
+        poly.coefs = _strip([c if type(c) is elt else self.field.coerce(c)
+                             for c in coefs])
+        return poly
+
+    @property
+    def _p(self):
+        # the characteristic for prime fields, None over QQ
+        return self.field.p if isinstance(self.field, PrimeField) else None
+
+    def _ints(self):
+        # representatives of GF(p) coefficients, for the modular kernels
+        return [c.value for c in self.coefs]
+
+    ###############
+    # Conversions #
+    ###############
+
+    @classmethod
+    def from_polynomial(cls, poly, var=None):
+        """Converts a Polynomial involving (at most) one variable. var is the
+            index or label of that variable and may be omitted in rings with
+            a single indeterminate."""
+        ring = poly.ring
+        idx = _var_index(ring, var)
+        coefs = {}
+        for mon, c in poly.coefs.items():
+            if any(d != 0 for i, d in enumerate(mon.degrees) if i != idx):
+                raise ValueError(f'{poly} involves more than the variable '
+                                 f'{ring.ordering.var_labels[idx]}.')
+            coefs[mon.degrees[idx]] = c
+        size = max(coefs) + 1
+        lst = [ring.field.zero()]*size
+        for d, c in coefs.items():
+            lst[d] = c
+        return cls(lst, ring.field, ring.ordering.var_labels[idx])
+
+    def to_polynomial(self, ring=None, var=None):
+        """Converts back to a Polynomial in ring (by default a new ring with
+            this polynomial's variable) as a polynomial in the given var."""
+        from groebner.polynomials import Polynomial, PolynomialRing
+        if ring is None:
+            ring = PolynomialRing(labels=[self.var], base_field=self.field)
+        if ring.field != self.field:
+            raise ValueError('Ring must have the same base field.')
+        idx = _var_index(ring, self.var if var is None and self.var in
+                         ring.ordering.var_labels else var)
+        n = ring.num_vars
+        coefs = {}
+        for d, c in enumerate(self.coefs):
+            if c != 0:
+                degs = tuple(d if i == idx else 0 for i in range(n))
+                coefs[Monomial._from_tuple(degs, ring.ordering, d)] = c
+        return Polynomial(coefs, ring)
+
+    ###########
+    # Queries #
+    ###########
+
+    def degree(self):
+        # -1 for the zero polynomial
+        return len(self.coefs) - 1
+
+    def LC(self):
+        return self.coefs[-1] if self.coefs else self.field.zero()
+
+    def is_zero(self):
+        return len(self.coefs) == 0
+
+    def monic(self):
+        if self.is_zero():
+            return self
+        inv = self.LC().mul_inv()
+        return self._new([c * inv for c in self.coefs])
+
+    def derivative(self):
+        return self._new([c * i for i, c in enumerate(self.coefs)][1:])
+
+    def __call__(self, x):
+        # Horner's rule; x can be anything that mixes with the coefficients
+        ret = self.field.zero()
+        for c in reversed(self.coefs):
+            ret = ret * x + c
+        return ret
+
+    ##############
+    # Arithmetic #
+    ##############
+
+    def _coerce(self, other):
+        if type(other) is UnivariatePolynomial:
+            if other.field != self.field:
+                raise ValueError('Polynomials must have the same base field.')
+            return other
+        return self._new([self.field.coerce(other)])
+
+    def __add__(self, other):
+        o = self._coerce(other)
+        return self._new(_add(self.coefs, o.coefs))
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __neg__(self):
+        return self._new([-c for c in self.coefs])
+
+    def __sub__(self, other):
+        o = self._coerce(other)
+        return self._new(_sub(self.coefs, o.coefs))
+
+    def __rsub__(self, other):
+        return self.__neg__().__add__(other)
+
+    def __mul__(self, other):
+        o = self._coerce(other)
+        p = self._p
+        if p is None:
+            return self._new(_mul(self.coefs, o.coefs))
+        return self._new(_mul_mod(self._ints(), o._ints(), p))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __pow__(self, power):
+        power = int(power)
+        if power < 0:
+            raise ValueError('Power of polynomial must be nonnegative.')
+        ret = self._new([self.field.one()])
+        base = self
+        while power > 0:
+            if power & 1:
+                ret = ret * base
+            power >>= 1
+            if power > 0:
+                base = base * base
+        return ret
+
+    def __divmod__(self, other):
+        o = self._coerce(other)
+        if o.is_zero():
+            raise ZeroDivisionError
+        p = self._p
+        if p is None:
+            q, r = _divmod(self.coefs, o.coefs, None)
+        else:
+            q, r = _divmod(self._ints(), o._ints(), p)
+        return self._new(q), self._new(r)
+
+    def __floordiv__(self, other):
+        return self.__divmod__(other)[0]
+
+    def __mod__(self, other):
+        return self.__divmod__(other)[1]
+
+    def __eq__(self, other):
+        try:
+            o = self._coerce(other)
+        except (ValueError, ZeroDivisionError):
+            return False
+        return self.coefs == o.coefs
+
+    def __hash__(self):
+        return hash(tuple(self.coefs))
+
+    def __repr__(self):
+        return self.to_polynomial().__repr__()
+
+    ########
+    # GCDs #
+    ########
+
+    def gcd(self, other, method='auto'):
+        """Monic greatest common divisor. Over GF(p) the methods are
+            'halfgcd' and 'euclid'; over QQ they are 'modular', 'subresultant'
+            and 'euclid'. 'auto' picks by degree (half-gcd for large degrees
+            over GF(p), modular over QQ)."""
+        o = self._coerce(other)
+        p = self._p
+        if self.is_zero() and o.is_zero():
+            return self
+        if p is not None:
+            if method not in ['auto', 'halfgcd', 'euclid']:
+                raise ValueError(f'Unknown gcd method {method} over {self.field}.')
+            cutoff = {'auto': HALF_GCD_MIN_DEGREE, 'halfgcd': HALF_GCD_CUTOFF,
+                      'euclid': None}[method]
+            return self._new(_gcd_mod_p(self._ints(), o._ints(), p, cutoff))
+
+        if method == 'auto':
+            small = min(self.degree(), o.degree()) < MODULAR_GCD_CUTOFF
+            method = 'euclid' if small else 'modular'
+        if method == 'euclid':
+            a, b = self.coefs, o.coefs
+            while b:
+                a, b = b, _divmod(a, b, None)[1]
+            return self._new(a).monic()
+        if self.is_zero() or o.is_zero():
+            return (o if self.is_zero() else self).monic()
+        a, b = _primitive_int(self.coefs), _primitive_int(o.coefs)
+        if method == 'subresultant':
+            g = _subresultant_gcd(a, b)
+        elif method == 'modular':
+            g = _modular_gcd(a, b)
+        else:
+            raise ValueError(f'Unknown gcd method {method} over {self.field}.')
+        return self._new([Rational(c, g[-1]) for c in g])
+
+    def squarefree_decomposition(self):
+        """Returns a list of (factor, multiplicity) pairs with distinct
+            multiplicities and monic, squarefree, pairwise coprime factors so
+            that self is LC() times the product of factor**multiplicity."""
+        if self.degree() < 1:
+            return []
+        f = self.monic()
+        if self._p is None:
+            factors = _yun(f)
+        else:
+            factors = _sqf_mod_p(f, self._p)
+        # merge factors with equal multiplicities
+        merged = {}
+        for g, m in factors:
+            merged[m] = merged[m] * g if m in merged else g
+        return [(g, m) for m, g in sorted(merged.items())]
+
+
+def _var_index(ring, var):
+    labels = ring.ordering.var_labels
+    if var is None:
+        if ring.num_vars != 1:
+            raise ValueError('Specify which variable to use in a ring with '
+                             'more than one indeterminate.')
+        return 0
+    if type(var) is int:
+        if not 0 <= var < ring.num_vars:
+            raise ValueError(f'No variable with index {var}.')
+        return var
+    if str(var) not in labels:
+        raise ValueError(f'No variable labelled {var}.')
+    return labels.index(str(var))
+
+
+##########################################
+# Kernels on plain lists of coefficients #
+##########################################
+
+def _strip(a):
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def _add(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    res = list(a)
+    for i, c in enumerate(b):
+        res[i] = res[i] + c
+    return res
+
+
+def _sub(a, b):
+    res = list(a) + [0]*(len(b) - len(a))
+    for i, c in enumerate(b):
+        res[i] = res[i] - c
+    return res
+
+
+def _mul(a, b):
+    """Product of coefficient lists (Karatsuba above KARATSUBA_CUTOFF)"""
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return []
+    if n < m:
+        a, b, n, m = b, a, m, n
+    if m <= KARATSUBA_CUTOFF:
+        res = [0]*(n + m - 1)
+        for i, x in enumerate(a):
+            if x == 0:
+                continue
+            for j, y in enumerate(b):
+                res[i + j] = res[i + j] + x*y
+        return res
+
+    h = n // 2
+    res = [0]*(n + m - 1)
+    a0, a1 = a[:h], a[h:]
+    if m <= h:
+        # very unbalanced: only split the longer factor
+        for shift, part in [(0, _mul(a0, b)), (h, _mul(a1, b))]:
+            for i, c in enumerate(part):
+                res[i + shift] = res[i + shift] + c
+        return res
+
+    b0, b1 = b[:h], b[h:]
+    z0 = _mul(a0, b0)
+    z2 = _mul(a1, b1)
+    z1 = _sub(_sub(_mul(_add(a0, a1), _add(b0, b1)), z0), z2)
+    for shift, part in [(0, z0), (h, z1), (2*h, z2)]:
+        for i, c in enumerate(part):
+            if i + shift < len(res):
+                res[i + shift] = res[i + shift] + c
+    return res
+
+
+def _mul_mod(a, b, p):
+    return _strip([c % p for c in _mul(a, b)])
+
+
+def _inv(c, p):
+    return pow(c, p - 2, p) if p is not None else c.mul_inv()
+
+
+def _reduce(a, p):
+    return _strip([c % p for c in a]) if p is not None else _strip(a)
+
+
+def _divmod(a, b, p):
+    """Quotient and remainder of coefficient lists, over QQ (p is None) or
+        modulo p"""
+    n, m = len(a) - 1, len(b) - 1
+    if n < m:
+        return [], list(a)
+    if m >= NEWTON_DIVISION_CUTOFF and n - m >= NEWTON_DIVISION_CUTOFF:
+        return _divmod_newton(a, b, p)
+
+    inv = _inv(b[-1], p)
+    r = list(a)
+    q = [0]*(n - m + 1)
+    for k in range(n - m, -1, -1):
+        c = r[k + m] * inv
+        if p is not None:
+            c %= p
+        q[k] = c
+        if c == 0:
+            continue
+        for j in range(m + 1):
+            r[j + k] = r[j + k] - c*b[j]
+        if p is not None:
+            for j in range(m + 1):
+                r[j + k] %= p
+    return _reduce(q, p), _reduce(r[:m], p)
+
+
+def _inverse_series(f, n, p):
+    # g with f*g = 1 mod x^n by Newton iteration (f[0] must be invertible)
+    g = [_inv(f[0], p)]
+    k = 1
+    while k < n:
+        k = min(2*k, n)
+        fg = _mul(f[:k], g)[:k]
+        e = [-c for c in fg]
+        e[0] = e[0] + 2
+        g = _reduce(_mul(g, e)[:k], p) or [0]
+    return g
+
+
+def _divmod_newton(a, b, p):
+    # reversed polynomials turn division into multiplication by an inverse
+    #   power series
+    n, m = len(a) - 1, len(b) - 1
+    k = n - m + 1
+    inv = _inverse_series(b[::-1], k, p)
+    q = _reduce(_mul(a[::-1][:k], inv)[:k], p)
+    q = (q + [0]*(k - len(q)))[::-1]
+    r = _reduce(_sub(a, _mul(q, b))[:m], p)
+    return _strip(q), r
+
+
+def _gcd_mod_p(a, b, p, cutoff=HALF_GCD_MIN_DEGREE):
+    """Monic gcd of integer coefficient lists modulo p, using half-gcd steps
+        while the degrees are above cutoff (None for pure Euclid)"""
+    a, b = _reduce(list(a), p), _reduce(list(b), p)
+    if len(a) < len(b):
+        a, b = b, a
+    while b:
+        if cutoff is not None and len(a) > len(b) > cutoff:
+            (r00, r01), (r10, r11) = _half_gcd(a, b, p)
+            a, b = (_reduce(_add(_mul(r00, a), _mul(r01, b)), p),
+                    _reduce(_add(_mul(r10, a), _mul(r11, b)), p))
+            if len(a) < len(b):
+                a, b = b, a
+            if not b:
+                break
+        a, b = b, _divmod(a, b, p)[1]
+    if not a:
+        return []
+    inv = _inv(a[-1], p)
+    return [c * inv % p for c in a]
+
+
+def _half_gcd(a, b, p):
+    """2x2 matrix of polynomials mapping (a, b) (with deg a > deg b) to the
+        pair of consecutive Euclidean remainders straddling deg(a)/2"""
+    ident = [[[1], []], [[], [1]]]
+    n = len(a) - 1
+    m = (n + 1) // 2
+    if len(b) - 1 < m:
+        return ident
+    if n < HALF_GCD_CUTOFF:
+        return _half_gcd_euclid(a, b, p)
+
+    R = _half_gcd(a[m:], b[m:], p)
+    a1 = _reduce(_add(_mul(R[0][0], a), _mul(R[0][1], b)), p)
+    b1 = _reduce(_add(_mul(R[1][0], a), _mul(R[1][1], b)), p)
+    if len(b1) - 1 < m:
+        return R
+
+    q, r = _divmod(a1, b1, p)
+    neg_q = _reduce([-c for c in q], p)
+    # one Euclidean step: (a1, b1) -> (b1, a1 - q b1)
+    R = [R[1], [_reduce(_add(R[0][0], _mul(neg_q, R[1][0])), p),
+                _reduce(_add(R[0][1], _mul(neg_q, R[1][1])), p)]]
+    a2, b2 = b1, r
+    k = max(2*m - (len(a2) - 1), 0)
+    if len(a2) - 1 - k >= n:
+        # no progress possible; let the caller carry on with plain Euclid
+        return R
+    S = _half_gcd(a2[k:], b2[k:], p)
+    return _mat_mul(S, R, p)
+
+
+def _half_gcd_euclid(a, b, p):
+    # the same matrix as _half_gcd, found with plain Euclidean steps
+    m = (len(a)) // 2
+    R = [[[1], []], [[], [1]]]
+    while len(b) - 1 >= m:
+        q, r = _divmod(a, b, p)
+        neg_q = _reduce([-c for c in q], p)
+        R = [R[1], [_reduce(_add(R[0][0], _mul(neg_q, R[1][0])), p),
+                    _reduce(_add(R[0][1], _mul(neg_q, R[1][1])), p)]]
+        a, b = b, r
+    return R
+
+
+def _mat_mul(S, R, p):
+    return [[_reduce(_add(_mul(S[i][0], R[0][j]), _mul(S[i][1], R[1][j])), p)
+             for j in range(2)] for i in range(2)]
+
+
+def _primitive_int(coefs):
+    # clear denominators and divide out the content of rational coefficients
+    den = 1
+    for c in coefs:
+        den = den * c.den // gcd(den, c.den)
+    ints = [c.num * (den // c.den) for c in coefs]
+    return _primitive(ints)
+
+
+def _primitive(ints):
+    content = 0
+    for c in ints:
+        content = gcd(content, c)
+    if ints and ints[-1] < 0:
+        content = -content
+    return [c // content for c in ints]
+
+
+def _prem(a, b):
+    """Pseudo-remainder of integer lists: lc(b)^(deg a - deg b + 1) * a mod b"""
+    r = list(a)
+    db = len(b) - 1
+    lb = b[-1]
+    steps = len(a) - len(b) + 1
+    if steps <= 0:
+        return r
+    for k in range(len(a) - 1 - db, -1, -1):
+        lr = r[k + db]
+        r = [c*lb for c in r]
+        for j in range(db + 1):
+            r[j + k] -= lr*b[j]
+    return _strip(r[:db])
+
+
+def _subresultant_gcd(a, b):
+    """Primitive gcd of primitive integer lists via the subresultant PRS"""
+    if len(a) < len(b):
+        a, b = b, a
+    g, h = 1, 1
+    while True:
+        delta = len(a) - len(b)
+        r = _prem(a, b)
+        if not r:
+            return _primitive(b)
+        if len(r) == 1:
+            return [1]
+        a, b = b, [c // (g * h**delta) for c in r]
+        g = a[-1]
+        if delta > 0:
+            h = g**delta // h**(delta - 1)
+
+
+def _modular_gcd(a, b):
+    """Primitive gcd of primitive integer lists by combining gcds modulo
+        many primes with the Chinese remainder theorem"""
+    lc_gcd = gcd(a[-1], b[-1])
+    bound = None
+    H, M = None, 1
+    last = None
+    for p in primes_below(2**31):
+        if a[-1] % p == 0 or b[-1] % p == 0:
+            continue
+        g = _gcd_mod_p([c % p for c in a], [c % p for c in b], p)
+        d = len(g) - 1
+        if d == 0:
+            return [1]
+        if bound is not None and d > bound:
+            # unlucky prime
+            continue
+        g = [c * lc_gcd % p for c in g]
+        if bound is None or d < bound:
+            # every earlier prime was unlucky
+            bound, H, M, last = d, g, p, None
+        else:
+            # combine H mod M with g mod p
+            inv = pow(M, p - 2, p)
+            H = [h + M * ((gp - h) * inv % p) for h, gp in zip(H, g)]
+            M *= p
+        candidate = _primitive([h if h <= M // 2 else h - M for h in H])
+        if candidate == last:
+            if not _prem(a, candidate) and not _prem(b, candidate):
+                return candidate
+        last = candidate
+
+
+def _yun(f):
+    # squarefree decomposition in characteristic zero (f monic)
+    res = []
+    df = f.derivative()
+    a = f.gcd(df)
+    b = f // a
+    c = df // a
+    d = c - b.derivative()
+    i = 1
+    while b.degree() > 0:
+        a = b.gcd(d)
+        b = b // a
+        c = d // a
+        d = c - b.derivative()
+        if a.degree() > 0:
+            res.append((a, i))
+        i += 1
+    return res
+
+
+def _sqf_mod_p(f, p):
+    # squarefree decomposition over GF(p) (f monic): factors whose
+    #   multiplicity is divisible by p come from taking p-th roots
+    res = []
+    c = f.gcd(f.derivative())
+    w = f // c
+    i = 1
+    while w.degree() > 0:
+        y = w.gcd(c)
+        fac = w // y
+        if fac.degree() > 0:
+            res.append((fac, i))
+        w, c, i = y, c // y, i + 1
+    if c.degree() > 0:
+        # c is a polynomial in x^p, and a^p = a in GF(p)
+        root = c._new(c.coefs[::p])
+        res += [(g, m*p) for g, m in _sqf_mod_p(root, p)]
+    return res
@@ -21,5 +21,8 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     packages=setuptools.find_packages(),
-    python_requires=">=3.6",
+    extras_require={
+        "numpy": ["numpy"],
+    },
+    python_requires=">=3.8",
 )
\ No newline at end of file
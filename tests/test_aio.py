@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from groebner.aio import groebner_basis, groebner_bases
+from groebner.algorithms import buchberger_fast, BuchbergerState, ComputationCancelled
+from groebner.polynomials import PolynomialRing
+
+
+class TestAsync:
+    def test_groebner_basis(self):
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        x, y, z = R.get_vars()
+        systems = [[x**2 + y*z - 1, y**2 - x*z + 2], [x*y - z, y*z - x, x*z - y]]
+
+        async def main(pool):
+            return await groebner_bases(systems, executor=pool)
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            res = asyncio.run(main(pool))
+        assert res == [buchberger_fast(gens) for gens in systems]
+        # results come back in the caller's ring
+        assert all(f.ring is R for basis in res for f in basis)
+
+    def test_timeout_and_resume(self):
+        R = PolynomialRing(labels=['x','y','z'], order='lex')
+        x, y, z = R.get_vars()
+        gens = [x**2 + y*z - 1, y**2 - x*z + 2, z**3 - x*y]
+
+        async def main(pool):
+            with pytest.raises(ComputationCancelled) as err:
+                await groebner_basis(gens, timeout=0, executor=pool)
+            assert err.value.reason == 'deadline'
+            return await groebner_basis(err.value.state, executor=pool)
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert asyncio.run(main(pool)) == buchberger_fast(gens)
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            asyncio.run(groebner_basis([]))
+        with pytest.raises(ValueError):
+            asyncio.run(groebner_basis(BuchbergerState([], [])))
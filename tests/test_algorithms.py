@@ -1,5 +1,6 @@
 import pytest
-from groebner.algorithms import buchberger , division_algorithm, is_groebner, buchberger_fast
+from groebner.algorithms import buchberger , division_algorithm, is_groebner, buchberger_fast, LRUMemo, Reducer, BuchbergerStats
+from groebner.algorithms import CancellationToken, ComputationCancelled
 from groebner.polynomials import PolynomialRing
 from groebner.rationals import Rational
 
@@ -175,3 +176,87 @@ class TestAlgorithms:
         [d1, d2, d3], r = division_algorithm(f, [g, h, k])
 
         assert f == g*d1 + h*d2 + k*d3 + r
+
+    def test_lru_memo(self):
+        memo = LRUMemo(max_size=2)
+        memo.put('a', 1)
+        memo.put('b', 2)
+        assert memo.get('a') == 1
+        # 'b' is now the least recently used
+        memo.put('c', 3)
+        assert memo.get('b') is None
+        assert memo.get('c') == 3 and len(memo) == 2
+        assert memo.stats()['hits'] == 2 and memo.hit_rate() == 2/3
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_reducer_memo(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        divs = [x**2 + y*z - 1, y**2 - x*z + 2]
+        polys = [R.random(num_terms=8, max_deg=5, denominator_bound=5) for _ in range(5)]
+
+        reducer = Reducer(divs)
+        first = reducer.normal_forms(polys)
+        assert reducer.normal_forms(polys) == first
+        assert reducer.memo_stats()['normal_forms']['hits'] == len(polys)
+        for f, r in zip(polys, first):
+            assert r == division_algorithm(f, divs)[1]
+
+        # adding a divisor forgets the old remainders
+        reducer.append(z**2 - x - y)
+        for f, r in zip(polys, reducer.normal_forms(polys)):
+            assert r == division_algorithm(f, divs + [z**2 - x - y])[1]
+        assert Reducer(divs, memo_size=0).memo_stats() is None
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_buchberger_stats(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        gens = [x**2 + y*z - 1, y**2 - x*z + 2, x*y + Rational(1, 3)*z**2, z**3 - x]
+
+        events = []
+        stats = BuchbergerStats(
+            on_pair=lambda s, i, j, outcome: events.append(outcome),
+            on_new_element=lambda s, f: events.append('new')
+        )
+        assert buchberger_fast(gens, stats=stats) == buchberger_fast(gens)
+
+        # every pair queued was handled one way or another
+        assert stats.pairs_created == stats.pairs_handled
+        assert stats.pairs_product == events.count('product')
+        assert stats.pairs_chain == events.count('chain')
+        assert stats.zero_reductions == events.count('zero')
+        assert stats.nonzero_reductions == events.count('nonzero') > 0
+        assert stats.basis_sizes[0] == (0, len(gens))
+        assert len(stats.basis_sizes) == events.count('new') + 1
+        assert stats.final_size == len(buchberger_fast(gens))
+        assert stats.max_terms > 0 and stats.max_coef_bits > 2
+        assert all(t >= 0 for t in stats.times.values())
+
+        # the product criterion fires for coprime leading monomials
+        stats.reset()
+        buchberger_fast([x**2 + z, y**3 + z], stats=stats)
+        assert stats.pairs_product == 1 and stats.zero_reductions == 0
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_cancellation(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        gens = [x**2 + y*z - 1, y**2 - x*z + 2, x*y + Rational(1, 3)*z**2, z**3 - x]
+        expected = buchberger_fast(gens)
+
+        # a deadline that has already passed stops before the first pair
+        with pytest.raises(ComputationCancelled) as err:
+            buchberger_fast(gens, token=CancellationToken(timeout=0))
+        assert err.value.reason == 'deadline'
+        assert err.value.state.basis == gens and len(err.value.state.pairs) == 6
+
+        # cancel as soon as the basis grows, then carry on from there
+        token = CancellationToken()
+        stats = BuchbergerStats(on_new_element=lambda s, f: token.cancel())
+        with pytest.raises(ComputationCancelled) as err:
+            buchberger_fast(gens, stats=stats, token=token)
+        assert err.value.reason == 'cancelled' and token.cancelled
+        state = err.value.state
+        assert len(state.basis) == len(gens) + 1
+        assert buchberger_fast(state) == expected
@@ -0,0 +1,32 @@
+import json
+from groebner.algorithms import buchberger_fast
+from groebner.batch import run_batch
+from groebner.polynomials import PolynomialRing
+
+
+class TestBatch:
+    def systems(self):
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        x, y, z = R.get_vars()
+        for k in range(1, 7):
+            yield [x**2 + k*y*z - 1, y**2 - x*z + k, x*y - z**k]
+
+    def test_run_batch(self, tmp_path):
+        path = tmp_path / 'results.jsonl'
+        systems = list(self.systems())
+        results = sorted(run_batch(self.systems(), processes=2, window=3, output=path))
+        assert [r.index for r in results] == list(range(len(systems)))
+        for res, gens in zip(results, systems):
+            assert res.status == 'done' and res.error is None
+            assert res.basis == buchberger_fast(gens)
+
+        # one line per result, written as they came in
+        R = systems[0][0].ring
+        lines = [json.loads(line) for line in open(path)]
+        assert sorted(line['index'] for line in lines) == list(range(len(systems)))
+        for line in lines:
+            assert [R.parse(f) for f in line['basis']] == results[line['index']].basis
+
+    def test_timeout(self):
+        res = list(run_batch(self.systems(), processes=1, timeout=0))
+        assert len(res) == 6 and all(r.status == 'timeout' and r.basis is None for r in res)
@@ -0,0 +1,99 @@
+import os
+import pytest
+from groebner.cache import GroebnerCache, set_default_cache, get_default_cache
+from groebner.ideals import GroebnerIdeal
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+
+
+class TestCache:
+    def test_hit_after_miss(self, tmp_path):
+        cache = GroebnerCache(tmp_path)
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        x, y, z = R.get_vars()
+        gens = [x**2 + y*z - 1, y**2 - x*z + 2, z**2 - x - y]
+
+        I = GroebnerIdeal(gens, cache=cache)
+        assert cache.stats()['misses'] == 1
+        # same ideal up to scaling, order and repeats of the generators
+        J = GroebnerIdeal([3*g for g in reversed(gens)] + [gens[0]], cache=cache)
+        assert cache.stats()['hits'] == 1
+        assert J.basis == I.basis
+        assert J.basis == GroebnerIdeal(gens, cache=False).basis
+
+    def test_key_depends_on_ring(self, tmp_path):
+        cache = GroebnerCache(tmp_path)
+        keys = set()
+        for order in ['lex', 'grevlex']:
+            for field in [None, PrimeField(7)]:
+                kwargs = {} if field is None else {'base_field': field}
+                R = PolynomialRing(labels=['x','y'], order=order, **kwargs)
+                x, y = R.get_vars()
+                keys.add(cache.key([x**2 - y, x*y - 1]))
+        assert len(keys) == 4
+
+    def test_prime_field_round_trip(self, tmp_path):
+        cache = GroebnerCache(tmp_path)
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(101))
+        x, y = R.get_vars()
+        I = GroebnerIdeal([x**2 - 3*y, x*y - 5], cache=cache)
+        J = GroebnerIdeal([x**2 - 3*y, x*y - 5], cache=cache)
+        assert cache.hits == 1 and J.basis == I.basis
+
+    def test_eviction(self, tmp_path):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+        cache = GroebnerCache(tmp_path)
+        GroebnerIdeal([x**2 - y], cache=cache)
+        entry_size = cache.size()
+
+        cache = GroebnerCache(tmp_path, max_bytes=3*entry_size)
+        for k in range(2, 8):
+            GroebnerIdeal([x**2 - k*y], cache=cache)
+        assert cache.size() <= 3*entry_size
+        assert 0 < cache.stats()['entries'] <= 3
+        # the most recent entry survived
+        GroebnerIdeal([x**2 - 7*y], cache=cache)
+        assert cache.hits == 1
+
+    def test_corrupt_entry(self, tmp_path):
+        cache = GroebnerCache(tmp_path)
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        gens = [x**2 - y, y**2 - 1]
+        with open(os.path.join(tmp_path, cache.key(gens) + '.gb'), 'wb') as f:
+            f.write(b'garbage')
+
+        I = GroebnerIdeal(gens, cache=cache)
+        assert cache.hits == 0
+        assert I.basis == GroebnerIdeal(gens, cache=False).basis
+
+    def test_truncated_entry(self, tmp_path):
+        cache = GroebnerCache(tmp_path)
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        gens = [x**2 - y, y**2 - 1]
+        basis = GroebnerIdeal(gens, cache=cache).basis
+        key = cache.key(gens)
+        path = os.path.join(tmp_path, key + '.gb')
+        with open(path, 'rb') as f:
+            data = f.read()
+        for end in [5, len(data) // 2, len(data) - 1]:
+            with open(path, 'wb') as f:
+                f.write(data[:end])
+            # dropped and counted as a miss rather than crashing
+            assert cache.get(key, R) is None
+            assert not os.path.exists(path)
+        assert GroebnerIdeal(gens, cache=cache).basis == basis
+
+    def test_default_cache(self, tmp_path):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        try:
+            cache = set_default_cache(str(tmp_path))
+            assert get_default_cache() is cache
+            GroebnerIdeal([x**2 - y])
+            GroebnerIdeal([x**2 - y])
+            assert cache.hits == 1
+        finally:
+            set_default_cache(None)
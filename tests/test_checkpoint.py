@@ -0,0 +1,64 @@
+import pytest
+from groebner.algorithms import buchberger_fast, BuchbergerState, BuchbergerStats
+from groebner.algorithms import CancellationToken, ComputationCancelled
+from groebner.checkpoint import Checkpointer, resume, dumps_state, loads_state
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+
+
+class TestCheckpoint:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    def system(self, order, **kwargs):
+        R = PolynomialRing(labels=['x','y','z'], order=order, **kwargs)
+        x, y, z = R.get_vars()
+        return [x**2 + y*z - 1, y**2 - x*z + 2, x*y + Rational(1, 3)*z**2, z**3 - x]
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_resume_after_crash(self, order, tmp_path):
+        gens = self.system(order)
+        expected = buchberger_fast(gens)
+        path = tmp_path / 'run.ckpt'
+
+        # simulate a crash right after the second checkpoint
+        checkpoint = Checkpointer(path, every_reductions=2)
+        def crash(stats, i, j, outcome):
+            if checkpoint.saves == 2:
+                raise KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            buchberger_fast(gens, stats=BuchbergerStats(on_pair=crash),
+                            checkpoint=checkpoint)
+        assert checkpoint.exists()
+        state = checkpoint.load(gens[0].ring)
+        assert len(state.pairs) > 0
+
+        assert resume(path, gens[0].ring) == expected
+        # finished runs clean up after themselves
+        assert not checkpoint.exists()
+
+    def test_cancel_writes_checkpoint(self, tmp_path):
+        gens = self.system('grevlex')
+        path = tmp_path / 'run.ckpt'
+        checkpoint = Checkpointer(path, every_seconds=3600, keep=True)
+        with pytest.raises(ComputationCancelled) as err:
+            buchberger_fast(gens, token=CancellationToken(timeout=0),
+                            checkpoint=checkpoint)
+        state = checkpoint.load()
+        assert state.basis == err.value.state.basis and state.pairs == err.value.state.pairs
+        # without a ring the one stored in the checkpoint is rebuilt
+        assert resume(path, checkpoint=None) == buchberger_fast(gens)
+        assert checkpoint.exists()
+
+    def test_round_trip(self):
+        gens = self.system('lex', base_field=PrimeField(101))
+        state = loads_state(dumps_state(BuchbergerState(gens, [(0, 2), (1, 3)])))
+        assert state.basis == gens and state.pairs == [(0, 2), (1, 3)]
+        with pytest.raises(ValueError):
+            loads_state(b'nope')
+        data = dumps_state(BuchbergerState(gens, [(0, 2), (1, 3)]))
+        for end in range(len(data)):
+            with pytest.raises(ValueError):
+                loads_state(data[:end])
+        with pytest.raises(ValueError):
+            Checkpointer('x', every_reductions=0)
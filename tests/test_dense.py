@@ -0,0 +1,76 @@
+import pytest
+from random import randint
+from groebner.polynomials import Polynomial, PolynomialRing
+from groebner.rationals import Rational
+
+np = pytest.importorskip('numpy')
+from groebner import dense
+from groebner.dense import DensePolynomial
+
+
+def random_univariate(R, num_terms, coef_bound):
+    x, = R.get_vars()
+    coefs = {}
+    for i in range(num_terms):
+        mon = (x**i).LM()
+        coefs[mon] = Rational(randint(-coef_bound, coef_bound), randint(1, 5))
+    return Polynomial(coefs, R)
+
+
+class TestDense:
+    def test_roundtrip(self):
+        R = PolynomialRing(labels=['x','y','z'])
+        f = R.random(num_terms=10, max_deg=5)
+        d = f.to_dense()
+
+        assert isinstance(d, DensePolynomial)
+        assert d.to_polynomial() == f
+        assert R.to_dense(R.zero()).to_polynomial() == 0
+
+    def test_arithmetic_matches_sparse(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        f = (x + 2*y - Rational(1, 3))**4
+        g = x**3*y - Rational(5, 7)*y**2 + 1
+
+        fd, gd = f.to_dense(), g.to_dense()
+        assert (fd * gd).to_polynomial() == f * g
+        assert (fd + gd).to_polynomial() == f + g
+        assert (fd - gd).to_polynomial() == f - g
+        assert (fd**3).to_polynomial() == f**3
+        # mixing with sparse polynomials and scalars
+        assert fd * g == f * g
+        assert (2 * fd + 1).to_polynomial() == 2*f + 1
+        assert (fd - f).to_polynomial() == 0
+
+    @pytest.mark.parametrize('coef_bound', [10, 10**30])
+    def test_long_products(self, coef_bound):
+        # long enough to go through Karatsuba (and FFT for small coefficients)
+        R = PolynomialRing(labels=['x'])
+        f = random_univariate(R, 300, coef_bound)
+        g = random_univariate(R, 200, coef_bound)
+
+        assert (f.to_dense() * g.to_dense()).to_polynomial() == f * g
+
+    def test_karatsuba(self):
+        a = np.array([randint(-10**20, 10**20) for _ in range(157)], dtype=object)
+        b = np.array([randint(-10**20, 10**20) for _ in range(90)], dtype=object)
+        assert np.all(dense._karatsuba(a, b) == np.convolve(a, b))
+        assert np.all(dense._karatsuba(a, b[:3]) == np.convolve(a, b[:3]))
+
+    def test_backend_selection(self):
+        S = PolynomialRing(labels=['x','y'])
+        D = PolynomialRing(labels=['x','y'], backend='auto', dense_threshold=0.5)
+        x, y = D.get_vars()
+        f = (x + y + 1)**8
+        g = (x - 2*y + Rational(1, 2))**7
+
+        assert D._use_dense(f, g)
+        assert not D._use_dense(x**20*y**20 + 1, f)
+        assert not S._use_dense(f, g)
+
+        xs, ys = S.get_vars()
+        assert f * g == (xs + ys + 1)**8 * (xs - 2*ys + Rational(1, 2))**7
+
+        with pytest.raises(ValueError):
+            PolynomialRing(labels=['x'], backend='spares')
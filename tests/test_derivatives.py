@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from groebner.evaluation import JacobianEvaluator
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+
+
+class TestDerivatives:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_diff(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        f = Rational(3, 2)*x**4*y - y**3*z**2 + 7*z - 1
+
+        assert f.diff(x) == 6*x**3*y
+        assert f.diff('y') == Rational(3, 2)*x**4 - 3*y**2*z**2
+        assert f.diff(z, 2) == -2*y**3
+        assert f.diff(2, 3) == R.zero()
+        assert f.diff(x, 0) == f
+        assert f.gradient() == [f.diff(x), f.diff(y), f.diff(z)]
+        assert f.diff(x).diff(y) == f.diff(y).diff(x)
+        with pytest.raises(ValueError):
+            f.diff('w')
+
+    def test_prime_field(self):
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(5))
+        x, y = R.get_vars()
+        # the exponent 5 vanishes in characteristic 5
+        assert (x**5*y + x**2).diff(x) == 2*x
+        assert (x**6).diff(x, 2) == 30*x**4
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_jacobian(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        polys = [x**2 + y*z - 1, x*y*z - 2, z**3 - x]
+
+        J = R.jacobian(polys)
+        assert J == [[2*x, z, y], [y*z, x*z, x*y], [-R.one(), R.zero(), 3*z**2]]
+        assert R.jacobian(polys, ['x', 'z']) == [[2*x, y], [y*z, x*y], [-R.one(), 3*z**2]]
+
+        ev = JacobianEvaluator(polys)
+        assert ev(1, 2, 3) == [[2, 3, 2], [6, 3, 2], [-1, 0, 27]]
+        points = np.random.default_rng(1).normal(size=(20, 3))
+        values = ev.at(points)
+        assert values.shape == (20, 3, 3)
+        for M, (a, b, c) in zip(values, points):
+            assert np.allclose(M, [[2*a, c, b], [b*c, a*c, a*b], [-1, 0, 3*c**2]])
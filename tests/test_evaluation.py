@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from groebner.evaluation import Evaluator
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+
+
+class TestEvaluation:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    def naive(self, f, point):
+        # term by term, straight from the definition
+        total = f.field.zero()
+        for mon, c in f.coefs.items():
+            term = c
+            for x, d in zip(point, mon.degrees):
+                term = term * f.field.coerce(x)**d if d > 0 else term
+            total = total + term
+        return total
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_exact(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        f = R.random(num_terms=12, max_deg=6, denominator_bound=20)
+        g = R.random(num_terms=5, max_deg=9, denominator_bound=20)
+        ev = Evaluator([f, g, R.zero(), R.one()])
+        for point in [(0, 0, 0), (1, -2, 3), (Rational(1, 2), Rational(-3, 7), 5)]:
+            assert ev(*point) == [self.naive(f, point), self.naive(g, point),
+                                  R.field.zero(), R.field.one()]
+            assert f(*point) == self.naive(f, point)
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_vectorised(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        f = R.random(num_terms=12, max_deg=6, denominator_bound=20)
+        g = R.random(num_terms=5, max_deg=9, denominator_bound=20)
+        points = np.random.default_rng(0).uniform(-1, 1, size=(50, 3))
+        values = Evaluator([f, g, R.one()]).at(points)
+        assert values.shape == (50, 3)
+        for row, point in zip(values, points):
+            exact = [float(self.naive(h, [Rational(*float(a).as_integer_ratio())
+                                          for a in point])) for h in [f, g]]
+            assert np.allclose(row, exact + [1.0])
+        # complex points work the same way
+        z = points[:, 0] + 1j*points[:, 1]
+        assert np.allclose(f.compile()(z, z, z), [f(a, a, a) for a in z])
+
+    def test_integer_points(self):
+        # over QQ integer arrays are evaluated in floats, not in int64
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        values = (x**50 + y).compile().at(np.array([[3, 1], [-2, 5]]))
+        assert values.dtype.kind == 'f'
+        assert np.allclose(values, [3.0**50 + 1, 2.0**50 + 5])
+
+    def test_prime_field(self):
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(32003))
+        x, y = R.get_vars()
+        f = 12345*x**9*y**2 + 777*x*y**5 - 3
+        xs, ys = np.arange(100), np.arange(100, 200)
+        values = f.compile()(xs, ys)
+        assert values.dtype.kind == 'i'
+        assert [int(v) for v in values] == [f(int(a), int(b)).value for a, b in zip(xs, ys)]
+        # field elements and NumPy integer scalars mix with arrays
+        three = R.field.coerce(3)
+        assert [int(v) for v in f.compile()(xs, three)] == [f(int(a), 3).value for a in xs]
+        assert f(np.int64(3), 2) == f(3, 2)
+        with pytest.raises(TypeError):
+            f(1.5, 2)
+        with pytest.raises(TypeError):
+            f(xs, 1.5)
@@ -1,6 +1,8 @@
+import pytest
 from groebner.ideals import IdealFromGenerators, GroebnerIdeal
 from groebner.polynomials import PolynomialRing
 from groebner.rationals import Rational
+from groebner.algorithms import division_algorithm
 
 class TestIdeals:
     def test_containment(self):
@@ -28,3 +30,125 @@ class TestIdeals:
             assert x in K
 
         assert R.one() not in K
+
+    def test_batched_normal_forms(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+
+        I = GroebnerIdeal([x**2+1, x*y-1])
+        polys = [x*(x+y), x**3 + x, y**2, R.one(), x**2*y + x + y - 1]
+        expected = [division_algorithm(f, I.basis)[1] for f in polys]
+
+        assert I.normal_forms(polys) == expected
+        assert I.contains_many(polys) == [True, True, False, False, False]
+        assert I.batch_stats['count'] == len(polys)
+        assert I.batch_stats['polys_per_second'] > 0
+
+    def test_batched_normal_forms_parallel(self):
+        R = PolynomialRing(labels=['x','y','z'])
+        x, y, z = R.get_vars()
+
+        I = GroebnerIdeal([x**2 - y, y*z - 1])
+        polys = [R.random(num_terms=5, max_deg=4) for _ in range(12)]
+        polys.append((x**2 - y)*(z + 3))
+
+        res = I.normal_forms(polys, processes=2, chunksize=3)
+        assert res == I.normal_forms(polys)
+        assert all(r.ring is R for r in res)
+        assert I.contains_many(polys, processes=2)[-1]
+
+    @pytest.mark.parametrize('order', ['lex', 'grlex', 'grevlex'])
+    def test_intersection(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        I = GroebnerIdeal([x**2*y, y**2])
+        J = IdealFromGenerators([x*y**2, z])
+
+        K = I.intersect(J)
+        assert sorted(K.basis) == sorted([x*y**2, y**2*z, x**2*y*z])
+        assert K.ring == R
+        assert I.intersect(GroebnerIdeal([R.one()])).basis == I.basis
+
+    def test_tag_labels(self):
+        # the ring may already use the names given to tag variables
+        R = PolynomialRing(labels=['_t0','_t1','x'])
+        t0, t1, x = R.get_vars()
+        I = GroebnerIdeal([t0*x, t1**2])
+        J = GroebnerIdeal([t0**2, x])
+        K = I.intersect(J)
+        assert K.ring == R
+        assert sorted(K.basis) == sorted(GroebnerIdeal([t0*x, t0**2*t1**2, t1**2*x]).basis)
+        assert sorted(I.saturate(t0).basis) == sorted([x, t1**2])
+
+    @pytest.mark.parametrize('order', ['lex', 'grlex', 'grevlex'])
+    def test_quotient_and_saturation(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+
+        assert sorted(GroebnerIdeal([x*y, x*z]).quotient(x).basis) == sorted([y, z])
+        I = GroebnerIdeal([x**2*y, x*y**2])
+        assert I.quotient(IdealFromGenerators([x, y])).basis == [x*y]
+
+        I = GroebnerIdeal([x**3*y, x*z])
+        assert sorted(I.saturate(x).basis) == sorted([y, z])
+        assert sorted(I.saturate(IdealFromGenerators([y, z])).basis) == sorted([x**3, x*z])
+
+    @pytest.mark.parametrize('order', ['lex', 'grlex', 'grevlex'])
+    def test_elimination(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        I = GroebnerIdeal([x - y**2, z - y**3])
+
+        E = I.eliminate(y)
+        assert E.basis == [x**3 - z**2]
+        assert I.eliminate('y').basis == E.basis
+        assert I.eliminate([1]).basis == E.basis
+        for g in E.basis:
+            assert g in I
+
+    def test_zero_ideal(self):
+        R = PolynomialRing(labels=['t','x'])
+        t, x = R.get_vars()
+        Z = GroebnerIdeal([x - t**2]).eliminate('t')
+        assert Z.basis == [] and Z.ring == R
+        assert R.zero() in Z and x not in Z
+        assert Z.normal_form(x + 1) == x + 1
+        # and it behaves in the other operations
+        I = GroebnerIdeal([x])
+        assert I.intersect(Z).basis == []
+        assert Z.eliminate('x').basis == []
+        assert I.quotient(Z).basis == [R.one()]
+        with pytest.raises(ValueError):
+            GroebnerIdeal.from_basis([])
+
+    def test_elimination_order(self):
+        R = PolynomialRing(labels=['x','y','z'], order=('elim', (1,), 'grevlex'))
+        x, y, z = R.get_vars()
+
+        # anything involving y beats everything that doesn't
+        assert (y).LM() > (x**5*z**5).LM()
+        assert (x*y).LM() > (y*z).LM()
+        assert R != PolynomialRing(labels=['x','y','z'], order='grevlex')
+
+    def test_block_order_elimination(self):
+        # a basis under a block ordering contains one for the second block
+        R = PolynomialRing(labels=['t','x','y'],
+                           order=('block', [('grevlex', 1), ('grevlex', 2)]))
+        t, x, y = R.get_vars()
+        I = GroebnerIdeal([x - t**2, y - t**3])
+        rest = [g for g in I.basis if g.LM().degrees[0] == 0]
+        assert rest == [x**3 - y**2]
+
+    def test_normal_form_memo(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+        I = GroebnerIdeal([x**2+1, x*y-1])
+
+        assert x*(x+y) in I
+        assert x*(x+y) in I
+        assert I.memo_stats()['normal_forms']['hits'] == 1
+
+        # replacing the basis throws away what was remembered
+        I.basis = GroebnerIdeal([x**2+1]).basis
+        assert x*(x+y) not in I
+        assert GroebnerIdeal([x*y-1], memo_size=0).memo_stats() is None
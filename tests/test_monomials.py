@@ -1,6 +1,8 @@
+import gc
+import pickle
 import pytest
 from random import randint, seed
-from groebner.monomials import MonomialOrdering, Monomial
+from groebner.monomials import MonomialOrdering, Monomial, MonomialInternTable
 
 # Can be enabled for reproducibility
 # seed(12345)
@@ -70,7 +72,7 @@ class TestMonomials:
             m = Monomial([a,b,c,d], o)
 
             assert str(m) == target_string
-            assert m.degrees == [a,b,c,d]
+            assert m.degrees == (a,b,c,d)
     
     def test_grlex_initial(self):
         """grlex ordering is the following:
@@ -109,6 +111,52 @@ class TestMonomials:
             n = Monomial(degs[i+1], o)
             assert m < n
     
+    @pytest.mark.parametrize('order', ['lex', 'grlex', 'grevlex'])
+    def test_sort_key_matches_comparison(self, order):
+        o = MonomialOrdering(num_vars=3, order_type=order)
+        mons = [o.random(deg_bound=3) for _ in range(30)]
+        for m in mons:
+            for n in mons:
+                assert (m < n) == (o.sort_key(m) < o.sort_key(n))
+
+    def test_block_order(self):
+        # grevlex on x, y then lex on z: anything bigger in x, y wins
+        o = MonomialOrdering(num_vars=3, labels=['x', 'y', 'z'],
+                             order_type=('block', [('grevlex', 2), ('lex', 1)]))
+        degs = [[0,0,0], [0,0,5], [0,1,0], [0,1,3], [1,0,0], [0,2,0], [1,1,0]]
+        for i in range(len(degs) - 1):
+            assert Monomial(degs[i], o) < Monomial(degs[i+1], o)
+        assert o.order_type == ('block', (('grevlex', 2), ('lex', 1)))
+
+    def test_weight_order(self):
+        o = MonomialOrdering(num_vars=2, labels=['x', 'y'],
+                             order_type=('weight', [1, 3], 'grevlex'))
+        # weights 2 < 3 = 3 < 4, the tie broken by grevlex
+        assert Monomial([2,0], o) < Monomial([0,1], o)
+        assert Monomial([0,1], o) < Monomial([3,0], o)
+        assert Monomial([3,0], o) < Monomial([1,1], o)
+
+    def test_matrix_order(self):
+        # this matrix is grevlex in three variables
+        rows = [[1,1,1], [0,0,-1], [0,-1,0]]
+        o = MonomialOrdering(num_vars=3, order_type=('matrix', rows))
+        g = MonomialOrdering(num_vars=3, order_type='grevlex')
+        for _ in range(50):
+            a, b = g.random(deg_bound=4), g.random(deg_bound=4)
+            assert (a < b) == (Monomial(a.degrees, o) < Monomial(b.degrees, o))
+
+    def test_invalid_orders(self):
+        with pytest.raises(NotImplementedError):
+            MonomialOrdering(num_vars=2, order_type='revlex')
+        with pytest.raises(ValueError):
+            MonomialOrdering(num_vars=3, order_type=('block', [('lex', 1), ('lex', 1)]))
+        with pytest.raises(ValueError):
+            MonomialOrdering(num_vars=2, order_type=('weight', [1, -1], 'lex'))
+        with pytest.raises(ValueError):
+            MonomialOrdering(num_vars=2, order_type=('matrix', [[1, 1], [2, 2]]))
+        with pytest.raises(ValueError):
+            MonomialOrdering(num_vars=2, order_type=('matrix', [[-1, 0], [0, 1]]))
+
     def test_order(self):
         # Using grlex for this example
         o = MonomialOrdering(num_vars=4, order_type='grlex')
@@ -129,3 +177,93 @@ class TestMonomials:
         p = Monomial([5, 3, 45], o)
 
         assert m*n == p
+
+    def test_compact_layout(self):
+        o = MonomialOrdering(num_vars=3)
+        m = Monomial([1, 2, 3], o)
+
+        # no per-instance dict; everything shared lives on the ordering
+        assert not hasattr(m, '__dict__')
+        assert m.num_vars == 3
+        assert hash(m) == hash(Monomial((1, 2, 3), o))
+
+    def test_interning(self):
+        o = MonomialOrdering(num_vars=3, intern=True)
+        m = Monomial([1, 2, 3], o)
+        n = Monomial([0, 1, 0], o)
+
+        assert Monomial((1, 2, 3), o) is m
+        assert m*n is Monomial([1, 3, 3], o)
+        assert o.get_vars()['x_1'] is o.get_vars()['x_1']
+
+        stats = o.intern_stats()
+        assert stats['policy'] == 'weak'
+        assert stats['hits'] >= 3
+        assert 0 < stats['hit_rate'] < 1
+
+        # weak tables let go of monomials nobody uses
+        del m, n
+        gc.collect()
+        assert o.intern_stats()['size'] == 0
+
+    def test_interning_bounded(self):
+        o = MonomialOrdering(num_vars=2)
+        o.enable_interning(MonomialInternTable('bounded', max_size=4))
+        mons = [Monomial([i, 0], o) for i in range(10)]
+
+        assert o.intern_stats()['size'] == 4
+        # evicted monomials are no longer shared but still compare equal
+        m = Monomial([0, 0], o)
+        assert m is not mons[0] and m == mons[0] and hash(m) == hash(mons[0])
+        assert Monomial([9, 0], o) is mons[9]
+
+        o.disable_interning()
+        assert o.intern_stats() is None
+        assert Monomial([9, 0], o) is not mons[9]
+
+    def test_interning_shared_table(self):
+        table = MonomialInternTable()
+        lex = MonomialOrdering(num_vars=2, order_type='lex', intern=table)
+        grevlex = MonomialOrdering(num_vars=2, order_type='grevlex')
+        with pytest.raises(ValueError):
+            grevlex.enable_interning(table)
+        # the owner can switch it off and on again
+        lex.disable_interning()
+        assert lex.enable_interning(table) is table
+        assert Monomial([1, 0], lex).order is lex
+
+    def test_pickling(self):
+        o = MonomialOrdering(num_vars=3, labels=['x', 'y', 'z'],
+                             order_type='lex', intern='bounded')
+        m = Monomial([4, 0, 1], o)
+        n = pickle.loads(pickle.dumps(m))
+
+        assert n == m and n.order == o and n.order.order_type == 'lex'
+        assert n.order.intern_stats()['policy'] == 'bounded'
+
+    @pytest.mark.parametrize('order', ['grlex', 'grevlex'])
+    def test_rank_unrank(self, order):
+        o = MonomialOrdering(num_vars=3, order_type=order)
+        max_deg = 6
+        mons = []
+        for a in range(max_deg + 1):
+            for b in range(max_deg + 1 - a):
+                for c in range(max_deg + 1 - a - b):
+                    mons.append(Monomial([a, b, c], o))
+        mons.sort()
+
+        assert len(mons) == o.num_monomials(max_deg)
+        for i, m in enumerate(mons):
+            assert o.rank(m) == i
+            assert o.unrank(i) == m
+
+        # exact (no floats) even for big indices
+        m = Monomial([200, 0, 317], o)
+        assert o.unrank(o.rank(m)) == m
+        with pytest.raises(ValueError):
+            o.rank(m, max_degree=max_deg)
+
+    def test_rank_lex(self):
+        o = MonomialOrdering(num_vars=3, order_type='lex')
+        with pytest.raises(NotImplementedError):
+            o.rank(Monomial([1, 0, 0], o))
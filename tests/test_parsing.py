@@ -0,0 +1,86 @@
+import io
+import pytest
+from groebner.parsing import parse_polynomial, parse_polynomials, iter_polynomials, load_polynomials
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+
+
+class TestParsing:
+    def test_terms(self):
+        R = PolynomialRing(labels=['x','y','z'])
+        x, y, z = R.get_vars()
+
+        assert R.parse('3/2*x^2*y - z + 1') == Rational(3, 2)*x**2*y - z + 1
+        assert R.parse('x**2 * y**3 - 2 x z') == x**2*y**3 - 2*x*z
+        assert R.parse('-x - -y + 2^3*z') == -x + y + 8*z
+        # repeated monomials are collected and may cancel
+        assert R.parse('x*y + y*x - 2*x*y') == R.zero()
+
+    def test_singular_short_names(self):
+        R = PolynomialRing(labels=['x','y','z'])
+        x, y, z = R.get_vars()
+        assert R.parse('x2y3 - 2xz + 5') == x**2*y**3 - 2*x*z + 5
+        assert R.parse('xy^2') == x*y**2
+
+    def test_long_labels(self):
+        R = PolynomialRing(labels=['a_1', 'a_2', 'b'])
+        a1, a2, b = R.get_vars()
+        assert parse_polynomial('a_1^2*a_2 - 7/3*b', R) == a1**2*a2 - Rational(7, 3)*b
+
+    def test_repr_round_trip(self):
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        for _ in range(10):
+            f = R.random(num_terms=10, max_deg=6, denominator_bound=20)
+            assert R.parse(repr(f)) == f
+
+    def test_prime_field(self):
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(7))
+        x, y = R.get_vars()
+        assert R.parse('1/2*x + 8*y') == 4*x + y
+        # multiples of p leave no zero terms behind
+        f = R.parse('7*x^2 + y + 1')
+        assert f == y + 1 and f.LM() == y.LM()
+        assert R.parse('7*x') == R.zero()
+
+    def test_systems(self):
+        R = PolynomialRing(labels=['x','y','z'])
+        x, y, z = R.get_vars()
+        expected = [x**2 - y, x*y - z**3, 3*x*y*z]
+
+        assert parse_polynomials('I = ideal(x^2 - y, x*y - z^3, 3 x y z);', R) == expected
+        assert parse_polynomials('{x^2 - y, x*y - z^3, 3 x y z}', R) == expected
+        text = '''// Singular style
+        ideal i = x^2 - y,
+          x*y -
+          z^3,   -- a continued line
+          3 x y z;
+        '''
+        assert list(iter_polynomials(io.StringIO(text), R)) == expected
+
+    def test_file(self, tmp_path):
+        R = PolynomialRing(labels=['x','y'])
+        polys = [R.random(num_terms=5, max_deg=5) for _ in range(20)]
+        path = tmp_path / 'system.txt'
+        # a line starting with a minus sign continues the previous one, so
+        #   polynomials that may have a negative leading term need separators
+        path.write_text(';\n'.join(repr(f) for f in polys))
+        assert load_polynomials(str(path), R) == polys
+        assert load_polynomials(path, R) == polys
+
+    def test_line_breaks(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        assert parse_polynomials('x*y\n -1', R) == [x*y - 1]
+        assert parse_polynomials('x^2\n+ y;', R) == [x**2 + y]
+        assert parse_polynomials('x^2\n* y\ny - 1\n-- comment\nx', R) == [x**2*y, y - 1, x]
+        assert parse_polynomials('x^2 - y,\n-x', R) == [x**2 - y, -x]
+        # -- only starts a comment after whitespace
+        assert R.parse('x--y') == x + y
+
+    @pytest.mark.parametrize('text', ['x+', '(x+y)^2', 'x^y', 'x^-1', 'w', '*x', 'x $ y', '',
+                                      'x * * y', 'x*', 'x*+y', '1/0'])
+    def test_errors(self, text):
+        R = PolynomialRing(labels=['x','y'])
+        with pytest.raises(ValueError):
+            R.parse(text)
@@ -103,4 +103,28 @@ class TestPolynomials:
         assert str(R.one()) == '1'
         assert str(42 * R.one()) == '42'
 
-        assert (str(3*x**2*y-Rational(4, 3)*x*y**2)) == '3x^2y - 4/3xy^2'
\ No newline at end of file
+        assert (str(3*x**2*y-Rational(4, 3)*x*y**2)) == '3x^2y - 4/3xy^2'
+
+    def test_compact_layout(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        f = x**2 - 3*y
+
+        assert not hasattr(f, '__dict__')
+        assert f.field is R.field
+        assert f.order is R.ordering
+
+    @pytest.mark.parametrize('order', ['lex', 'grevlex', ('weight', [2, 1], 'lex')])
+    def test_hash_and_equality(self, order):
+        R = PolynomialRing(labels=['x','y'], order=order)
+        x, y = R.get_vars()
+        f = x**2 - 3*y + Rational(1, 2)
+        g = -3*y + Rational(1, 2) + x**2
+
+        assert f == g and hash(f) == hash(g)
+        assert f != f + x and hash(f) != hash(f + x)
+        assert len({f, g, f - 1, g - 1}) == 2
+        # both have cached hashes and leading monomials now
+        assert f.LM() == g.LM() and f == g
+        assert (f - 1) != g
+        assert R.zero() == 0 and x != PolynomialRing(labels=['x','y'], order='grlex').get_vars()[0]
@@ -0,0 +1,39 @@
+import pytest
+from groebner.primefields import PrimeField, is_prime
+from groebner.polynomials import PolynomialRing
+from groebner.algorithms import buchberger_fast, is_groebner
+from groebner.rationals import Rational
+
+
+class TestPrimeFields:
+    def test_primality(self):
+        primes = [p for p in range(100) if is_prime(p)]
+        assert primes[:10] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        assert len(primes) == 25
+        assert is_prime(2**31 - 1) and not is_prime(2**31 + 1)
+        with pytest.raises(ValueError):
+            PrimeField(91)
+
+    def test_arithmetic(self):
+        F = PrimeField(13)
+        a, b = F.coerce(5), F.coerce(11)
+
+        assert a + b == 3
+        assert a - b == 7
+        assert a * b == 3
+        assert a / b * b == a
+        assert a * a.mul_inv() == F.one()
+        assert a**12 == 1
+        assert F.coerce(Rational(1, 2)) * 2 == 1
+        with pytest.raises(ZeroDivisionError):
+            F.zero().mul_inv()
+
+    def test_polynomials(self):
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(7), order='grevlex')
+        x, y = R.get_vars()
+
+        assert (x + 1)**7 == x**7 + 1
+        assert str(Rational(1, 2)*x - 3) == '4x + 4'
+
+        basis = buchberger_fast([x**3 - 2*x*y, x**2*y - 2*y**2 + x])
+        assert is_groebner(basis)
@@ -0,0 +1,78 @@
+import pytest
+from groebner.ideals import GroebnerIdeal
+from groebner.polynomials import PolynomialRing
+from groebner.quotients import QuotientRing
+from groebner.rationals import Rational
+
+
+class TestQuotients:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_standard_monomials(self, order):
+        R = PolynomialRing(labels=['x','y'], order=order)
+        x, y = R.get_vars()
+        Q = QuotientRing(GroebnerIdeal([x**2 - 2, y**3 - x*y + 1]))
+
+        assert Q.dimension == 6
+        assert Q.basis[0].total_degree == 0
+        assert Q.one().to_polynomial() == 1
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_arithmetic_matches_division(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        I = GroebnerIdeal([x**2 + y*z - 1, y**2 - x*z + 2, z**2 - x - y])
+        Q = QuotientRing(I)
+
+        for _ in range(3):
+            f = R.random(num_terms=5, max_deg=4, denominator_bound=5)
+            g = R.random(num_terms=5, max_deg=4, denominator_bound=5)
+            a, b = Q.coerce(f), Q.coerce(g)
+
+            assert a.to_polynomial() == I.normal_form(f)
+            assert (a * b).to_polynomial() == I.normal_form(f * g)
+            assert (a - b + 3).to_polynomial() == I.normal_form(f - g + 3)
+            assert (a**3).to_polynomial() == I.normal_form(f**3)
+
+    def test_multiplication_matrices(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+        Q = QuotientRing(GroebnerIdeal([x**2 - 2, y**2 - 3]))
+        X, Y = Q.gens()
+
+        # multiplication matrices act on coefficient vectors
+        M = Q.multiplication_matrix(0)
+        for b in [Q.one(), Y, X*Y]:
+            w = [sum([M[r][j] * b.vector[j] for j in range(Q.dimension)], Rational(0, 1))
+                 for r in range(Q.dimension)]
+            assert w == (X * b).vector
+        # and commute
+        assert (X*Y).vector == (Y*X).vector
+
+    def test_evaluation(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        Q = QuotientRing(GroebnerIdeal([x**2 - 2, y**2 - 3]))
+        X, Y = Q.gens()
+
+        f = x**3*y - 2*y + 1
+        assert Q.evaluate(f, [X, Y]) == Q.coerce(f)
+        # substituting x -> y, y -> x
+        assert Q.evaluate(f, [Y, X]) == Q.coerce(y**3*x - 2*x + 1)
+        assert (X + Y)**2 == 5 + 2*X*Y
+
+    def test_high_degree(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        Q = QuotientRing(GroebnerIdeal([x**2 - 1, y - 1]))
+        assert Q.coerce(x**3000) == Q.one()
+        assert Q.coerce(x**3001*y**5000) == Q.coerce(x)
+
+    def test_not_zero_dimensional(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        with pytest.raises(ValueError):
+            QuotientRing(GroebnerIdeal([x**2 - y]))
+        with pytest.raises(ValueError):
+            QuotientRing(GroebnerIdeal([x - 1, x + 1]))
@@ -69,3 +69,19 @@ class TestRationals:
     def test_zero_denominator(self):
         with pytest.raises(ZeroDivisionError):
             Rational(rand_num(), 0)
+
+    def test_compact_layout(self):
+        r = Rational(rand_num(), rand_den())
+        assert not hasattr(r, '__dict__')
+        # the field is shared by every instance
+        assert r.field is Rational(1, 2).field
+        assert r.field == QQ
+
+    def test_hash(self):
+        from fractions import Fraction
+        for _ in range(20):
+            a, b = rand_num(), rand_den()
+            assert hash(Rational(a, b)) == hash(Fraction(a, b))
+            assert hash(Rational(2*a, 2*b)) == hash(Rational(a, b))
+        assert hash(Rational(6, 3)) == hash(2)
+        assert len({Rational(1, 2), Rational(2, 4), Rational(-1, 2)}) == 2
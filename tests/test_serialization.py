@@ -0,0 +1,97 @@
+import pickle
+import pytest
+from groebner import serialization
+from groebner.ideals import GroebnerIdeal
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+
+
+class TestSerialization:
+    ORDERINGS = ['lex', 'grevlex', ('block', [('grevlex', 1), ('lex', 2)])]
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_round_trip(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        polys = [R.random(num_terms=10, max_deg=300, denominator_bound=10**40)
+                 for _ in range(5)]
+        polys.append(R.zero())
+
+        data = serialization.dumps(polys)
+        loaded = serialization.loads(data)
+        assert loaded == polys
+        assert loaded[0].ring == R
+        assert serialization.loads(serialization.dumps(polys[0]), R) == polys[0]
+
+    def test_prime_field(self):
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(10007))
+        polys = [R.random(num_terms=8) for _ in range(3)]
+        assert serialization.loads(serialization.dumps(polys)) == polys
+
+    def test_negative_and_big_coefficients(self):
+        R = PolynomialRing(labels=['x'])
+        x, = R.get_vars()
+        f = Rational(-3**100, 7**30)*x**2 - Rational(1, 2)*x + 64
+        assert serialization.loads(serialization.dumps(f)) == f
+
+    def test_wrong_ring(self):
+        R = PolynomialRing(labels=['x','y'])
+        S = PolynomialRing(labels=['x','y'], order='lex')
+        data = serialization.dumps(R.get_vars())
+        with pytest.raises(ValueError):
+            serialization.loads(data, S)
+        with pytest.raises(ValueError):
+            serialization.loads(b'not a polynomial')
+
+    def test_corrupt_rationals(self):
+        R = PolynomialRing(labels=['x','y'])
+        x, y = R.get_vars()
+        data = serialization.dumps(Rational(5, 7)*x)
+        # the coefficient is written as the varints 10 (zigzagged 5) and 7
+        assert data.endswith(b'\x0a\x07')
+        for bad in [b'\x0a\x00', b'\x0a\x0f']:
+            with pytest.raises(ValueError):
+                serialization.loads(data[:-2] + bad)
+
+    def test_malformed(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        data = serialization.dumps([R.random(num_terms=4, max_deg=5) for _ in range(3)])
+        # every truncation is reported as such, not as an IndexError
+        for end in range(len(data)):
+            with pytest.raises(ValueError):
+                serialization.loads(data[:end])
+
+        for header in [b'{"vars":["x"],"order":"lex"}', b'[1, 2]', b'{"vars":["x"],'
+                       b'"order":"lex","field":["GF"]}']:
+            bad = bytearray(serialization.MAGIC)
+            bad += bytes([serialization.VERSION, 0])
+            serialization._write_varint(bad, len(header))
+            bad += header + b'\x00'
+            with pytest.raises(ValueError, match='Invalid header'):
+                serialization.loads(bytes(bad))
+
+    def test_pickle(self):
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex', intern=True)
+        x, y, z = R.get_vars()
+        I = GroebnerIdeal([x**2 + y*z - 1, y**2 - x*z + 2, z**2 - x - y])
+
+        basis = pickle.loads(pickle.dumps(I.basis))
+        assert basis == I.basis
+        # one ring for the whole list
+        assert all(g.ring is basis[0].ring for g in basis)
+        assert basis[0].ring.ordering.intern_stats() is not None
+
+    def test_load_arrays(self, tmp_path):
+        np = pytest.importorskip('numpy')
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        polys = [R.random(num_terms=6, max_deg=1000) for _ in range(4)]
+        path = tmp_path / 'polys.bin'
+        serialization.dump(polys, path)
+
+        packed = serialization.load_arrays(path)
+        assert len(packed) == 4
+        assert packed.exponents.shape == (sum(len(f.coefs) for f in polys), 3)
+        # a view of the mapped file rather than a copy
+        assert not packed.exponents.flags.owndata
+        assert packed.to_polynomials() == polys
+        assert serialization.load(path) == polys
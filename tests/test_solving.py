@@ -0,0 +1,70 @@
+import pytest
+from math import prod
+from groebner.ideals import GroebnerIdeal
+from groebner.polynomials import PolynomialRing
+
+np = pytest.importorskip('numpy')
+from groebner.solving import solve
+
+
+def evaluate(poly, point):
+    return sum(
+        float(c) * prod(p**d for p, d in zip(point, mon.degrees))
+        for mon, c in poly.coefs.items()
+    )
+
+
+def sort_key(sol):
+    return tuple((round(p.real, 6), round(p.imag, 6)) for p in sol.point)
+
+
+class TestSolving:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_simple_roots(self, order):
+        R = PolynomialRing(labels=['x','y'], order=order)
+        x, y = R.get_vars()
+        sols = sorted(solve(GroebnerIdeal([x**2 - 2, y - x]), seed=0), key=sort_key)
+
+        assert len(sols) == 2
+        for sol, r in zip(sols, [-2**0.5, 2**0.5]):
+            assert sol.multiplicity == 1
+            assert sol.point == pytest.approx((r, r))
+
+    def test_multiplicities(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+        I = GroebnerIdeal([(x - 1)**2 * (x + 2), y - x])
+        sols = sorted(I.solve(seed=0), key=sort_key)
+
+        assert [s.multiplicity for s in sols] == [1, 2]
+        assert sols[0].point == pytest.approx((-2, -2))
+        assert sols[1].point == pytest.approx((1, 1))
+
+        sols = solve(GroebnerIdeal([x**2, y - 1]), seed=0)
+        assert len(sols) == 1
+        assert sols[0].multiplicity == 2
+        assert sols[0].point == pytest.approx((0, 1), abs=1e-8)
+
+    def test_residuals(self):
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        x, y, z = R.get_vars()
+        gens = [x**2 + y*z - 1, y**2 - x*z + 2, z**2 - x - y]
+        sols = solve(GroebnerIdeal(gens), seed=1)
+
+        assert sum(s.multiplicity for s in sols) == 8
+        for sol in sols:
+            for g in gens:
+                assert abs(evaluate(g, sol.point)) < 1e-8
+
+    def test_no_solutions(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+        assert solve(GroebnerIdeal([x*y - 1, x])) == []
+
+    def test_positive_dimensional(self):
+        R = PolynomialRing(labels=['x','y'], order='grevlex')
+        x, y = R.get_vars()
+        with pytest.raises(ValueError):
+            solve(GroebnerIdeal([x*y]))
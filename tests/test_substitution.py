@@ -0,0 +1,52 @@
+import pytest
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+from groebner.substitution import RingMap, substitute
+
+
+class TestSubstitution:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_subs(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        x, y, z = R.get_vars()
+        f = x**3*y - Rational(1, 2)*x*z**2 + y**2 + 4
+        g = x + y*z
+
+        assert f.subs({'x': g}) == g**3*y - Rational(1, 2)*g*z**2 + y**2 + 4
+        assert f.subs({x: 2, 2: Rational(1, 3)}) == 8*y - Rational(1, 9) + y**2 + 4
+        assert f.subs({}) == f
+        # a batch shares the powers of g
+        assert substitute([f, f*f, R.zero()], {y: g}) == \
+            [f.subs({y: g}), f.subs({y: g})**2, R.zero()]
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_ring_maps(self, order):
+        R = PolynomialRing(labels=['x','y','z'], order=order)
+        S = PolynomialRing(labels=['s','t'], order=order)
+        x, y, z = R.get_vars()
+        s, t = S.get_vars()
+        f = x**2*y - y*z**3 + 7*x - 1
+
+        # twisted cubic: every (x, y, z) = (s, s^2, s^3)
+        phi = R.hom([s, s**2, s**3])
+        assert phi.target == S
+        assert phi(f) == s**4 - s**11 + 7*s - 1
+        assert phi([x*z - y**2, y - x**2]) == [S.zero(), S.zero()]
+        assert phi.power(2, 4) == s**12
+        assert f.compose([s + t, s - t, S.one()]) == \
+            (s + t)**2*(s - t) - (s - t) + 7*(s + t) - 1
+
+        with pytest.raises(ValueError):
+            R.hom([s, t])
+        with pytest.raises(TypeError):
+            RingMap(S, R, [x, y])(f)
+
+    def test_prime_field(self):
+        R = PolynomialRing(labels=['x','y'], base_field=PrimeField(7))
+        x, y = R.get_vars()
+        # the Frobenius-like map x -> x + y, y -> y in characteristic 7
+        assert (x**7).subs({x: x + y}) == x**7 + y**7
+        assert (x**10).subs({x: x + 1}) == (x + 1)**10
@@ -0,0 +1,64 @@
+import pytest
+from groebner.algorithms import buchberger_fast, reduce, TruncatedBasis, truncated_groebner
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+
+
+class TestTruncated:
+    ORDERINGS = ['lex', 'grlex', 'grevlex']
+
+    def system(self, order, **kwargs):
+        R = PolynomialRing(labels=['x','y','z','w'], order=order, **kwargs)
+        x, y, z, w = R.get_vars()
+        return [x**2 - y*w + z**2, x*y*z - w**3 + Rational(1, 2)*x**2*z, y**2*z - x*w**2]
+
+    @pytest.mark.parametrize('order', ORDERINGS)
+    def test_truncation_matches_full_basis(self, order):
+        gens = self.system(order)
+        full = buchberger_fast(gens)
+        top = max(g.LM().total_degree for g in full)
+        for d in range(1, top + 1):
+            # for homogeneous ideals the truncated reduced basis is the part
+            #   of the full one up to degree d
+            T = truncated_groebner(gens, d)
+            assert T.groebner_basis() == sorted(g for g in full if g.LM().total_degree <= d)
+        assert truncated_groebner(gens, 2*top + 10).complete
+
+    def test_resume(self):
+        gens = self.system('grevlex', base_field=PrimeField(32003))
+        once = truncated_groebner(gens, 6)
+        T = truncated_groebner(gens, 3)
+        done = T.reductions
+        T.extend(6)
+        assert T.groebner_basis() == once.groebner_basis()
+        # nothing up to degree 3 was redone
+        assert T.reductions == once.reductions and done < once.reductions
+
+    def test_membership(self):
+        gens = self.system('grevlex')
+        x, y, z, w = gens[0].ring.get_vars()
+        T = truncated_groebner(gens, 4)
+        assert T.contains(x*gens[1] + w**2*gens[0])
+        assert not T.contains(x**4 + w**4)
+        with pytest.raises(ValueError):
+            T.contains(x**5*gens[0])
+        with pytest.raises(ValueError):
+            TruncatedBasis([x**2 + y])
+
+    def test_homogenize(self):
+        R = PolynomialRing(labels=['x','y','z'], order='grevlex')
+        x, y, z = R.get_vars()
+        gens = [x**2 + y*z - 1, y**2 - x*z + 2*x, x*y - z]
+
+        H = R.homogenize(gens)
+        S = H[0].ring
+        X, Y, Z, h = S.get_vars()
+        assert H[0] == X**2 + Y*Z - h**2 and all(f.is_homogeneous() for f in H)
+        assert R.dehomogenize(H) == gens
+
+        # under grevlex with h smallest, dehomogenizing a basis of the
+        #   homogenized ideal gives a basis of the original one
+        T = TruncatedBasis(H).extend(20)
+        assert T.complete
+        assert reduce(R.dehomogenize(T.groebner_basis())) == buchberger_fast(gens)
@@ -0,0 +1,94 @@
+import pytest
+from random import randint
+from groebner.polynomials import PolynomialRing
+from groebner.primefields import PrimeField
+from groebner.rationals import Rational
+from groebner.univariate import UnivariatePolynomial
+from groebner import univariate
+
+
+F = PrimeField(10007)
+
+def random_mod_p(deg):
+    return UnivariatePolynomial([randint(0, F.p - 1) for _ in range(deg + 1)], F)
+
+def random_rational(deg, bound=20):
+    return UnivariatePolynomial(
+        [Rational(randint(-bound, bound), randint(1, 4)) for _ in range(deg + 1)]
+    )
+
+
+class TestUnivariate:
+    @pytest.mark.parametrize('make', [random_mod_p, random_rational])
+    def test_karatsuba(self, make):
+        a, b = make(150), make(90)
+        expected = a * b
+        old = univariate.KARATSUBA_CUTOFF
+        try:
+            univariate.KARATSUBA_CUTOFF = 10**9
+            assert a * b == expected
+        finally:
+            univariate.KARATSUBA_CUTOFF = old
+
+    @pytest.mark.parametrize('make', [random_mod_p, random_rational])
+    @pytest.mark.parametrize('degs', [(10, 3), (300, 100), (200, 150)])
+    def test_division(self, make, degs):
+        # (300, 100) goes through Newton iteration
+        a, b = make(degs[0]), make(degs[1])
+        q, r = divmod(a, b)
+        assert q * b + r == a
+        assert r.degree() < b.degree()
+
+    @pytest.mark.parametrize('method', ['euclid', 'halfgcd'])
+    def test_gcd_mod_p(self, method):
+        g = random_mod_p(100).monic()
+        a = random_mod_p(300) * g
+        b = random_mod_p(295) * g
+        h = a.gcd(b, method=method)
+
+        assert (h % g).is_zero()
+        assert (a % h).is_zero() and (b % h).is_zero()
+        assert h == a.gcd(b, method='euclid')
+
+    @pytest.mark.parametrize('method', ['euclid', 'subresultant', 'modular'])
+    def test_gcd_rationals(self, method):
+        g = random_rational(8)
+        a = random_rational(15) * g
+        b = random_rational(12) * g
+        h = a.gcd(b, method=method)
+
+        assert h.LC() == 1
+        assert (h % g).is_zero()
+        assert (a % h).is_zero() and (b % h).is_zero()
+
+    def test_squarefree(self):
+        x = UnivariatePolynomial([0, 1])
+        f = 3 * (x - 1)**3 * (x + 2)**2 * (x**2 + 1) * (x - 5)**2
+        assert f.squarefree_decomposition() == [
+            (x**2 + 1, 1), ((x + 2)*(x - 5), 2), (x - 1, 3)
+        ]
+
+        # in characteristic 5 the fifth power has zero derivative
+        x = UnivariatePolynomial([0, 1], PrimeField(5))
+        f = (x - 1)**5 * (x + 2)**2 * (x**2 + 2) * (x + 1)**7
+        dec = f.squarefree_decomposition()
+        assert [m for _, m in dec] == [1, 2, 5, 7]
+        prod = x**0
+        for g, m in dec:
+            prod = prod * g**m
+        assert prod == f
+
+    def test_conversions(self):
+        R = PolynomialRing(labels=['x', 'y'])
+        x, y = R.get_vars()
+        f = 3*y**4 - Rational(1, 2)*y + 7
+
+        u = UnivariatePolynomial.from_polynomial(f, var='y')
+        assert u.degree() == 4 and u.var == 'y'
+        assert u.to_polynomial(R) == f
+        assert u(2) == 54
+
+        with pytest.raises(ValueError):
+            UnivariatePolynomial.from_polynomial(f + x, var='y')
+        with pytest.raises(ValueError):
+            UnivariatePolynomial.from_polynomial(f)